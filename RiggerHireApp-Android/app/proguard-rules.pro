@@ -47,3 +47,11 @@
 # Stripe
 -keep class com.stripe.android.** { *; }
 -dontwarn com.stripe.android.**
+
+# Strip debug logging from release builds
+-assumenosideeffects class android.util.Log {
+    public static boolean isLoggable(java.lang.String, int);
+    public static int v(...);
+    public static int d(...);
+    public static int i(...);
+}
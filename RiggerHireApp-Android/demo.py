@@ -1,212 +1,7 @@
 #!/usr/bin/env python3
-"""
-🏗️ RiggerHire Android App Demo Script
+"""Compatibility wrapper; prefer ``riggerhire demo``"""
 
-This script demonstrates the enterprise-grade Android application
-for Australia's Premier Rigging Jobs Platform.
-
-Features:
-- Dark neon theme with cyan/magenta gradients
-- Jetpack Compose UI with Material Design 3
-- Enterprise-grade architecture and security
-- Mining industry-specific functionality
-- Mobile-optimized for field work
-"""
-
-import os
-import sys
-from datetime import datetime
-
-class RiggerHireDemo:
-    def __init__(self):
-        self.app_name = "RiggerHire Android"
-        self.theme = "Dark Neon with Cyan/Magenta Gradients"
-        self.target_industry = "Mining, Construction & Industrial"
-        
-    def display_header(self):
-        print("=" * 70)
-        print("🏗️  RIGGERHIRE ANDROID - ENTERPRISE MOBILE APPLICATION")
-        print("=" * 70)
-        print(f"📱 App: {self.app_name}")
-        print(f"🎨 Theme: {self.theme}")
-        print(f"🏭 Industry: {self.target_industry}")
-        print(f"📅 Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        print("=" * 70)
-        
-    def display_features(self):
-        print("\n✨ KEY FEATURES:")
-        features = [
-            "🔍 Smart Job Matching - AI-powered algorithm for job recommendations",
-            "📍 GPS-Based Discovery - Location-aware job searching",
-            "💰 Transparent Pricing - Upfront salary and rate information",
-            "📋 Certification Management - Digital certificate verification",
-            "⚡ Instant Notifications - Real-time job alerts",
-            "💳 Fast Payment - Stripe integration for secure transactions",
-            "🔐 JWT Authentication - Enterprise-grade security",
-            "📊 Analytics Dashboard - Firebase integration for insights",
-            "🌙 Dark Neon UI - Optimized for outdoor mining environments"
-        ]
-        
-        for feature in features:
-            print(f"   • {feature}")
-            
-    def display_tech_stack(self):
-        print("\n🛠️  TECHNICAL STACK:")
-        tech_stack = {
-            "Language": "Kotlin 1.9.20",
-            "UI Framework": "Jetpack Compose 1.5.4",
-            "Architecture": "MVVM with Android Architecture Components",
-            "Design System": "Material Design 3 + Custom Dark Neon Theme",
-            "Networking": "Retrofit 2.9.0 with OkHttp",
-            "Authentication": "JWT tokens with encrypted storage",
-            "Database": "Room (SQLite) + SharedPreferences",
-            "Payment": "Stripe SDK integration",
-            "Analytics": "Firebase Analytics & Crashlytics",
-            "CI/CD": "GitHub Actions + Fastlane",
-            "Testing": "JUnit + Espresso + Compose UI Tests"
-        }
-        
-        for category, technology in tech_stack.items():
-            print(f"   • {category}: {technology}")
-            
-    def display_architecture(self):
-        print("\n🏗️  ARCHITECTURE OVERVIEW:")
-        print("""
-┌─────────────────────────────────────────┐
-│                UI Layer                 │
-│  (Jetpack Compose + Material Design 3) │
-└─────────────┬───────────────────────────┘
-              │
-┌─────────────▼───────────────────────────┐
-│             ViewModel                   │
-│        (MVVM Architecture)              │
-└─────────────┬───────────────────────────┘
-              │
-┌─────────────▼───────────────────────────┐
-│           Repository                    │
-│     (Data Abstraction Layer)           │
-└─────────────┬───────────────────────────┘
-              │
-┌─────────────▼───────────────────────────┐
-│          Data Sources                   │
-│  • Remote API (Retrofit)               │
-│  • Local Database (Room)               │
-│  • SharedPreferences                   │
-└─────────────────────────────────────────┘
-        """)
-        
-    def display_project_structure(self):
-        print("\n📁 PROJECT STRUCTURE:")
-        print("""
-RiggerHireApp-Android/
-├── app/
-│   ├── src/main/java/com/tiation/riggerhire/
-│   │   ├── ui/
-│   │   │   ├── MainActivity.kt (Dark Neon Theme)
-│   │   │   ├── auth/ (Login/Register)
-│   │   │   ├── jobs/ (Job Listings & Details)
-│   │   │   └── profile/ (User Profile Management)
-│   │   ├── data/
-│   │   │   ├── api/ (Retrofit API interfaces)
-│   │   │   ├── models/ (Data classes)
-│   │   │   └── repositories/ (Data repositories)
-│   │   └── RiggerHireApplication.kt
-│   ├── res/
-│   │   ├── values/colors.xml (Cyan/Magenta theme)
-│   │   ├── values/strings.xml (Mining terminology)
-│   │   └── values/styles.xml (Dark neon styles)
-│   └── AndroidManifest.xml
-├── fastlane/ (Automated deployment)
-├── .github/workflows/ (CI/CD pipelines)
-└── README.md (Enterprise documentation)
-        """)
-        
-    def display_industry_focus(self):
-        print("\n🏭 MINING INDUSTRY FOCUS:")
-        industry_features = [
-            "🏗️ Rigging & Construction Jobs - Specialized for mining equipment",
-            "⛏️ Pilbara Region Coverage - Western Australia mining focus",
-            "🔧 Equipment Certification - Crane, dogman, rigger certifications",
-            "🚧 Safety Compliance - Mining safety standards integration",
-            "📍 Remote Location Support - GPS for isolated mining sites",
-            "💪 Physical Work Focus - Job matching for physical capabilities",
-            "🌙 Outdoor Optimized UI - Dark theme for bright mining environments",
-            "🚛 Heavy Industry Integration - Equipment and machinery focus"
-        ]
-        
-        for feature in industry_features:
-            print(f"   • {feature}")
-            
-    def display_mobile_optimizations(self):
-        print("\n📱 MOBILE-FIRST OPTIMIZATIONS:")
-        mobile_features = [
-            "🌙 Dark Neon Theme - Reduces eye strain in bright conditions",
-            "🔋 Battery Optimization - Efficient background processing",
-            "📡 Offline Support - Cached job data for remote areas",
-            "🔄 Real-time Sync - Background sync when connectivity returns",
-            "👆 Touch-Friendly UI - Large buttons for work gloves",
-            "📊 Performance Monitoring - Firebase performance tracking",
-            "🔐 Biometric Authentication - Fingerprint/Face unlock",
-            "📳 Smart Notifications - Location-based job alerts"
-        ]
-        
-        for feature in mobile_features:
-            print(f"   • {feature}")
-            
-    def display_security_features(self):
-        print("\n🔐 ENTERPRISE SECURITY:")
-        security_features = [
-            "🔑 JWT Authentication - Token-based secure authentication",
-            "🔒 Data Encryption - Android Keystore for sensitive data",
-            "🛡️ Certificate Pinning - Prevents man-in-the-middle attacks",
-            "👆 Biometric Auth - Fingerprint and face recognition",
-            "🔐 Secure Storage - Encrypted SharedPreferences",
-            "🌐 TLS 1.3 - Modern network security protocols",
-            "📱 App Attestation - Google Play Integrity API",
-            "🔍 Security Scanning - Automated vulnerability detection"
-        ]
-        
-        for feature in security_features:
-            print(f"   • {feature}")
-            
-    def display_deployment_info(self):
-        print("\n🚀 DEPLOYMENT & CI/CD:")
-        deployment_info = [
-            "🔄 GitHub Actions - Automated testing and builds",
-            "⚡ Fastlane - Streamlined app store deployment",
-            "🧪 Automated Testing - Unit, integration, and UI tests",
-            "📊 Code Quality - Lint checks and security scanning",
-            "📱 Google Play Store - Production deployment ready",
-            "🔍 Beta Testing - Internal testing track support",
-            "📈 Analytics - Firebase integration for insights",
-            "🚨 Crash Reporting - Crashlytics for stability monitoring"
-        ]
-        
-        for info in deployment_info:
-            print(f"   • {info}")
-            
-    def display_footer(self):
-        print("\n" + "=" * 70)
-        print("🎯 ENTERPRISE-GRADE • 📱 MOBILE-FIRST • 🏭 INDUSTRY-SPECIFIC")
-        print("🔗 GitHub-based • 🌙 Dark Neon Theme • 🚀 Production-Ready")
-        print("=" * 70)
-        print("📧 Contact: tiatheone@protonmail.com")
-        print("🏗️ Built for Australia's Mining Industry")
-        print("=" * 70)
-        
-    def run_demo(self):
-        """Run the complete demo presentation"""
-        self.display_header()
-        self.display_features()
-        self.display_tech_stack()
-        self.display_architecture()
-        self.display_project_structure()
-        self.display_industry_focus()
-        self.display_mobile_optimizations()
-        self.display_security_features()
-        self.display_deployment_info()
-        self.display_footer()
+from riggerhire.demo import main
 
 if __name__ == "__main__":
-    demo = RiggerHireDemo()
-    demo.run_demo()
+    main()
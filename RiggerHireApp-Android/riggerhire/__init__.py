@@ -0,0 +1,8 @@
+"""
+RiggerHire Android developer tooling
+
+Subcommands live in their own modules and are imported only when invoked,
+so keep this package import free of anything heavier than a constant.
+"""
+
+__version__ = "1.0.0"
@@ -0,0 +1,5 @@
+import sys
+
+from riggerhire.cli import main
+
+sys.exit(main())
@@ -0,0 +1,409 @@
+"""
+APK/AAB size attribution from the zip central directory
+
+Reads only the end-of-central-directory record and the central directory
+of an APK or AAB, streaming one entry at a time, so memory stays constant
+even for multi-hundred-MB bundles. Compressed and uncompressed bytes are
+attributed to dex, resources, assets, native libs and the rest. With
+``--dex-packages`` each classes*.dex is additionally decompressed (one at a
+time) and its class and code bytes are attributed to Java packages.
+
+Two artifacts can be diffed, and ``--budget``/``--max-growth`` limits turn
+the report into a CI gate.
+"""
+
+import struct
+import zipfile
+from pathlib import Path
+
+EOCD_SIGNATURE = b"PK\x05\x06"
+ZIP64_LOCATOR_SIGNATURE = b"PK\x06\x07"
+ZIP64_EOCD_SIGNATURE = b"PK\x06\x06"
+CENTRAL_SIGNATURE = b"PK\x01\x02"
+CENTRAL_HEADER = struct.Struct("<4s6H3I5H2I")
+EOCD = struct.Struct("<4s4H2IH")
+ZIP64_LOCATOR = struct.Struct("<4sIQI")
+ZIP64_EOCD = struct.Struct("<4sQ2H2I4Q")
+
+CATEGORIES = ("dex", "resources", "assets", "native", "manifest", "metadata", "other")
+
+UNITS = {"": 1, "B": 1, "KB": 1024, "K": 1024, "MB": 1024 ** 2, "M": 1024 ** 2, "GB": 1024 ** 3, "G": 1024 ** 3}
+
+
+class ZipEntry:
+    __slots__ = ("name", "compressed", "uncompressed", "method")
+
+    def __init__(self, name, compressed, uncompressed, method):
+        self.name = name
+        self.compressed = compressed
+        self.uncompressed = uncompressed
+        self.method = method
+
+
+def parse_size(text):
+    """'8MB' -> 8388608"""
+    text = text.strip().upper()
+    number = text.rstrip("KMGB")
+    unit = text[len(number):]
+    if unit not in UNITS:
+        raise ValueError(f"unknown size unit in {text!r}")
+    return int(float(number) * UNITS[unit])
+
+
+def format_size(size):
+    sign = "-" if size < 0 else ""
+    size = abs(size)
+    for unit in ("B", "KB", "MB"):
+        if size < 1024 or unit == "MB":
+            return f"{sign}{size:.0f} {unit}" if unit == "B" else f"{sign}{size:.1f} {unit}"
+        size /= 1024
+
+
+def _find_central_directory(handle):
+    """Return (entry count, central directory offset) from the (ZIP64) EOCD"""
+    handle.seek(0, 2)
+    file_size = handle.tell()
+    tail_size = min(file_size, EOCD.size + 0xFFFF)
+    handle.seek(file_size - tail_size)
+    tail = handle.read(tail_size)
+    position = tail.rfind(EOCD_SIGNATURE)
+    if position == -1:
+        raise ValueError("not a zip archive (no end of central directory record)")
+    _, _, _, _, entries, _, cd_offset, _ = EOCD.unpack_from(tail, position)
+    eocd_offset = file_size - tail_size + position
+
+    if entries == 0xFFFF or cd_offset == 0xFFFFFFFF:
+        handle.seek(eocd_offset - ZIP64_LOCATOR.size)
+        signature, _, zip64_offset, _ = ZIP64_LOCATOR.unpack(handle.read(ZIP64_LOCATOR.size))
+        if signature != ZIP64_LOCATOR_SIGNATURE:
+            raise ValueError("corrupt ZIP64 end of central directory locator")
+        handle.seek(zip64_offset)
+        record = ZIP64_EOCD.unpack(handle.read(ZIP64_EOCD.size))
+        if record[0] != ZIP64_EOCD_SIGNATURE:
+            raise ValueError("corrupt ZIP64 end of central directory record")
+        entries, cd_offset = record[7], record[9]
+    return entries, cd_offset
+
+
+def iter_central_directory(path):
+    """Yield a ZipEntry per central directory record without reading file data"""
+    with open(path, "rb") as handle:
+        entries, cd_offset = _find_central_directory(handle)
+        handle.seek(cd_offset)
+        for _ in range(entries):
+            header = handle.read(CENTRAL_HEADER.size)
+            if len(header) < CENTRAL_HEADER.size:
+                raise ValueError("truncated central directory")
+            (signature, _, _, flags, method, _, _, _, compressed, uncompressed,
+             name_length, extra_length, comment_length, _, _, _, _) = CENTRAL_HEADER.unpack(header)
+            if signature != CENTRAL_SIGNATURE:
+                raise ValueError("corrupt central directory entry")
+            raw_name = handle.read(name_length)
+            extra = handle.read(extra_length)
+            handle.seek(comment_length, 1)
+            name = raw_name.decode("utf-8" if flags & 0x800 else "cp437")
+
+            if uncompressed == 0xFFFFFFFF or compressed == 0xFFFFFFFF:
+                offset = 0
+                while offset + 4 <= len(extra):
+                    tag, size = struct.unpack_from("<HH", extra, offset)
+                    if tag == 0x0001:
+                        values = iter(struct.unpack_from(f"<{size // 8}Q", extra, offset + 4))
+                        if uncompressed == 0xFFFFFFFF:
+                            uncompressed = next(values)
+                        if compressed == 0xFFFFFFFF:
+                            compressed = next(values)
+                        break
+                    offset += 4 + size
+            yield ZipEntry(name, compressed, uncompressed, method)
+
+
+def categorize(name, bundle):
+    """Map an archive path to (category, detail) for APK or AAB layouts"""
+    parts = name.split("/")
+    if bundle:
+        if parts[0] in ("BUNDLE-METADATA", "META-INF") or name == "BundleConfig.pb":
+            return "metadata", parts[0]
+        parts = parts[1:]  # strip the module directory (base/, feature/...)
+        if not parts:
+            return "other", ""
+        if parts[0] == "dex":
+            return "dex", parts[-1]
+        if parts[0] == "manifest":
+            return "manifest", ""
+        if parts[0] == "root":
+            parts = parts[1:] or [""]
+    top = parts[0]
+    if top.startswith("classes") and top.endswith(".dex"):
+        return "dex", top
+    if top == "res" or top in ("resources.arsc", "resources.pb"):
+        return "resources", parts[1].split("-")[0] if top == "res" and len(parts) > 2 else top
+    if top == "assets":
+        return "assets", parts[1] if len(parts) > 2 else ""
+    if top == "lib":
+        return "native", parts[1] if len(parts) > 2 else ""
+    if top == "AndroidManifest.xml":
+        return "manifest", ""
+    if top == "META-INF":
+        return "metadata", "META-INF"
+    return "other", top
+
+
+class SizeReport:
+    """Compressed/uncompressed totals per category and per detail, in constant memory"""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.bundle = self.path.suffix.lower() == ".aab"
+        self.entries = 0
+        self.totals = {category: [0, 0] for category in CATEGORIES}
+        self.details = {}
+        self.dex_names = []
+        self.packages = {}
+        self.unreadable_dex = []    # (name, reason) for dex files that could not be parsed
+
+    @property
+    def compressed(self):
+        return sum(total[0] for total in self.totals.values())
+
+    @property
+    def uncompressed(self):
+        return sum(total[1] for total in self.totals.values())
+
+    def scan(self):
+        for entry in iter_central_directory(self.path):
+            if entry.name.endswith("/"):
+                continue
+            if entry.name == "BundleConfig.pb":
+                self.bundle = True
+            category, detail = categorize(entry.name, self.bundle)
+            self.entries += 1
+            total = self.totals[category]
+            total[0] += entry.compressed
+            total[1] += entry.uncompressed
+            key = (category, detail)
+            bucket = self.details.setdefault(key, [0, 0])
+            bucket[0] += entry.compressed
+            bucket[1] += entry.uncompressed
+            if category == "dex":
+                self.dex_names.append(entry.name)
+        return self
+
+    def attribute_dex(self, depth):
+        """Decompress each dex in turn and attribute its bytes to packages
+
+        A truncated or corrupt dex is counted whole under "(unattributed)"
+        and recorded in unreadable_dex instead of failing the report.
+        """
+        with zipfile.ZipFile(self.path) as archive:
+            for name in self.dex_names:
+                data = archive.read(name)
+                try:
+                    sizes = dex_package_sizes(data, depth)
+                except (ValueError, IndexError, struct.error) as e:
+                    self.unreadable_dex.append((name, str(e) or type(e).__name__))
+                    sizes = {"(unattributed)": len(data)}
+                for package, size in sizes.items():
+                    self.packages[package] = self.packages.get(package, 0) + size
+                del data
+        return self
+
+
+def _uleb128(data, offset):
+    result = shift = 0
+    while True:
+        byte = data[offset]
+        offset += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, offset
+        shift += 7
+
+
+def dex_package_sizes(data, depth=3):
+    """{package: bytes} of class_def, class_data and code items per package
+
+    Bytes not owned by any class (string and id tables, maps) are reported
+    under "(shared tables)".
+    """
+    if data[:4] != b"dex\n":
+        raise ValueError("not a dex file")
+    file_size = struct.unpack_from("<I", data, 0x20)[0]
+    string_ids_size, string_ids_off, type_ids_size, type_ids_off = struct.unpack_from("<4I", data, 0x38)
+    class_defs_size, class_defs_off = struct.unpack_from("<2I", data, 0x60)
+
+    def type_descriptor(type_idx):
+        string_idx = struct.unpack_from("<I", data, type_ids_off + 4 * type_idx)[0]
+        string_off = struct.unpack_from("<I", data, string_ids_off + 4 * string_idx)[0]
+        _, start = _uleb128(data, string_off)
+        end = data.index(b"\x00", start)
+        return data[start:end].decode("utf-8", errors="replace")
+
+    sizes = {}
+    owned = 0
+    for index in range(class_defs_size):
+        class_def = class_defs_off + 32 * index
+        class_idx = struct.unpack_from("<I", data, class_def)[0]
+        class_data_off = struct.unpack_from("<I", data, class_def + 24)[0]
+        size = 32
+        if class_data_off:
+            offset = class_data_off
+            counts = []
+            for _ in range(4):
+                value, offset = _uleb128(data, offset)
+                counts.append(value)
+            for _ in range(2 * (counts[0] + counts[1])):
+                _, offset = _uleb128(data, offset)
+            for _ in range(counts[2] + counts[3]):
+                _, offset = _uleb128(data, offset)
+                _, offset = _uleb128(data, offset)
+                code_off, offset = _uleb128(data, offset)
+                if code_off:
+                    tries_size = struct.unpack_from("<H", data, code_off + 6)[0]
+                    insns_size = struct.unpack_from("<I", data, code_off + 12)[0]
+                    size += 16 + 2 * insns_size
+                    if tries_size:
+                        size += (2 if insns_size % 2 else 0) + 8 * tries_size
+            size += offset - class_data_off
+        descriptor = type_descriptor(class_idx)
+        segments = descriptor[1:-1].split("/")[:-1] if descriptor.startswith("L") else []
+        package = ".".join(segments[:depth]) or "(default package)"
+        sizes[package] = sizes.get(package, 0) + size
+        owned += size
+    sizes["(shared tables)"] = sizes.get("(shared tables)", 0) + max(file_size - owned, 0)
+    return sizes
+
+
+def print_report(report, top):
+    print(f"📦 {report.path.name} ({'AAB' if report.bundle else 'APK'}, {report.entries} entries)")
+    print(f"   {'category':<12}{'compressed':>14}{'uncompressed':>16}{'share':>8}")
+    total = report.compressed or 1
+    for category in CATEGORIES:
+        compressed, uncompressed = report.totals[category]
+        if compressed or uncompressed:
+            print(f"   {category:<12}{format_size(compressed):>14}{format_size(uncompressed):>16}"
+                  f"{compressed * 100 / total:>7.1f}%")
+    print(f"   {'total':<12}{format_size(report.compressed):>14}{format_size(report.uncompressed):>16}")
+
+    largest = sorted(report.details.items(), key=lambda item: -item[1][0])[:top]
+    if largest:
+        print(f"\n   Largest groups:")
+        for (category, detail), (compressed, uncompressed) in largest:
+            label = f"{category}/{detail}" if detail else category
+            print(f"   • {label}: {format_size(compressed)} ({format_size(uncompressed)} uncompressed)")
+    if report.packages:
+        print(f"\n   Dex bytes by package:")
+        for package, size in sorted(report.packages.items(), key=lambda item: -item[1])[:top]:
+            print(f"   • {package}: {format_size(size)}")
+    for name, reason in report.unreadable_dex:
+        print(f"   ⚠️  {name} could not be parsed ({reason}); its bytes are listed as (unattributed)")
+
+
+def print_diff(old, new, top):
+    print(f"\n🔀 {old.path.name} → {new.path.name}")
+    for category in CATEGORIES + ("total",):
+        before = old.compressed if category == "total" else old.totals[category][0]
+        after = new.compressed if category == "total" else new.totals[category][0]
+        if before or after:
+            print(f"   {category:<12}{format_size(before):>12} → {format_size(after):>12}  "
+                  f"({'+' if after >= before else ''}{format_size(after - before)})")
+    keys = set(old.details) | set(new.details)
+    changes = sorted(((new.details.get(k, [0])[0] - old.details.get(k, [0])[0], k) for k in keys),
+                     key=lambda item: -abs(item[0]))
+    changes = [change for change in changes if change[0]][:top]
+    if changes:
+        print("\n   Biggest changes:")
+        for delta, (category, detail) in changes:
+            label = f"{category}/{detail}" if detail else category
+            print(f"   • {label}: {'+' if delta > 0 else ''}{format_size(delta)}")
+    if old.packages or new.packages:
+        deltas = sorted(((new.packages.get(p, 0) - old.packages.get(p, 0), p)
+                         for p in set(old.packages) | set(new.packages)), key=lambda item: -abs(item[0]))
+        deltas = [delta for delta in deltas if delta[0]][:top]
+        if deltas:
+            print("\n   Dex package changes:")
+            for delta, package in deltas:
+                print(f"   • {package}: {'+' if delta > 0 else ''}{format_size(delta)}")
+
+
+def _limits(values, option):
+    limits = {}
+    for value in values or []:
+        key, _, size = value.partition("=")
+        if key not in CATEGORIES + ("total",) or not size:
+            raise SystemExit(f"{option} expects CATEGORY=SIZE with CATEGORY in "
+                             f"{', '.join(CATEGORIES + ('total',))}, got {value!r}")
+        try:
+            limits[key] = parse_size(size)
+        except (ValueError, OverflowError):
+            raise SystemExit(f"{option} {value!r}: SIZE must be a number with an optional "
+                             f"B/KB/MB/GB unit, e.g. {key}=8MB") from None
+    return limits
+
+
+def check_limits(report, budgets, old=None, max_growth=None):
+    """Return a list of budget violations"""
+    failures = []
+
+    def compressed(r, key):
+        return r.compressed if key == "total" else r.totals[key][0]
+
+    for key, limit in budgets.items():
+        size = compressed(report, key)
+        if size > limit:
+            failures.append(f"{key} is {format_size(size)}, over the {format_size(limit)} budget")
+    if old is not None:
+        for key, limit in (max_growth or {}).items():
+            growth = compressed(report, key) - compressed(old, key)
+            if growth > limit:
+                failures.append(f"{key} grew by {format_size(growth)}, over the {format_size(limit)} limit")
+    return failures
+
+
+def add_arguments(parser):
+    parser.add_argument("artifacts", nargs="+", metavar="ARTIFACT",
+                        help="APK or AAB to report on; give two to diff old → new")
+    parser.add_argument("--budget", action="append", metavar="CATEGORY=SIZE",
+                        help="fail if a category (or total) exceeds SIZE compressed, e.g. dex=8MB")
+    parser.add_argument("--max-growth", action="append", metavar="CATEGORY=SIZE",
+                        help="when diffing, fail if a category (or total) grows by more than SIZE")
+    parser.add_argument("--dex-packages", action="store_true",
+                        help="also attribute dex bytes to packages (decompresses each dex in turn)")
+    parser.add_argument("--package-depth", type=int, default=3, help="package segments to group by")
+    parser.add_argument("--top", type=int, default=10, help="rows to show in the largest/biggest lists")
+
+
+def run(args):
+    if len(args.artifacts) > 2:
+        raise SystemExit("apk-size takes one artifact, or two to diff")
+    budgets = _limits(args.budget, "--budget")
+    max_growth = _limits(args.max_growth, "--max-growth")
+
+    print("📏 RiggerHire Android App - Artifact Size Report")
+    print("=" * 55)
+    reports = []
+    for artifact in args.artifacts:
+        try:
+            report = SizeReport(artifact).scan()
+            if args.dex_packages:
+                report.attribute_dex(args.package_depth)
+        except (OSError, ValueError, zipfile.BadZipFile) as e:
+            print(f"❌ {artifact}: {e}")
+            return 1
+        reports.append(report)
+        print_report(report, args.top)
+        print()
+
+    old, new = (reports[0], reports[1]) if len(reports) == 2 else (None, reports[0])
+    if old is not None:
+        print_diff(old, new, args.top)
+
+    failures = check_limits(new, budgets, old, max_growth)
+    if failures:
+        print(f"\n❌ SIZE BUDGET EXCEEDED ({len(failures)}):")
+        for failure in failures:
+            print(f"   • {failure}")
+        return 1
+    if budgets or max_growth:
+        print("\n✅ Within size budgets")
+    return 0
@@ -0,0 +1,869 @@
+"""
+Static Baseline Profile generator
+
+Derives a candidate ``baseline-prof.txt`` from the Kotlin sources without
+running the app. Classes, objects and funs are indexed from every .kt file
+with their JVM owner class and parameter types, then the static call graph
+is walked from the entry points: the Application's ``onCreate``, the
+launcher Activity, ``SplashScreen`` and the NavHost start destination
+(cold start), and ``JobsListScreen``/``JobsListActivity`` (the job feed).
+
+Other navigation destinations and event callbacks (``onClick = { }``,
+``clickable { }``) are not followed, since they do not run until the user
+acts. Calls resolve to project declarations by name: the enclosing class,
+then the package, then imports. Library code is not followed; AndroidX
+ships its own profiles.
+
+Reached methods become ``HSP`` rules (``HP`` when only the job feed reaches
+them) with JVM descriptors worked out from the Kotlin signatures, including
+the Compose compiler's ``Composer``/``$changed`` parameters. Signatures
+with a type that cannot be resolved fall back to a ``(**)**`` wildcard,
+and names mangled for inline classes such as ``Color`` to ``name-*``.
+Lambda classes are not named; record a profile with Macrobenchmark to
+pick those up.
+"""
+
+import re
+from bisect import bisect_left
+from pathlib import Path
+
+from riggerhire.kotlin import (LazyPattern, block_header, enclosing_blocks, iter_kotlin_files, matching,
+                               split_top_level, strip_comments)
+
+PROFILE_PATH = "app/src/main/baseline-prof.txt"
+MANIFEST_PATH = "app/src/main/AndroidManifest.xml"
+PROFILE_HEADER = (
+    "# Baseline Profile derived from the static startup call graph.\n"
+    "# Regenerate with 'riggerhire baseline-profile --write'; CI fails when it is out of sync.\n"
+)
+
+# (label, kind, name, on the cold-start path)
+ENTRY_POINTS = (
+    ("Application.onCreate", "application", None, True),
+    ("launcher Activity", "launcher", None, True),
+    ("SplashScreen", "function", "SplashScreen", True),
+    ("NavHost start destination", "start-destination", None, True),
+    ("JobsListScreen", "function", "JobsListScreen", False),
+    ("JobsListActivity", "activity", "JobsListActivity", False),
+)
+LIFECYCLE_METHODS = ("onCreate", "onPostCreate", "onStart", "onResume")
+STARTUP_FLAGS, FEED_FLAGS = "HSP", "HP"
+
+PACKAGE_RE = LazyPattern(r'^\s*package\s+([\w.]+)', re.M)
+IMPORT_RE = LazyPattern(r'^\s*import\s+([\w.]+?)(\.\*)?(?:\s+as\s+(\w+))?\s*$', re.M)
+JVM_NAME_RE = LazyPattern(r'@file:JvmName\(\s*"(\w+)"\s*\)')
+CLASS_DECL_RE = LazyPattern(r'(?<![\w:.])(companion\s+)?(class|interface|object)\b(?:\s+(\w+))?')
+FUN_DECL_RE = LazyPattern(r'(?<![\w.])fun\s+(?:<([^<>]*)>\s*)?(?:([\w.]+(?:<[^()=]*?>)?\??)\s*\.\s*)?(\w+)\s*\(')
+CTOR_PREFIX_RE = LazyPattern(r'(?:@\w+(?:\([^()]*\))?\s*|(?:private|internal|protected|public)\s+)*constructor\s*')
+PARAM_PREFIX_RE = LazyPattern(r'^(?:@[\w.:]+(?:\([^()]*\))?\s*|'
+                              r'(?:vararg|noinline|crossinline|val|var|private|internal|protected|public|'
+                              r'override|open|final)\s+)*')
+ANNOTATION_RE = LazyPattern(r'@([\w.]+)(?:\([^()]*\))?\s*')
+IDENT_RE = LazyPattern(r'(?<![\w$@])[A-Za-z_]\w*')
+RECEIVER_RE = LazyPattern(r'(\w+)\s*(?:\?|!!)?\.\s*$')
+GENERIC_ARGS_RE = LazyPattern(r'\s*<[^<>(){}=;\n]*>')
+TYPE_POSITION_RE = LazyPattern(r'(?:[^:]:|<|\bas\??|\bis)$')
+PROPERTY_RE = LazyPattern(r'(?<![\w.])(?:val|var)\s+(\w+)\s*:\s*([^=\n{]+)')
+CALLBACK_ARG_RE = LazyPattern(r'\bon[A-Z]\w*\s*=\s*$')
+CALLEE_RE = LazyPattern(r'(\w+)\s*(?:<[^<>]*>)?\s*$')
+START_DESTINATION_RE = LazyPattern(r'\bstartDestination\s*:\s*String\s*=\s*([\w.]+)')
+APPLICATION_RE = LazyPattern(r'<application\b[^>]*?\bandroid:name="([^"]+)"', re.S)
+ACTIVITY_RE = LazyPattern(r'<activity\b([^>]*?)(?:/>|>(.*?)</activity\s*>)', re.S)
+NAME_ATTR_RE = LazyPattern(r'\bandroid:name="([^"]+)"')
+
+# Lambdas that run when the user acts or a route is opened, not while the caller runs
+DEFERRED_CALLEES = {"composable", "dialog", "navigation", "clickable", "combinedClickable", "toggleable",
+                    "selectable", "setOnClickListener", "setOnLongClickListener", "addCallback",
+                    "registerForActivityResult", "lazy"}
+KEYWORDS = {"if", "else", "when", "for", "while", "do", "return", "fun", "val", "var", "is", "in", "as", "this",
+            "super", "null", "true", "false", "object", "class", "it", "by", "try", "catch", "finally", "throw"}
+
+PRIMITIVES = {
+    "Int": ("I", "java/lang/Integer"), "Long": ("J", "java/lang/Long"), "Boolean": ("Z", "java/lang/Boolean"),
+    "Float": ("F", "java/lang/Float"), "Double": ("D", "java/lang/Double"), "Short": ("S", "java/lang/Short"),
+    "Byte": ("B", "java/lang/Byte"), "Char": ("C", "java/lang/Character"),
+}
+PRIMITIVE_ARRAYS = {"IntArray": "[I", "LongArray": "[J", "BooleanArray": "[Z", "FloatArray": "[F",
+                    "DoubleArray": "[D", "ShortArray": "[S", "ByteArray": "[B", "CharArray": "[C"}
+# Kotlin types that are default-imported, mapped to the JVM classes they compile to
+KOTLIN_TYPES = {
+    "Any": "java/lang/Object", "String": "java/lang/String", "CharSequence": "java/lang/CharSequence",
+    "Number": "java/lang/Number", "Throwable": "java/lang/Throwable", "Exception": "java/lang/Exception",
+    "Comparable": "java/lang/Comparable", "Unit": "kotlin/Unit", "Nothing": "java/lang/Void",
+    "List": "java/util/List", "MutableList": "java/util/List", "ArrayList": "java/util/ArrayList",
+    "Set": "java/util/Set", "MutableSet": "java/util/Set", "HashSet": "java/util/HashSet",
+    "Map": "java/util/Map", "MutableMap": "java/util/Map", "HashMap": "java/util/HashMap",
+    "Collection": "java/util/Collection", "Iterable": "java/lang/Iterable", "Pair": "kotlin/Pair",
+    "Triple": "kotlin/Triple", "Lazy": "kotlin/Lazy", "Result": "kotlin/Result",
+}
+# Library types commonly reached through star imports: {simple name: JVM name}
+STAR_IMPORTED_TYPES = {
+    "Modifier": "androidx/compose/ui/Modifier", "State": "androidx/compose/runtime/State",
+    "MutableState": "androidx/compose/runtime/MutableState", "Date": "java/util/Date",
+    "UUID": "java/util/UUID", "Locale": "java/util/Locale", "PaddingValues": "androidx/compose/foundation/layout/PaddingValues",
+}
+# Value classes: functions taking or returning them get a hashed name suffix
+INLINE_CLASSES = {"androidx/compose/ui/graphics/Color", "androidx/compose/ui/unit/Dp",
+                  "androidx/compose/ui/unit/TextUnit", "androidx/compose/ui/geometry/Offset",
+                  "androidx/compose/ui/geometry/Size", "androidx/compose/ui/unit/IntOffset",
+                  "androidx/compose/ui/unit/IntSize", "androidx/compose/ui/unit/DpOffset",
+                  "androidx/compose/ui/text/style/TextAlign", "kotlin/time/Duration", "kotlin/Result"}
+
+
+def jvm_name(qualified):
+    """'com.x.Outer.Inner' -> 'com/x/Outer$Inner' (segments after the first capitalised one are nested)"""
+    parts = qualified.split(".")
+    for i, part in enumerate(parts):
+        if part[:1].isupper():
+            return "/".join(parts[:i + 1]) + "".join("$" + nested for nested in parts[i + 1:])
+    return "/".join(parts)
+
+
+def skip_space(text, i):
+    while i < len(text) and text[i] in " \t\n":
+        i += 1
+    return i
+
+
+def modifiers_before(text, offset):
+    """Modifiers on a declaration's own line plus the annotation lines above it"""
+    line_start = text.rfind("\n", 0, offset) + 1
+    parts = [text[line_start:offset]]
+    end = line_start - 1
+    while end > 0:
+        start = text.rfind("\n", 0, end) + 1
+        line = text[start:end].strip()
+        if not line.startswith("@"):
+            break
+        parts.append(line)
+        end = start - 1
+    return " ".join(parts)
+
+
+def statement_end(text, start):
+    """End of an expression starting at text[start], following continuation lines"""
+    i = skip_space(text, start)
+    n = len(text)
+    while i < n:
+        ch = text[i]
+        if ch in "([{":
+            close = matching(text, i)
+            if close == -1:
+                return n
+            i = close + 1
+            continue
+        if ch in ";)]}":
+            return i
+        if ch == "\n":
+            following = text[skip_space(text, i):skip_space(text, i) + 2]
+            previous = text[max(0, i - 40):i].rstrip()[-1:]
+            if not following.startswith((".", "?", "+", "-", "*", "/", "&", "|", ":")) and \
+                    previous not in ("=", "+", "-", "*", "/", "(", ",", ".", "&", "|", ":", ">"):
+                return i
+        i += 1
+    return n
+
+
+def header_end(text, i, stops):
+    """Scan a declaration header from text[i] to the first stop character at depth zero
+
+    Returns the offset of the stop character, or of the newline ending the
+    header when the header does not continue on the next line.
+    """
+    n = len(text)
+    while i < n:
+        ch = text[i]
+        if ch in "(<" and (ch == "(" or text[i - 1].isalnum()):
+            close = matching(text, i)
+            if close == -1:
+                return n
+            i = close + 1
+            continue
+        if ch in stops or ch in ";}":
+            return i
+        if ch == "\n":
+            following = text[skip_space(text, i):skip_space(text, i) + 1]
+            previous = text[max(0, i - 40):i].rstrip()[-1:]
+            if following not in stops and following not in (",", ":", ".") and previous not in (",", ":"):
+                return i
+        i += 1
+    return n
+
+
+def parse_params(text):
+    """[(name, type, has default, vararg, property)] for a parameter list"""
+    params = []
+    for part in split_top_level(text):
+        prefix = PARAM_PREFIX_RE.match(part).group(0)
+        declaration = split_top_level(part[len(prefix):], "=")
+        name, _, type_text = declaration[0].partition(":") if declaration else ("", "", "")
+        params.append((name.strip(), type_text.strip(), len(declaration) > 1, "vararg" in prefix.split(),
+                       bool(re.search(r'\b(?:val|var)\b', prefix)) and "private" not in prefix.split()))
+    return params
+
+
+def top_level_arrow(text):
+    """Offset of a '->' outside brackets, or -1"""
+    depth = 0
+    for i, ch in enumerate(text):
+        if ch in "(<":
+            depth += 1
+        elif ch == ")" or (ch == ">" and text[i - 1] != "-"):
+            depth -= 1
+        elif ch == "-" and depth == 0 and text.startswith("->", i):
+            return i
+    return -1
+
+
+class SourceFile:
+    """A Kotlin file's package, imports and comment-free text"""
+
+    def __init__(self, path):
+        self.path = path
+        content = path.read_text(errors="replace")
+        self.structure = strip_comments(content, blank_strings=True)
+        package = PACKAGE_RE.search(self.structure)
+        self.package = package.group(1) if package else ""
+        self.imports, self.star_imports = {}, []
+        for match in IMPORT_RE.finditer(self.structure):
+            if match.group(2):
+                self.star_imports.append(match.group(1))
+            else:
+                self.imports[match.group(3) or match.group(1).rsplit(".", 1)[-1]] = match.group(1)
+        jvm_file_name = JVM_NAME_RE.search(content)
+        stem = jvm_file_name.group(1) if jvm_file_name else path.stem[:1].upper() + path.stem[1:] + "Kt"
+        self.facade = jvm_name(f"{self.package}.{stem}" if self.package else stem)
+        self.hits = None
+
+
+class ClassDecl:
+    __slots__ = ("name", "qualified", "jvm", "kind", "source", "outer", "line", "modifiers", "type_params",
+                 "ctor", "supertypes", "body", "nested", "methods", "companion", "members_end")
+
+    def __init__(self, name, qualified, kind, source, outer, line, modifiers):
+        self.name, self.qualified, self.kind, self.source, self.outer = name, qualified, kind, source, outer
+        self.jvm = jvm_name(qualified)
+        self.line, self.modifiers = line, modifiers
+        self.type_params, self.ctor, self.supertypes, self.body = set(), None, None, None
+        self.nested, self.methods, self.companion, self.members_end = {}, {}, None, []
+
+    def __repr__(self):
+        return self.qualified
+
+
+class Method:
+    __slots__ = ("name", "owner", "source", "line", "receiver", "params", "returns", "composable", "suspend",
+                 "type_params", "body", "extent")
+
+    def __init__(self, name, owner, source, line):
+        self.name, self.owner, self.source, self.line = name, owner, source, line
+        self.receiver, self.params, self.returns = None, [], None
+        self.composable = self.suspend = False
+        self.type_params, self.body, self.extent = set(), None, None
+
+    @property
+    def jvm_owner(self):
+        return self.owner.jvm if self.owner else self.source.facade
+
+    def __repr__(self):
+        return f"{self.owner.name if self.owner else self.source.path.name}.{self.name}"
+
+
+class CallGraph:
+    """Declaration index and static call graph for the app's Kotlin sources"""
+
+    def __init__(self, root="."):
+        self.root = Path(root)
+        self.sources = []
+        self.classes = {}             # qualified name -> ClassDecl
+        self.top_classes = {}         # (package, name) -> ClassDecl
+        self.top_functions = {}       # (package, name) -> [Method]
+        self.methods = []
+        self.member_owners = {}       # method name -> {ClassDecl}
+        self.names = set()
+        self._edges = {}
+        self._deferred = {}
+
+    def build(self):
+        for path in iter_kotlin_files(self.root / "app/src/main"):
+            source = SourceFile(path)
+            self.sources.append(source)
+            self.index(source)
+        self.names = {method.name for method in self.methods} | {cls.name for cls in self.classes.values()}
+        return self
+
+    # Indexing
+
+    def index(self, source):
+        text = source.structure
+        declarations = sorted([(m.start(), "class", m) for m in CLASS_DECL_RE.finditer(text)] +
+                              [(m.start(), "fun", m) for m in FUN_DECL_RE.finditer(text)], key=lambda d: d[0])
+        class_bodies = {}
+        for (offset, kind, match), stack in zip(declarations, enclosing_blocks(text, [d[0] for d in declarations])):
+            if stack and stack[-1] not in class_bodies:
+                continue  # local declaration or anonymous object member
+            outer = class_bodies[stack[-1]] if stack else None
+            if kind == "class":
+                cls = self.index_class(source, match, outer)
+                if cls and cls.body:
+                    class_bodies[cls.body[0]] = cls
+            else:
+                self.index_function(source, match, outer)
+
+    def index_class(self, source, match, outer):
+        text = source.structure
+        companion, keyword, name = match.group(1), match.group(2), match.group(3)
+        if not name and not companion:
+            return None
+        name = name or "Companion"
+        modifiers = modifiers_before(text, match.start())
+        kind = "companion" if companion else ("enum" if re.search(r'\benum\s*$', modifiers) else keyword)
+        prefix = f"{outer.qualified}." if outer else (f"{source.package}." if source.package else "")
+        cls = ClassDecl(name, prefix + name, kind, source, outer, text.count("\n", 0, match.start()) + 1, modifiers)
+
+        i = skip_space(text, match.end())
+        if text.startswith("<", i):
+            close = matching(text, i)
+            cls.type_params = {part.split(":")[0].strip() for part in split_top_level(text[i + 1:close])}
+            i = skip_space(text, close + 1)
+        ctor = CTOR_PREFIX_RE.match(text, i)
+        if text.startswith("(", ctor.end() if ctor else i):
+            i = ctor.end() if ctor else i
+            close = matching(text, i)
+            cls.ctor = (i + 1, close)
+            i = skip_space(text, close + 1)
+        end = header_end(text, i, "{")
+        cls.supertypes = (i, end)
+        if end < len(text) and text[end] == "{":
+            close = matching(text, end)
+            cls.body = (end, close if close != -1 else len(text))
+
+        self.classes[cls.qualified] = cls
+        if outer:
+            outer.nested[name] = cls
+            outer.members_end.append((match.start(), cls.body[1] if cls.body else end))
+            if companion:
+                outer.companion = cls
+        else:
+            self.top_classes[(source.package, name)] = cls
+        return cls
+
+    def index_function(self, source, match, owner):
+        text = source.structure
+        method = Method(match.group(3), owner, source, text.count("\n", 0, match.start()) + 1)
+        modifiers = modifiers_before(text, match.start())
+        method.composable = "@Composable" in modifiers
+        method.suspend = bool(re.search(r'\bsuspend\b', modifiers))
+        if match.group(1):
+            method.type_params = {part.split(":")[0].strip() for part in split_top_level(match.group(1))}
+        method.receiver = match.group(2)
+
+        open_paren = match.end() - 1
+        close = matching(text, open_paren)
+        if close == -1:
+            return
+        method.params = parse_params(text[open_paren + 1:close])
+        i = skip_space(text, close + 1)
+        if text.startswith(":", i):
+            end = header_end(text, i + 1, "{=")
+            method.returns = text[i + 1:end].strip()
+            i = end
+        i = skip_space(text, i)
+        if text.startswith("{", i):
+            body_end = matching(text, i)
+            method.body = (i, i + 1, body_end if body_end != -1 else len(text))
+        elif text.startswith("=", i) and not text.startswith("==", i):
+            method.body = (i, i + 1, statement_end(text, i + 1))
+            if method.returns is None and not method.composable:
+                method.returns = "?"  # inferred from the expression
+        method.extent = (match.start(), method.body[2] if method.body else close + 1)
+
+        self.methods.append(method)
+        if owner:
+            owner.methods.setdefault(method.name, []).append(method)
+            owner.members_end.append(method.extent)
+            self.member_owners.setdefault(method.name, set()).add(owner)
+        else:
+            self.top_functions.setdefault((source.package, method.name), []).append(method)
+
+    # Name resolution
+
+    def resolve_class(self, name, source, context=None):
+        """ClassDecl for a possibly dotted class name as written in source, or None"""
+        head, _, rest = name.partition(".")
+        cls = None
+        scope = context
+        while scope and not cls:
+            cls = scope.nested.get(head) or (scope if scope.name == head else None)
+            scope = scope.outer
+        if not cls:
+            cls = self.top_classes.get((source.package, head))
+        if not cls and head in source.imports:
+            cls = self.classes.get(source.imports[head])
+        if not cls:
+            for package in source.star_imports:
+                cls = self.top_classes.get((package, head)) or self.classes.get(f"{package}.{head}")
+                if cls:
+                    break
+        for part in rest.split(".") if rest and cls else ():
+            cls = cls.nested.get(part)
+            if not cls:
+                return None
+        return cls
+
+    def library_class(self, name, source):
+        """JVM name of a library class referenced by simple or qualified name, or None"""
+        head, _, rest = name.partition(".")
+        if head in source.imports:
+            return jvm_name(source.imports[head] + ("." + rest if rest else ""))
+        if head[:1].islower() and rest:
+            return jvm_name(name)
+        known = STAR_IMPORTED_TYPES.get(name)
+        if known and known.rsplit("/", 1)[0].replace("/", ".") in source.star_imports:
+            return known
+        return None
+
+    def jvm_type(self, type_text, source, context, type_params, boxed=False):
+        """JVM descriptor for a Kotlin type, or None if it cannot be resolved"""
+        text = type_text.strip()
+        composable = suspend = False
+        while text.startswith("@"):
+            annotation = ANNOTATION_RE.match(text)
+            composable |= annotation.group(1) == "Composable"
+            text = text[annotation.end():]
+        if text.startswith("suspend "):
+            suspend, text = True, text[len("suspend "):].strip()
+        nullable = text.endswith("?")
+        text = text.rstrip("?").strip()
+        if text.startswith("(") and matching(text, 0) == len(text) - 1 and top_level_arrow(text[1:-1]) != -1:
+            text = text[1:-1].strip()
+        arrow = top_level_arrow(text)
+        if arrow != -1:
+            left = text[:arrow].strip()
+            paren = left.find("(")
+            arity = len(split_top_level(left[paren + 1:-1])) + (1 if paren > 0 else 0)
+            return f"Lkotlin/jvm/functions/Function{arity + suspend + (2 if composable else 0)};"
+
+        base, _, arguments = text.partition("<")
+        base = base.strip()
+        if base in PRIMITIVES:
+            primitive, box = PRIMITIVES[base]
+            return f"L{box};" if nullable or boxed else primitive
+        if base in PRIMITIVE_ARRAYS:
+            return PRIMITIVE_ARRAYS[base]
+        if base == "Array":
+            element = self.jvm_type(split_top_level(arguments.rsplit(">", 1)[0])[0].replace("out ", ""),
+                                    source, context, type_params, boxed=True)
+            return "[" + element if element else None
+        if base in type_params or (context and base in context.type_params) or base == "*":
+            return "Ljava/lang/Object;"
+        cls = self.resolve_class(base, source, context)
+        if cls:
+            return f"L{cls.jvm};"
+        if base in KOTLIN_TYPES:
+            return f"L{KOTLIN_TYPES[base]};"
+        library = self.library_class(base, source)
+        return f"L{library};" if library else None
+
+    def signature(self, method):
+        """(name pattern, descriptor or None) for a method as it appears in dex"""
+        source, context = method.source, method.owner
+        types = []
+        if method.receiver:
+            types.append(self.jvm_type(method.receiver, source, context, method.type_params))
+        for _, type_text, _, vararg, _ in method.params:
+            descriptor = self.jvm_type(type_text, source, context, method.type_params, boxed=vararg)
+            types.append("[" + descriptor if vararg and descriptor else descriptor)
+        if method.returns in (None, "Unit"):
+            returns = "V" if method.body or method.composable or method.returns else None
+        elif method.returns == "?":
+            returns = None
+        else:
+            returns = self.jvm_type(method.returns, source, context, method.type_params)
+        known = [t for t in types + [returns] if t]
+        name = method.name + "-*" if any(t[1:-1] in INLINE_CLASSES for t in known if t.startswith("L")) \
+            else method.name
+        if None in types or returns is None or name != method.name:
+            return name, None
+        if method.suspend:
+            types.append("Lkotlin/coroutines/Continuation;")
+            returns = "Ljava/lang/Object;"
+        if method.composable:
+            count = len(method.params) + (1 if method.receiver else 0) + (1 if method.owner else 0)
+            types.append("Landroidx/compose/runtime/Composer;")
+            types.extend("I" * max(1, -(-count // 10)))
+            if any(has_default for _, _, has_default, _, _ in method.params):
+                types.extend("I" * -(-len(method.params) // 31))
+        return name, f"({''.join(types)}){returns}"
+
+    def constructor_signature(self, cls):
+        """Descriptor of the primary constructor, or None if it cannot be resolved"""
+        if cls.kind == "interface":
+            return None
+        types = ["Ljava/lang/String;", "I"] if cls.kind == "enum" else []
+        if re.search(r'\binner\b', cls.modifiers) and cls.outer:
+            types.append(f"L{cls.outer.jvm};")
+        if cls.ctor:
+            for _, type_text, _, vararg, _ in parse_params(cls.source.structure[cls.ctor[0]:cls.ctor[1]]):
+                descriptor = self.jvm_type(type_text, cls.source, cls, set(), boxed=vararg)
+                if descriptor is None or descriptor[1:-1] in INLINE_CLASSES:
+                    return "(**)V"
+                types.append("[" + descriptor if vararg else descriptor)
+        return f"({''.join(types)})V"
+
+    # Call graph
+
+    def file_hits(self, source):
+        """[(offset, name, receiver, dotted, called, typed, enclosing braces)] for project names in a file
+
+        typed marks a name used only as a type (``x: Job``, ``List<Job>``),
+        which does not load the class; a delegated ``x: T by ...`` is not typed.
+        """
+        if source.hits is None:
+            text = source.structure
+            found = []
+            for match in IDENT_RE.finditer(text):
+                name = match.group(0)
+                if name not in self.names or name in KEYWORDS:
+                    continue
+                before = text[max(0, match.start() - 80):match.start()]
+                stripped = before.rstrip()
+                dotted = stripped.endswith(".")
+                receiver = RECEIVER_RE.search(before) if dotted else None
+                after = match.end()
+                generic = GENERIC_ARGS_RE.match(text, after)
+                after = skip_space(text, generic.end() if generic else after)
+                called = after < len(text) and text[after] in "({" or stripped.endswith("::")
+                typed = bool(TYPE_POSITION_RE.search(stripped)) and \
+                    not re.match(r'\??\s*by\b', text[after:after + 8])
+                found.append((match.start(), name, receiver.group(1) if receiver else None, dotted, called, typed))
+            source.hits = [hit + (stack,) for hit, stack in zip(found, enclosing_blocks(text, [h[0] for h in found]))]
+        return source.hits
+
+    def deferred(self, source, brace):
+        """True if the lambda opened at brace runs later, on an event or navigation"""
+        key = (source.path, brace)
+        if key not in self._deferred:
+            prefix, _ = block_header(source.structure, brace)
+            callee = CALLEE_RE.search(prefix)
+            self._deferred[key] = bool(CALLBACK_ARG_RE.search(prefix) or
+                                       (callee and callee.group(1) in DEFERRED_CALLEES))
+        return self._deferred[key]
+
+    def member(self, cls, name, seen=None):
+        """Methods called name declared on cls or its project superclasses"""
+        seen = seen or set()
+        while cls and cls not in seen:
+            seen.add(cls)
+            if name in cls.methods:
+                return cls.methods[name]
+            start, end = cls.supertypes
+            supertype = re.match(r'\s*:?\s*([\w.]+)', cls.source.structure[start:end])
+            cls = self.resolve_class(supertype.group(1), cls.source, cls.outer) if supertype else None
+        return []
+
+    def functions(self, name, source, context):
+        """Methods an unqualified call to name can resolve to"""
+        scope = context
+        while scope:
+            found = self.member(scope, name) or (self.member(scope.companion, name) if scope.companion else [])
+            if found:
+                return found
+            scope = scope.outer
+        found = self.top_functions.get((source.package, name))
+        if found:
+            return found
+        if name in source.imports:
+            return self.top_functions.get((source.imports[name].rsplit(".", 1)[0], name), [])
+        for package in source.star_imports:
+            found = self.top_functions.get((package, name))
+            if found:
+                return found
+        return []
+
+    def variable_class(self, variable, source, context):
+        declared = re.search(r'\b' + re.escape(variable) + r'\s*:\s*([A-Z][\w.]*)', source.structure) or \
+            re.search(r'\b(?:val|var)\s+' + re.escape(variable) + r'\s*=\s*([A-Z][\w.]*)\s*\(', source.structure)
+        return self.resolve_class(declared.group(1), source, context) if declared else None
+
+    def resolve_hit(self, name, receiver, dotted, called, source, context):
+        """Nodes (Method or ClassDecl) a name used at a call site reaches"""
+        if dotted:
+            if receiver == "super":
+                return []
+            if receiver is None:
+                target = None
+            elif receiver == "this":
+                target = context
+            elif receiver[:1].isupper():
+                target = self.resolve_class(receiver, source, context)
+                if target and name in target.nested:
+                    return [target.nested[name]]
+            else:
+                target = self.variable_class(receiver, source, context)
+            if not called:
+                return []
+            if target:
+                return self.member(target, name) or (self.member(target.companion, name) if target.companion else [])
+            owners = self.member_owners.get(name, ())
+            extensions = [f for f in self.functions(name, source, None) if f.receiver]
+            return extensions or (next(iter(owners)).methods[name] if len(owners) == 1 else [])
+        if called:
+            found = self.functions(name, source, context)
+            if found:
+                return found
+        if name[:1].isupper():
+            cls = self.resolve_class(name, source, context)
+            return [cls] if cls else []
+        return []
+
+    def edges_in(self, source, context, scope, start, end):
+        """Nodes reached from text[start:end], skipping code in deferred lambdas below scope"""
+        hits = self.file_hits(source)
+        targets = []
+        for offset, name, receiver, dotted, called, typed, stack in hits[bisect_left(hits, (start,)):]:
+            if offset >= end:
+                break
+            if typed and not called:
+                continue
+            if any(brace > scope and self.deferred(source, brace) for brace in stack):
+                continue
+            targets.extend(self.resolve_hit(name, receiver, dotted, called, source, context))
+        return targets
+
+    def edges(self, node):
+        if node in self._edges:
+            return self._edges[node]
+        targets = []
+        if isinstance(node, Method):
+            if node.owner:
+                targets.append(node.owner)
+            if node.body:
+                targets.extend(self.edges_in(node.source, node.owner, *node.body))
+        else:
+            source = node.source
+            if node.ctor:
+                targets.extend(self.edges_in(source, node, node.ctor[0], *node.ctor))
+            targets.extend(self.edges_in(source, node.outer, node.supertypes[0], *node.supertypes))
+            for start, end in self.class_level(node):
+                targets.extend(self.edges_in(source, node, node.body[0], start, end))
+            if node.companion:
+                targets.append(node.companion)
+        self._edges[node] = targets
+        return targets
+
+    @staticmethod
+    def class_level(cls):
+        """(start, end) ranges of a class body outside its funs and nested classes"""
+        if not cls.body:
+            return
+        position = cls.body[0] + 1
+        for start, end in sorted(cls.members_end) + [(cls.body[1], cls.body[1])]:
+            if start > position:
+                yield position, start
+            position = max(position, end)
+
+    def properties(self, cls):
+        """[(name, type)] of non-private properties with a getter: constructor vals and typed body vals"""
+        text = cls.source.structure
+        found = []
+        if cls.ctor:
+            found.extend((name, type_text) for name, type_text, _, _, is_property in
+                         parse_params(text[cls.ctor[0]:cls.ctor[1]]) if is_property)
+        matches = [match for start, end in self.class_level(cls) for match in PROPERTY_RE.finditer(text, start, end)]
+        for match, stack in zip(matches, enclosing_blocks(text, [match.start() for match in matches])):
+            modifiers = modifiers_before(text, match.start()).split()
+            if stack and stack[-1] == cls.body[0] and "private" not in modifiers and "const" not in modifiers:
+                found.append((match.group(1), match.group(2).split(" by ")[0].strip()))
+        return found
+
+    def walk(self, roots):
+        reached, queue = set(roots), list(roots)
+        while queue:
+            for target in self.edges(queue.pop()):
+                if target not in reached:
+                    reached.add(target)
+                    queue.append(target)
+        return reached
+
+    # Entry points
+
+    def manifest_classes(self):
+        """(Application class, launcher Activity class) named in the manifest"""
+        manifest = self.root / MANIFEST_PATH
+        if not manifest.exists():
+            return None, None
+        text = re.sub(r'<!--.*?-->', "", manifest.read_text(), flags=re.S)
+        application = APPLICATION_RE.search(text)
+        launcher = None
+        for match in ACTIVITY_RE.finditer(text):
+            if match.group(2) and "android.intent.category.LAUNCHER" in match.group(2):
+                launcher = NAME_ATTR_RE.search(match.group(1))
+                break
+        return (self.manifest_class(application.group(1)) if application else None,
+                self.manifest_class(launcher.group(1)) if launcher else None)
+
+    def manifest_class(self, name):
+        for qualified, cls in self.classes.items():
+            if qualified == name or (name.startswith(".") and qualified.endswith(name)):
+                return cls
+        return None
+
+    def start_destination(self):
+        """Nodes called from the NavHost's default start destination"""
+        for source in self.sources:
+            default = START_DESTINATION_RE.search(source.structure)
+            if not default:
+                continue
+            route = re.compile(r'\bcomposable\(\s*' + re.escape(default.group(1)) + r'\s*[,)]')
+            for other in self.sources:
+                entry = route.search(other.structure)
+                if not entry:
+                    continue
+                close = matching(other.structure, other.structure.rfind("(", 0, entry.end()))
+                brace = skip_space(other.structure, close + 1)
+                if not other.structure.startswith("{", brace):
+                    continue
+                end = matching(other.structure, brace)
+                context = next((hit for hit in self.methods if hit.source is other and hit.extent and
+                                hit.extent[0] < brace < hit.extent[1]), None)
+                return self.edges_in(other, context.owner if context else None, brace, brace + 1, end)
+        return []
+
+    def entry_points(self):
+        """[(label, on the cold-start path, root nodes)]"""
+        application, launcher = self.manifest_classes()
+        entries = []
+        for label, kind, name, startup in ENTRY_POINTS:
+            if kind == "application":
+                cls = application
+            elif kind == "launcher":
+                cls = launcher
+            elif kind == "activity":
+                cls = next((c for c in self.classes.values() if c.name == name), None)
+            if kind == "function":
+                roots = [m for m in self.methods if m.name == name and m.owner is None]
+            elif kind == "start-destination":
+                roots = self.start_destination()
+            else:
+                roots = [cls] + [m for lifecycle in LIFECYCLE_METHODS for m in cls.methods.get(lifecycle, ())] \
+                    if cls else []
+            entries.append((label, startup, roots))
+        return entries
+
+    # Profile rules
+
+    def rules(self, startup, feed):
+        """Sorted profile lines for the nodes reached on the cold-start path and from the job feed"""
+        by_class = {}
+
+        def add(owner, rule):
+            by_class.setdefault(owner, set()).add(rule)
+
+        for node in startup | feed:
+            flags = STARTUP_FLAGS if node in startup else FEED_FLAGS
+            if isinstance(node, Method):
+                if not node.body:
+                    continue
+                name, descriptor = self.signature(node)
+                add(node.jvm_owner, f"{flags}L{node.jvm_owner};->{name}{descriptor or '(**)**'}")
+                continue
+            add(node.jvm, None)
+            constructor = self.constructor_signature(node)
+            if constructor:
+                add(node.jvm, f"{flags}L{node.jvm};-><init>{constructor}")
+            if node.kind in ("object", "enum") or node.companion:
+                add(node.jvm, f"{flags}L{node.jvm};-><clinit>()V")
+            for name, type_text in self.properties(node):
+                descriptor = self.jvm_type(type_text, node.source, node, set())
+                if descriptor is None or descriptor[1:-1] in INLINE_CLASSES:
+                    continue
+                getter = name if re.match(r'is[A-Z]', name) else "get" + name[:1].upper() + name[1:]
+                add(node.jvm, f"{flags}L{node.jvm};->{getter}(){descriptor}")
+        lines = []
+        for owner in sorted(by_class):
+            lines.append(f"L{owner};")
+            lines.extend(sorted(rule for rule in by_class[owner] if rule))
+        return lines
+
+
+def read_rules(path):
+    """Rules in a profile file, without comments and blank lines"""
+    return [line.strip() for line in Path(path).read_text().splitlines()
+            if line.strip() and not line.lstrip().startswith("#")]
+
+
+def generate(root="."):
+    """Return (graph, entry points with reached nodes, startup nodes, feed nodes, rules)"""
+    graph = CallGraph(root).build()
+    entries, startup, feed = [], set(), set()
+    for label, on_startup, roots in graph.entry_points():
+        reached = graph.walk(roots)
+        entries.append((label, on_startup, roots, reached))
+        (startup if on_startup else feed).update(reached)
+    return graph, entries, startup, feed, graph.rules(startup, feed - startup)
+
+
+def add_arguments(parser):
+    parser.add_argument("--root", default=".", help="Android app root (default: current directory)")
+    parser.add_argument("--output", default=PROFILE_PATH, help=f"profile path under --root (default: {PROFILE_PATH})")
+    parser.add_argument("--write", action="store_true", help="write the generated profile to --output")
+    parser.add_argument("--check", action="store_true", help="exit 1 if --output is missing or out of sync")
+    parser.add_argument("--print", action="store_true", dest="print_rules", help="print the generated rules")
+
+
+def run(args):
+    print("🚀 RiggerHire Android App - Baseline Profile")
+    print("=" * 55)
+    graph, entries, startup, feed, rules = generate(args.root)
+    declared = [method for method in graph.methods if method.body]
+    print(f"✅ Indexed {len(declared)} methods in {len(graph.classes)} classes from {len(graph.sources)} files")
+
+    print("\n📍 ENTRY POINTS:")
+    for label, on_startup, roots, reached in entries:
+        if not roots:
+            print(f"   ⚠️  {label}: not found")
+            continue
+        methods = sum(1 for node in reached if isinstance(node, Method) and node.body)
+        path = "cold start" if on_startup else "job feed"
+        print(f"   • {label} ({path}): {methods} methods, {len(reached) - methods} classes")
+
+    reached = [node for node in startup | feed if isinstance(node, Method) and node.body]
+    classes = sum(1 for node in startup | feed if isinstance(node, ClassDecl))
+    exact = sum(1 for node in reached if graph.signature(node)[1])
+    print(f"\n✅ Reachable: {len(reached)} of {len(declared)} declared methods "
+          f"({100 * len(reached) // max(1, len(declared))}%) and {classes} classes; "
+          f"{exact} exact descriptors, {len(reached) - exact} wildcards")
+
+    output = Path(args.root) / args.output
+    if args.print_rules:
+        print()
+        print(PROFILE_HEADER + "\n".join(rules))
+    if args.write:
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(PROFILE_HEADER + "\n".join(rules) + "\n")
+        print(f"\n✅ Wrote {len(rules)} rules to {args.output}")
+        return 0
+
+    if not output.exists():
+        print(f"\n⚠️  {args.output} does not exist; run 'riggerhire baseline-profile --write'")
+        return 1 if args.check else 0
+    existing = read_rules(output)
+    existing_set, generated = set(existing), set(rules)
+    # Member rules also cover constructors, <clinit> and getters, so they outnumber reachable methods
+    member_rules = [rule for rule in rules if "->" in rule]
+    covered = sum(1 for rule in member_rules if rule in existing_set)
+    print(f"📄 {args.output} covers {covered} of {len(member_rules)} member rules "
+          f"({100 * covered // max(1, len(member_rules))}%) for methods, constructors, initialisers and getters")
+    missing = [rule for rule in rules if rule not in existing_set]
+    stale = [rule for rule in existing if rule not in generated]
+    if not missing and not stale:
+        print("✅ Profile is in sync with the call graph")
+        return 0
+    print(f"\n❌ OUT OF SYNC ({len(missing)} missing, {len(stale)} stale):")
+    for rule in missing:
+        print(f"   + {rule}")
+    for rule in stale:
+        print(f"   - {rule}")
+    print("\n💡 Run 'riggerhire baseline-profile --write' to update it")
+    return 1 if args.check else 0
@@ -0,0 +1,92 @@
+"""
+Start-up benchmark for the riggerhire CLI
+
+Times ``riggerhire <command> --help`` (or any given invocation) in fresh
+interpreters, subtracts a bare ``python -c pass`` baseline and fails when
+the import overhead exceeds the budget. The baseline is re-measured
+alongside every invocation, alternating runs, so load on a shared CI
+runner inflates both sides of the subtraction instead of one. CI runs this as the import-time
+budget test so hook invocations stay in the low tens of milliseconds.
+"""
+
+import os
+import shlex
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from riggerhire.cli import COMMANDS
+
+PACKAGE_PARENT = str(Path(__file__).resolve().parent.parent)
+DEFAULT_BUDGET_MS = 30.0
+
+
+def _env():
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [PACKAGE_PARENT, env.get("PYTHONPATH")]))
+    return env
+
+
+def best_wall_ms(cmds, runs, env):
+    """Best-of-N wall time in milliseconds of a fresh process for each command, run round-robin"""
+    best = [float("inf")] * len(cmds)
+    for _ in range(runs):
+        for index, cmd in enumerate(cmds):
+            start = time.perf_counter()
+            subprocess.run(cmd, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            best[index] = min(best[index], (time.perf_counter() - start) * 1000)
+    return best
+
+
+def slowest_imports(argv, env, limit):
+    """Parse -X importtime output and return the modules with the largest self time"""
+    result = subprocess.run([sys.executable, "-X", "importtime", "-m", "riggerhire", *argv],
+                            env=env, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, module = line[len("import time:"):].split("|", 2)
+        rows.append((int(self_us), int(cumulative_us), module.strip()))
+    rows.sort(reverse=True)
+    return rows[:limit]
+
+
+def add_arguments(parser):
+    parser.add_argument("invocations", nargs="*",
+                        help="invocations to time, e.g. \"verify app/src/.../MainActivity.kt\" "
+                             "(default: '<command> --help' for every command)")
+    parser.add_argument("--runs", type=int, default=10, help="runs per invocation, best is reported")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS,
+                        help=f"maximum import overhead above a bare interpreter (default: {DEFAULT_BUDGET_MS:.0f})")
+    parser.add_argument("--importtime", type=int, default=0, metavar="N",
+                        help="also list the N slowest imports of each invocation")
+
+
+def run(args):
+    env = _env()
+    invocations = [shlex.split(text) for text in args.invocations] or \
+        [[name, "--help"] for name in COMMANDS]
+
+    print(f"⏱️  Best of {args.runs} runs, each alternated with a bare interpreter")
+
+    over_budget = []
+    for argv in invocations:
+        baseline, total = best_wall_ms([[sys.executable, "-c", "pass"], [sys.executable, "-m", "riggerhire", *argv]],
+                                       args.runs, env)
+        overhead = total - baseline
+        label = "riggerhire " + " ".join(argv)
+        status = "✅" if overhead <= args.budget_ms else "❌"
+        print(f"{status} {label}: {total:.1f} ms total, {overhead:.1f} ms import overhead "
+              f"(bare interpreter {baseline:.1f} ms)")
+        if overhead > args.budget_ms:
+            over_budget.append(label)
+        for self_us, cumulative_us, module in slowest_imports(argv, env, args.importtime):
+            print(f"      {self_us / 1000:6.1f} ms self {cumulative_us / 1000:6.1f} ms cumulative  {module}")
+
+    if over_budget:
+        print(f"\n❌ {len(over_budget)} invocation(s) over the {args.budget_ms:.0f} ms import budget")
+        return 1
+    print(f"\n🎉 All invocations within the {args.budget_ms:.0f} ms import budget")
+    return 0
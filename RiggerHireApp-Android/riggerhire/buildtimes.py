@@ -0,0 +1,582 @@
+"""
+Gradle build-timing ingestion and slow-task report
+
+Ingests saved ``--profile`` HTML reports (build/reports/profile/*.html)
+and plain-console build logs into a local SQLite store, then reports the
+slowest tasks, configuration-time hotspots, cache-miss rates and trends
+across builds. Inputs are streamed: profile reports are fed to an
+incremental HTML parser in fixed-size chunks and logs are read line by
+line, so large CI logs never sit in memory.
+
+Profile reports carry per-task durations and outcomes; logs carry task
+outcomes, the actionable-task summary, total time and whether the
+configuration cache was reused. A log that points at a profile report
+("See the profiling report at: ...") is merged into that build.
+"""
+
+import os
+import re
+from html.parser import HTMLParser
+from pathlib import Path
+
+from riggerhire.kotlin import LazyPattern
+
+CHUNK_SIZE = 64 * 1024
+
+OUTCOMES = ("executed", "from-cache", "up-to-date", "no-source", "skipped", "no-work", "failed")
+PHASES = ("startup", "settings", "loading", "configuring", "transforms", "execution")
+PHASE_ROWS = {
+    "startup": "startup",
+    "settings and buildsrc": "settings",
+    "loading projects": "loading",
+    "configuring projects": "configuring",
+    "artifact transforms": "transforms",
+    "task execution": "execution",
+}
+
+DURATION_PART_RE = LazyPattern(r'([\d.]+)\s*(ms|h|m|s)(?![a-z])')
+STARTED_RE = LazyPattern(r'Started on:\s*(\d{4})/(\d{2})/(\d{2})\s*-\s*(\d{2}):(\d{2}):(\d{2})')
+PROFILED_RE = LazyPattern(r'Profiled build:\s*(.+)')
+TIMESTAMP_RE = LazyPattern(r'^\[?(\d{4}-\d{2}-\d{2})[T ](\d{2}:\d{2}:\d{2})')
+TASK_LINE_RE = LazyPattern(r'> Task (:\S*)(?:\s+(UP-TO-DATE|FROM-CACHE|NO-SOURCE|SKIPPED|FAILED))?\s*$')
+BUILD_RESULT_RE = LazyPattern(r'BUILD (SUCCESSFUL|FAILED) in (.+?)\s*$')
+ACTIONABLE_RE = LazyPattern(r'(\d+) actionable tasks?: (.+?)\s*$')
+PROFILE_LINK_RE = LazyPattern(r'See the profiling report at: \S*?(profile-[\w-]+\.html)')
+# (pattern, state, printed after the build result)
+CONFIG_CACHE_STATES = (
+    (LazyPattern(r'Reusing configuration cache'), "reused", False),
+    (LazyPattern(r'Calculating task graph as no (?:cached configuration|configuration cache) is available'),
+     "stored", False),
+    (LazyPattern(r'Configuration cache entry reused'), "reused", True),
+    (LazyPattern(r'Configuration cache entry stored'), "stored", True),
+    (LazyPattern(r'Configuration cache entry discarded'), "discarded", True),
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS builds (
+    id INTEGER PRIMARY KEY,
+    source TEXT NOT NULL,
+    digest TEXT NOT NULL UNIQUE,
+    kind TEXT NOT NULL,
+    report TEXT,
+    started TEXT,
+    requested TEXT,
+    result TEXT,
+    total REAL,
+    startup REAL, settings REAL, loading REAL, configuring REAL, transforms REAL, execution REAL,
+    config_cache TEXT
+);
+CREATE TABLE IF NOT EXISTS tasks (
+    build_id INTEGER NOT NULL REFERENCES builds(id) ON DELETE CASCADE,
+    path TEXT NOT NULL,
+    duration REAL,
+    outcome TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS configuration (
+    build_id INTEGER NOT NULL REFERENCES builds(id) ON DELETE CASCADE,
+    kind TEXT NOT NULL,
+    name TEXT NOT NULL,
+    duration REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS tasks_by_path ON tasks(path, outcome);
+CREATE INDEX IF NOT EXISTS configuration_by_name ON configuration(kind, name);
+"""
+
+
+def parse_duration(text):
+    """'1m2.35s' / '1m 23s' / '850ms' -> seconds, None for '-' or empty"""
+    parts = DURATION_PART_RE.findall(text)
+    if not parts:
+        return None
+    scale = {"h": 3600, "m": 60, "s": 1, "ms": 0.001}
+    return sum(float(value) * scale[unit] for value, unit in parts)
+
+
+def normalize_outcome(text):
+    text = text.replace("\xa0", " ").strip().lower()
+    if not text:
+        return "executed"
+    if text == "did no work":
+        return "no-work"
+    return text if text in OUTCOMES else "executed"
+
+
+def format_seconds(seconds):
+    if seconds is None:
+        return "-"
+    if seconds >= 60:
+        return f"{int(seconds // 60)}m{seconds % 60:04.1f}s"
+    return f"{seconds:.1f}s" if seconds >= 1 else f"{seconds * 1000:.0f}ms"
+
+
+def mtime_iso(path):
+    from datetime import datetime
+
+    return datetime.fromtimestamp(os.path.getmtime(path)).isoformat(timespec="seconds")
+
+
+def default_store_path():
+    base = os.environ.get("XDG_DATA_HOME") or os.path.join(os.path.expanduser("~"), ".local", "share")
+    return Path(base) / "riggerhire" / "build-times.sqlite"
+
+
+class ProfileParser(HTMLParser):
+    """Incremental parser for Gradle --profile reports
+
+    Rows are handed to on_row(section, cells) as soon as they close, so
+    only the current row is ever held.
+    """
+
+    def __init__(self, on_row):
+        super().__init__(convert_charrefs=True)
+        self.on_row = on_row
+        self.section = ""
+        self.in_heading = False
+        self.in_cell = False
+        self.cells = None
+        self.text = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "h2":
+            self.in_heading = True
+            self.text = []
+        elif tag == "tr":
+            self.cells = []
+        elif tag in ("td", "th") and self.cells is not None:
+            self.in_cell = True
+            self.text = []
+        elif tag == "p":
+            self.text = []
+
+    def handle_endtag(self, tag):
+        if tag == "h2" and self.in_heading:
+            self.section = "".join(self.text).strip().lower()
+            self.in_heading = False
+        elif tag in ("td", "th") and self.in_cell:
+            self.cells.append("".join(self.text).strip())
+            self.in_cell = False
+        elif tag == "tr" and self.cells is not None:
+            if self.cells:
+                self.on_row(self.section, self.cells)
+            self.cells = None
+        elif tag == "p" and not self.in_cell:
+            self.on_row("header", ["".join(self.text).strip()])
+
+    def handle_data(self, data):
+        self.text.append(data)
+
+
+class BuildRecord:
+    """One build being assembled from a profile report or a log"""
+
+    def __init__(self, source, kind):
+        self.source = source
+        self.kind = kind
+        self.report = None
+        self.started = None
+        self.requested = None
+        self.result = None
+        self.total = None
+        self.phases = {}
+        self.config_cache = None
+        self.tasks = []
+        self.configuration = []
+
+
+class BuildStore:
+    """SQLite store of normalised build timings"""
+
+    def __init__(self, path=None):
+        self.path = Path(path) if path else default_store_path()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        import sqlite3
+
+        self.db = sqlite3.connect(str(self.path))
+        self.db.execute("PRAGMA foreign_keys = ON")
+        self.db.executescript(SCHEMA)
+
+    def close(self):
+        self.db.commit()
+        self.db.close()
+
+    def has(self, digest):
+        return self.db.execute("SELECT 1 FROM builds WHERE digest = ?", (digest,)).fetchone() is not None
+
+    def add(self, record, digest):
+        """Insert a build, merging a log with the profile report it points at"""
+        db = self.db
+        if record.kind == "log" and record.report:
+            row = db.execute("SELECT id FROM builds WHERE kind = 'profile' AND report = ?",
+                             (record.report,)).fetchone()
+            if row:
+                db.execute("UPDATE builds SET config_cache = coalesce(?, config_cache), "
+                           "result = coalesce(result, ?) WHERE id = ?",
+                           (record.config_cache, record.result, row[0]))
+                db.execute("INSERT INTO builds (source, digest, kind, report) VALUES (?, ?, 'merged', ?)",
+                           (record.source, digest, record.report))
+                return row[0]
+        if record.kind == "profile":
+            row = db.execute("SELECT id, config_cache, result FROM builds WHERE kind = 'log' AND report = ?",
+                             (record.report,)).fetchone()
+            if row:
+                record.config_cache = record.config_cache or row[1]
+                record.result = record.result or row[2]
+                # Keep the log's row (and digest) so it is not ingested again, but drop its tasks
+                db.execute("DELETE FROM tasks WHERE build_id = ?", (row[0],))
+                db.execute("UPDATE builds SET kind = 'merged' WHERE id = ?", (row[0],))
+        cursor = db.execute(
+            "INSERT INTO builds (source, digest, kind, report, started, requested, result, total, "
+            + ", ".join(PHASES) + ", config_cache) VALUES (" + ", ".join("?" * (9 + len(PHASES))) + ")",
+            (record.source, digest, record.kind, record.report, record.started, record.requested,
+             record.result, record.total, *(record.phases.get(phase) for phase in PHASES), record.config_cache))
+        build_id = cursor.lastrowid
+        db.executemany("INSERT INTO tasks VALUES (?, ?, ?, ?)",
+                       ((build_id, path, duration, outcome) for path, duration, outcome in record.tasks))
+        db.executemany("INSERT INTO configuration VALUES (?, ?, ?, ?)",
+                       ((build_id, kind, name, duration) for kind, name, duration in record.configuration))
+        return build_id
+
+
+def file_digest(path):
+    import hashlib
+
+    digest = hashlib.sha1()
+    with open(path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def stream_chunks(path):
+    """Yield decoded text chunks of path"""
+    import codecs
+
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    with open(path, "rb") as handle:
+        while True:
+            chunk = handle.read(CHUNK_SIZE)
+            if not chunk:
+                break
+            yield decoder.decode(chunk)
+        yield decoder.decode(b"", final=True)
+
+
+def read_profile(path):
+    """Parse one --profile HTML report; yields a single BuildRecord"""
+    record = BuildRecord(str(path), "profile")
+    record.report = Path(path).name
+
+    def on_row(section, cells):
+        if section == "header" or not section:
+            text = cells[0]
+            started = STARTED_RE.search(text)
+            if started:
+                year, month, day, hour, minute, second = started.groups()
+                record.started = f"{year}-{month}-{day}T{hour}:{minute}:{second}"
+            profiled = PROFILED_RE.search(text)
+            if profiled:
+                record.requested = profiled.group(1).strip()
+            return
+        if len(cells) < 2 or cells[0].lower() in ("description", "project", "task", "configuration", "transform"):
+            return
+        name, duration = cells[0], parse_duration(cells[1])
+        if section == "summary":
+            if name.lower() == "total build time":
+                record.total = duration
+            elif name.lower() in PHASE_ROWS:
+                record.phases[PHASE_ROWS[name.lower()]] = duration
+        elif section == "configuration" and name != "All projects" and duration is not None:
+            record.configuration.append(("project", name, duration))
+        elif section == "dependency resolution" and name != "All configurations" and duration is not None:
+            record.configuration.append(("resolution", name, duration))
+        elif section == "task execution":
+            result = cells[2] if len(cells) > 2 else ""
+            if result.strip() != "(total)":
+                record.tasks.append((name, duration, normalize_outcome(result)))
+
+    parser = ProfileParser(on_row)
+    for chunk in stream_chunks(path):
+        parser.feed(chunk)
+    parser.close()
+    if record.started is None:
+        record.started = mtime_iso(path)
+    yield record
+
+
+def iter_lines(path):
+    pending = ""
+    for chunk in stream_chunks(path):
+        lines = (pending + chunk).split("\n")
+        pending = lines.pop()
+        yield from lines
+    if pending:
+        yield pending
+
+
+def read_log(path):
+    """Parse a plain-console Gradle log; yields one BuildRecord per 'BUILD ... in' line
+
+    Gradle prints the actionable-task summary, the stored-configuration-cache
+    notice and the profile link after the build result, so a finished build
+    is held back, collecting those lines, until the next build's first task.
+    """
+    record = BuildRecord(str(path), "log")
+    finished = None
+    fallback_start = mtime_iso(path)
+    for line in iter_lines(path):
+        trailing = finished if finished is not None else record
+        stamp = TIMESTAMP_RE.match(line)
+        if stamp and record.started is None:
+            record.started = f"{stamp.group(1)}T{stamp.group(2)}"
+        task = TASK_LINE_RE.search(line)
+        if task:
+            if finished is not None:
+                yield finished
+                finished = None
+            record.tasks.append((task.group(1), None, normalize_outcome(task.group(2) or "")))
+            continue
+        for pattern, state, after_result in CONFIG_CACHE_STATES:
+            if pattern.search(line):
+                (trailing if after_result else record).config_cache = state
+        link = PROFILE_LINK_RE.search(line)
+        if link:
+            trailing.report = link.group(1)
+        actionable = ACTIONABLE_RE.search(line)
+        if actionable and not trailing.tasks:
+            # Rich console output hides task lines; fall back to the summary counts
+            for count, outcome in re.findall(r'(\d+) ([\w -]+?)(?:,|$)', actionable.group(2)):
+                outcome = normalize_outcome(outcome.strip().replace(" ", "-"))
+                trailing.tasks.extend(("(unnamed)", None, outcome) for _ in range(int(count)))
+        result = BUILD_RESULT_RE.search(line)
+        if result:
+            record.result = result.group(1).lower()
+            record.total = parse_duration(result.group(2))
+            record.started = record.started or fallback_start
+            if finished is not None:
+                yield finished
+            finished, record = record, BuildRecord(str(path), "log")
+    if finished is not None:
+        yield finished
+
+
+def iter_inputs(paths):
+    """Expand directories to the profile reports and logs below them"""
+    for path in map(Path, paths):
+        if path.is_dir():
+            yield from sorted(path.glob("**/profile-*.html"))
+            yield from sorted(p for p in path.glob("**/*.log") if p.is_file())
+        else:
+            yield path
+
+
+def ingest(store, paths):
+    """Add every new input to the store; returns (ingested, skipped) counts
+
+    Files are hashed first so re-ingesting a report or log is a no-op, then
+    parsed in a second streaming pass that stores each build as it completes.
+    """
+    ingested = skipped = 0
+    for path in iter_inputs(paths):
+        reader = read_profile if path.suffix.lower() in (".html", ".htm") else read_log
+        try:
+            key = file_digest(path)
+            if store.has(key):
+                skipped += 1
+                continue
+            count = 0
+            for record in reader(path):
+                store.add(record, key if count == 0 else f"{key}:{count}")
+                count += 1
+        except OSError as e:
+            print(f"❌ {path}: {e}")
+            store.db.rollback()
+            continue
+        store.db.commit()
+        ingested += 1
+        if count:
+            print(f"✅ {path.name}: {count} build(s)")
+        else:
+            print(f"⚠️  {path.name}: no completed builds found")
+    return ingested, skipped
+
+
+def _median(values):
+    import statistics
+
+    values = [v for v in values if v is not None]
+    return statistics.median(values) if values else None
+
+
+def _change(before, after):
+    if not before or after is None:
+        return ""
+    delta = (after - before) * 100 / before
+    arrow = "▲" if delta > 5 else "▼" if delta < -5 else "≈"
+    return f"{arrow} {delta:+.0f}%"
+
+
+class BuildReport:
+    """Queries over the store; each print_* method prints one section"""
+
+    def __init__(self, store, last=10, top=10):
+        self.db = store.db
+        self.last = last
+        self.top = top
+        self.builds = self.db.execute(
+            "SELECT id, started, requested, total, configuring, execution, config_cache, result, kind "
+            "FROM builds WHERE kind != 'merged' ORDER BY started, id").fetchall()
+
+    def print_trend(self):
+        print(f"\n📈 Builds ({len(self.builds)} stored, last {min(self.last, len(self.builds))} shown):")
+        print(f"   {'started':<20}{'total':>9}{'config':>9}{'tasks':>9}  {'cache miss':>10}  "
+              f"{'cfg cache':<10}requested")
+        for build_id, started, requested, total, configuring, execution, config_cache, result, kind in \
+                self.builds[-self.last:]:
+            counts = dict(self.db.execute("SELECT outcome, count(*) FROM tasks WHERE build_id = ? GROUP BY outcome",
+                                          (build_id,)).fetchall())
+            miss = self._miss_rate(counts.get("executed", 0), counts.get("from-cache", 0))
+            failed = " ❌" if result == "failed" else ""
+            print(f"   {started or '?':<20}{format_seconds(total):>9}{format_seconds(configuring):>9}"
+                  f"{format_seconds(execution):>9}  {miss:>10}  {config_cache or '-':<10}{requested or kind}{failed}")
+        totals = [row[3] for row in self.builds if row[3] is not None]
+        if len(totals) >= 4:
+            half = len(totals) // 2
+            before, after = _median(totals[:half]), _median(totals[half:])
+            print(f"\n   Median total: {format_seconds(before)} (older half) → {format_seconds(after)} "
+                  f"(newer half) {_change(before, after)}")
+
+    @staticmethod
+    def _miss_rate(executed, from_cache):
+        return f"{executed * 100 / (executed + from_cache):.0f}%" if executed + from_cache else "-"
+
+    def print_slowest_tasks(self):
+        rows = self.db.execute(
+            "SELECT path, group_concat(duration), count(*) FROM ("
+            "SELECT t.path, t.duration FROM tasks t JOIN builds b ON b.id = t.build_id "
+            "WHERE t.outcome = 'executed' AND t.duration IS NOT NULL ORDER BY b.started, b.id) "
+            "GROUP BY path").fetchall()
+        if not rows:
+            return
+        ranked = []
+        for path, durations, runs in rows:
+            values = [float(v) for v in durations.split(",")]
+            ranked.append((_median(values), max(values), sum(values), runs, path, values))
+        ranked.sort(key=lambda item: -item[2])
+        print(f"\n🐢 Slowest tasks (executed runs, by total time):")
+        for median, worst, total, runs, path, values in ranked[:self.top]:
+            trend = _change(_median(values[:-1]), values[-1]) if len(values) > 1 else ""
+            print(f"   • {path}: median {format_seconds(median)}, max {format_seconds(worst)}, "
+                  f"{runs} run(s), {format_seconds(total)} total {trend}".rstrip())
+
+    def print_configuration(self):
+        rows = self.db.execute(
+            "SELECT kind, name, group_concat(duration), count(*) FROM configuration GROUP BY kind, name").fetchall()
+        phase = [row[4] for row in self.builds if row[4] is not None]
+        totals = [(row[4], row[3]) for row in self.builds if row[4] is not None and row[3]]
+        if not rows and not phase:
+            return
+        print(f"\n⚙️  Configuration time:")
+        if phase:
+            share = sum(c for c, _ in totals) * 100 / sum(t for _, t in totals) if totals else 0
+            print(f"   • Configuring projects: median {format_seconds(_median(phase))} ({share:.0f}% of build time)")
+        ranked = sorted(((_median(float(v) for v in durations.split(",")), kind, name, runs)
+                         for kind, name, durations, runs in rows), reverse=True)
+        for median, kind, name, runs in ranked[:self.top]:
+            label = "project" if kind == "project" else "resolve"
+            name = "(root)" if name == ":" else name
+            print(f"   • {label} {name}: median {format_seconds(median)} over {runs} build(s)")
+
+    def print_cache_misses(self):
+        overall = dict(self.db.execute(
+            "SELECT outcome, count(*) FROM tasks t JOIN builds b ON b.id = t.build_id "
+            "WHERE b.kind != 'merged' GROUP BY outcome").fetchall())
+        if not overall:
+            return
+        executed, from_cache = overall.get("executed", 0), overall.get("from-cache", 0)
+        avoided = sum(overall.get(outcome, 0) for outcome in ("from-cache", "up-to-date", "no-source", "skipped"))
+        total = sum(overall.values())
+        print(f"\n🗄️  Build cache:")
+        print(f"   • Cache miss rate: {self._miss_rate(executed, from_cache)} "
+              f"({executed} executed, {from_cache} from cache)")
+        print(f"   • Work avoided: {avoided * 100 / total:.0f}% of {total} task runs "
+              f"({overall.get('up-to-date', 0)} up-to-date)")
+        # Tasks that have come from the cache at least once are cacheable; rank their misses
+        rows = self.db.execute(
+            "SELECT path, sum(outcome = 'executed'), sum(outcome = 'from-cache'), "
+            "sum(CASE WHEN outcome = 'executed' THEN coalesce(duration, 0) END) FROM tasks "
+            "WHERE path != '(unnamed)' GROUP BY path HAVING sum(outcome = 'from-cache') > 0 "
+            "AND sum(outcome = 'executed') > 0 ORDER BY 4 DESC, 2 DESC LIMIT ?", (self.top,)).fetchall()
+        if rows:
+            print("   Cacheable tasks that still miss:")
+            for path, misses, hits, cost in rows:
+                spent = f", {format_seconds(cost)} spent" if cost else ""
+                print(f"   • {path}: {misses} miss(es), {hits} hit(s){spent}")
+
+    def print_configuration_cache(self, properties):
+        states = {}
+        for row in self.builds:
+            if row[6]:
+                states.setdefault(row[6], []).append(row)
+        enabled = properties.get("org.gradle.configuration-cache") == "true"
+        if not states and not enabled:
+            return
+        print(f"\n♻️  Configuration cache ({'enabled' if enabled else 'not enabled'} in gradle.properties):")
+        if not states:
+            print("   • No ingested log reports configuration cache state; ingest plain-console logs to compare")
+            return
+        for state, rows in sorted(states.items()):
+            configuring = _median(row[4] for row in rows)
+            total = _median(row[3] for row in rows)
+            print(f"   • {state}: {len(rows)} build(s), median total {format_seconds(total)}"
+                  f"{', configuring ' + format_seconds(configuring) if configuring is not None else ''}")
+        if "reused" in states and len(states) > 1:
+            reused = _median(row[3] for row in states["reused"])
+            others = _median(row[3] for state, rows in states.items() if state != "reused" for row in rows)
+            if reused is not None and others:
+                print(f"   • Reused builds are {_change(others, reused)} vs builds that stored or discarded it")
+
+
+def read_gradle_properties(root):
+    properties = {}
+    path = Path(root) / "gradle.properties"
+    if path.exists():
+        for line in path.read_text().splitlines():
+            key, sep, value = line.partition("=")
+            if sep and not key.lstrip().startswith("#"):
+                properties[key.strip()] = value.strip()
+    return properties
+
+
+def add_arguments(parser):
+    parser.add_argument("inputs", nargs="*", metavar="PATH",
+                        help="--profile HTML reports, Gradle logs, or directories holding them, to ingest")
+    parser.add_argument("--root", default=".", help="Android app root (default: current directory)")
+    parser.add_argument("--store", help=f"SQLite store (default: {default_store_path()})")
+    parser.add_argument("--top", type=int, default=10, help="rows to show per ranking")
+    parser.add_argument("--last", type=int, default=10, help="builds to show in the trend table")
+    parser.add_argument("--no-report", action="store_true", help="only ingest, print no report")
+
+
+def run(args):
+    print("⏱️  RiggerHire Android App - Build Times")
+    print("=" * 55)
+    store = BuildStore(args.store)
+    try:
+        if args.inputs:
+            ingested, skipped = ingest(store, args.inputs)
+            print(f"📥 Ingested {ingested} file(s), {skipped} already stored")
+        if args.no_report:
+            return 0
+        report = BuildReport(store, args.last, args.top)
+        if not report.builds:
+            print(f"\n⚠️  No builds stored in {store.path}; run Gradle with --profile and ingest "
+                  f"build/reports/profile")
+            return 0
+        report.print_trend()
+        report.print_slowest_tasks()
+        report.print_configuration()
+        report.print_cache_misses()
+        report.print_configuration_cache(read_gradle_properties(args.root))
+    finally:
+        store.close()
+    return 0
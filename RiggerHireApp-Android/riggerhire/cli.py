@@ -0,0 +1,65 @@
+"""
+riggerhire console entry point
+
+Dispatches to subcommands without importing any of them up front. Each
+subcommand module exposes ``add_arguments(parser)`` and ``run(args)``;
+only the module for the invoked subcommand is loaded, so
+``riggerhire verify --help`` pays for the verifier and argparse alone.
+"""
+
+import sys
+
+# name -> (module, one-line help). Keep this table import-free.
+COMMANDS = {
+    "verify": ("riggerhire.verify", "Check that all app components work together"),
+    "demo": ("riggerhire.demo", "Print or generate app overviews from the real project files"),
+    "room": ("riggerhire.room", "Flag Room queries that full-scan unindexed columns or return unbounded lists"),
+    "footprint": ("riggerhire.footprint", "Estimate heap and parcel size of data classes and list pages"),
+    "apk-size": ("riggerhire.apksize", "Attribute APK/AAB bytes from the zip central directory and enforce budgets"),
+    "build-times": ("riggerhire.buildtimes", "Rank slow Gradle tasks and cache misses from --profile reports and logs"),
+    "resources": ("riggerhire.resources", "Find unused resources (with byte cost) and references to missing ones"),
+    "baseline-profile": ("riggerhire.baselineprofile", "Derive a Baseline Profile from the static startup call graph"),
+    "bench": ("riggerhire.bench", "Measure CLI start-up time against an import-time budget"),
+}
+
+
+def usage():
+    from riggerhire import __version__
+
+    lines = [
+        f"usage: riggerhire <command> [options]   (riggerhire {__version__})",
+        "",
+        "commands:",
+    ]
+    width = max(len(name) for name in COMMANDS)
+    for name, (_, summary) in COMMANDS.items():
+        lines.append(f"  {name.ljust(width)}  {summary}")
+    lines.append("")
+    lines.append("Run 'riggerhire <command> --help' for command options.")
+    return "\n".join(lines) + "\n"
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else list(argv)
+
+    if not argv or argv[0] in ("-h", "--help"):
+        sys.stdout.write(usage())
+        return 0
+    if argv[0] == "--version":
+        from riggerhire import __version__
+        print(f"riggerhire {__version__}")
+        return 0
+
+    name, rest = argv[0], argv[1:]
+    if name not in COMMANDS:
+        sys.stderr.write(f"riggerhire: unknown command '{name}'\n\n{usage()}")
+        return 2
+
+    from importlib import import_module
+    import argparse
+
+    module_name, summary = COMMANDS[name]
+    module = import_module(module_name)
+    parser = argparse.ArgumentParser(prog=f"riggerhire {name}", description=summary)
+    module.add_arguments(parser)
+    return module.run(parser.parse_args(rest)) or 0
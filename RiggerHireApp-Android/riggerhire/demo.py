@@ -0,0 +1,638 @@
+#!/usr/bin/env python3
+"""
+🏗️ RiggerHire Android App Demo Script
+
+This script demonstrates the enterprise-grade Android application
+for Australia's Premier Rigging Jobs Platform.
+
+Features:
+- Dark neon theme with cyan/magenta gradients
+- Jetpack Compose UI with Material Design 3
+- Enterprise-grade architecture and security
+- Mining industry-specific functionality
+- Mobile-optimized for field work
+
+The tech stack and project tree are introspected from the real Gradle
+files and source tree, and cached in a snapshot keyed by mtime so that
+overviews for every app in the monorepo can be regenerated in one run.
+Only the RiggerHire module gets the hand-written feature and industry
+sections; every other app's features are derived from the libraries and
+permissions it declares.
+json and html are imported where used to keep ``riggerhire demo`` start-up
+cheap.
+"""
+
+import argparse
+import os
+import re
+import sys
+from datetime import datetime
+from pathlib import Path
+
+SNAPSHOT_VERSION = 2
+
+# Directories never worth walking for an overview
+SKIP_DIRS = {".git", ".gradle", ".idea", ".cxx", "build", "node_modules", "__pycache__", ".venv", "venv"}
+
+# Files shown in the project tree; everything else (images, binaries) is omitted
+TREE_SUFFIXES = (".kt", ".kts", ".java", ".gradle", ".xml", ".pro", ".md", ".yml", ".py")
+TREE_NAMES = {"Fastfile", "Appfile", "gradlew"}
+
+BUILD_FILES = ("settings.gradle", "settings.gradle.kts", "build.gradle", "build.gradle.kts",
+               "app/build.gradle", "app/build.gradle.kts", "gradle.properties")
+MANIFEST_FILE = "app/src/main/AndroidManifest.xml"
+
+# Application id of the module the hand-written overview describes
+RIGGERHIRE_APP_ID = "com.tiation.riggerhire"
+
+EXT_VERSION_RE = re.compile(r'\b(\w+_version)\s*=\s*[\'"]([^\'"\s]+)[\'"]')
+DEPENDENCY_RE = re.compile(r'[\'"]([\w.\-]+):([\w.\-]+)(?::([\w.\-]+))?[\'"]')
+SDK_RE = re.compile(r'\b(minSdk|targetSdk|compileSdk)(?:Version)?\s*=?\s*(\d+)')
+VERSION_NAME_RE = re.compile(r'\bversionName\s*=?\s*"([^"]+)"')
+PROJECT_NAME_RE = re.compile(r'rootProject\.name\s*=\s*[\'"]([^\'"]+)[\'"]')
+APPLICATION_ID_RE = re.compile(r'\bapplicationId\s*=?\s*[\'"]([\w.]+)[\'"]')
+PERMISSION_RE = re.compile(r'<uses-permission\b[^>]*?android:name="(?:android\.permission\.)?([\w.]+)"')
+ACTIVITY_RE = re.compile(r'<activity\b[^>]*?android:name="([\w.$]+)"')
+
+# Features inferred from declared dependencies: (coordinate prefix, feature)
+DEPENDENCY_FEATURES = (
+    ("androidx.compose", "🎨 Jetpack Compose UI"),
+    ("androidx.navigation", "🧭 Multi-screen navigation"),
+    ("androidx.room", "💾 Offline storage with Room"),
+    ("androidx.work", "🔄 Background sync with WorkManager"),
+    ("androidx.biometric", "👆 Biometric unlock"),
+    ("com.squareup.retrofit2", "🌐 REST API client (Retrofit)"),
+    ("com.stripe", "💳 Stripe payments"),
+    ("com.auth0.android:jwtdecode", "🔑 JWT authentication"),
+    ("com.google.firebase:firebase-auth", "🔐 Firebase Authentication"),
+    ("com.google.firebase:firebase-firestore", "☁️ Cloud Firestore data sync"),
+    ("com.google.firebase:firebase-messaging", "⚡ Push notifications (Firebase Cloud Messaging)"),
+    ("com.google.firebase:firebase-analytics", "📊 Firebase Analytics"),
+    ("com.google.firebase:firebase-crashlytics", "🚨 Crash reporting (Crashlytics)"),
+    ("com.google.android.gms:play-services-location", "📍 Fused location provider"),
+    ("io.coil-kt", "🖼️ Image loading (Coil)"),
+)
+# Tech stack rows shown for apps other than RiggerHire, with the dependency prefix that
+# must be declared for the row to apply (None: always derived from the build files)
+DETECTED_STACK_ROWS = {
+    "Language": None,
+    "UI Framework": "androidx.compose",
+    "Android Gradle Plugin": None,
+    "SDK Levels": None,
+    "Networking": "com.squareup.retrofit2",
+    "Database": "androidx.room",
+    "Payment": "com.stripe",
+    "Analytics": "com.google.firebase",
+    "App Version": None,
+}
+# Features inferred from manifest permissions
+PERMISSION_FEATURES = {
+    "ACCESS_FINE_LOCATION": "📍 GPS location",
+    "CAMERA": "📷 Camera capture",
+    "RECORD_AUDIO": "🎙️ Audio recording",
+    "USE_BIOMETRIC": "👆 Biometric unlock",
+    "POST_NOTIFICATIONS": "⚡ Notifications",
+    "BLUETOOTH_CONNECT": "📶 Bluetooth devices",
+    "NFC": "📳 NFC",
+}
+
+
+def _read(path):
+    try:
+        return path.read_text(encoding="utf-8", errors="replace")
+    except OSError:
+        return ""
+
+
+def _mtime(path):
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def is_android_app(path):
+    """A directory is an app root if it has Gradle settings and an app module"""
+    return (any((path / name).is_file() for name in ("settings.gradle", "settings.gradle.kts"))
+            and any((path / "app" / name).is_file() for name in ("build.gradle", "build.gradle.kts")))
+
+
+def discover_apps(monorepo_root):
+    """Find every Android app root below monorepo_root without descending into apps"""
+    apps = []
+    stack = [str(monorepo_root)]
+    while stack:
+        current = stack.pop()
+        if is_android_app(Path(current)):
+            apps.append(Path(current))
+            continue
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if entry.name in SKIP_DIRS or entry.name.startswith("."):
+                        continue
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+        except OSError:
+            continue
+    return sorted(apps)
+
+
+def walk_tree(app_root, max_depth=8):
+    """Walk app_root with os.scandir and return (tree lines, {dir: mtime_ns})
+
+    Chains of single-child directories (Java package paths) are collapsed
+    into one line, the same way the hand-drawn overview used to show them.
+    """
+    dir_stamps = {}
+    lines = [f"{app_root.name}/"]
+
+    def scan(path):
+        dirs, files = [], []
+        try:
+            dir_stamps[path] = os.stat(path).st_mtime_ns
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in SKIP_DIRS:
+                            dirs.append(entry)
+                    elif entry.name.endswith(TREE_SUFFIXES) or entry.name in TREE_NAMES:
+                        files.append(entry.name)
+        except OSError:
+            pass
+        dirs.sort(key=lambda e: e.name)
+        files.sort()
+        return dirs, files
+
+    def visit(path, prefix, depth):
+        dirs, files = scan(path)
+        children = [(d, True) for d in dirs] + [(f, False) for f in files]
+        for index, (child, is_dir) in enumerate(children):
+            last = index == len(children) - 1
+            branch = "└── " if last else "├── "
+            if not is_dir:
+                lines.append(f"{prefix}{branch}{child}")
+                continue
+            label, target = child.name, child.path
+            # Collapse package chains like com/tiation/riggerhire
+            while True:
+                sub_dirs, sub_files = scan(target)
+                if len(sub_dirs) == 1 and not sub_files:
+                    label = f"{label}/{sub_dirs[0].name}"
+                    target = sub_dirs[0].path
+                else:
+                    break
+            lines.append(f"{prefix}{branch}{label}/")
+            if depth < max_depth:
+                visit(target, prefix + ("    " if last else "│   "), depth + 1)
+
+    visit(str(app_root), "", 1)
+    return lines, dir_stamps
+
+
+def parse_gradle(app_root):
+    """Extract project name, versions and SDK levels from the real Gradle files"""
+    versions = {}
+    dependencies = {}
+    sdk = {}
+    name = app_root.name
+    version_name = None
+    application_id = None
+
+    for relative in BUILD_FILES:
+        content = _read(app_root / relative)
+        if not content:
+            continue
+        match = PROJECT_NAME_RE.search(content)
+        if match:
+            name = match.group(1)
+        for key, value in EXT_VERSION_RE.findall(content):
+            versions[key] = value
+        for group, artifact, version in DEPENDENCY_RE.findall(content):
+            # BOM-managed dependencies have no version but still count as declared
+            if not dependencies.get(f"{group}:{artifact}"):
+                dependencies[f"{group}:{artifact}"] = version or None
+        for key, value in SDK_RE.findall(content):
+            sdk[key] = value
+        match = VERSION_NAME_RE.search(content)
+        if match:
+            version_name = match.group(1)
+        match = APPLICATION_ID_RE.search(content)
+        if match:
+            application_id = match.group(1)
+
+    return {
+        "name": name,
+        "application_id": application_id,
+        "version_name": version_name,
+        "versions": versions,
+        "dependencies": dependencies,
+        "sdk": sdk,
+    }
+
+
+def parse_manifest(app_root):
+    """Permissions and activities declared in the app module's manifest"""
+    content = _read(app_root / MANIFEST_FILE)
+    return {
+        "permissions": sorted(set(PERMISSION_RE.findall(content))),
+        "activities": ACTIVITY_RE.findall(content),
+    }
+
+
+def introspect_app(app_root):
+    """Build a fresh metadata snapshot for one app"""
+    app_root = Path(app_root)
+    snapshot = parse_gradle(app_root)
+    snapshot["manifest"] = parse_manifest(app_root)
+    tree, dir_stamps = walk_tree(app_root)
+    stamps = dict(dir_stamps)
+    for relative in BUILD_FILES + (MANIFEST_FILE,):
+        path = str(app_root / relative)
+        stamps[path] = _mtime(path)
+    snapshot["tree"] = tree
+    snapshot["stamps"] = stamps
+    return snapshot
+
+
+def default_cache_path():
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(base) / "riggerhire" / "overview-snapshot.json"
+
+
+class SnapshotCache:
+    """mtime-invalidated snapshot of introspected app metadata"""
+
+    def __init__(self, path=None):
+        self.path = Path(path) if path else default_cache_path()
+        self.entries = {}
+        self.dirty = False
+        self.hits = 0
+        self.misses = 0
+        self._load()
+
+    def _load(self):
+        import json
+
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if data.get("version") == SNAPSHOT_VERSION:
+            self.entries = data.get("apps", {})
+
+    @staticmethod
+    def is_fresh(snapshot):
+        return all(_mtime(path) == stamp for path, stamp in snapshot.get("stamps", {}).items())
+
+    def get(self, app_root):
+        key = str(Path(app_root).resolve())
+        snapshot = self.entries.get(key)
+        if snapshot is not None and self.is_fresh(snapshot):
+            self.hits += 1
+            return snapshot
+        self.misses += 1
+        snapshot = introspect_app(key)
+        self.entries[key] = snapshot
+        self.dirty = True
+        return snapshot
+
+    def save(self):
+        if not self.dirty:
+            return
+        import json
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(".tmp")
+            tmp.write_text(json.dumps({"version": SNAPSHOT_VERSION, "apps": self.entries}), encoding="utf-8")
+            os.replace(tmp, self.path)
+            self.dirty = False
+        except OSError as e:
+            print(f"⚠️  Could not write overview cache {self.path}: {e}", file=sys.stderr)
+
+
+class RiggerHireDemo:
+    def __init__(self, app_root=None, snapshot=None):
+        self.app_root = Path(app_root) if app_root else Path.cwd()
+        self.snapshot = snapshot if snapshot is not None else introspect_app(self.app_root)
+        self.app_name = self.snapshot.get("name") or "RiggerHire Android"
+        self.is_riggerhire = (self.snapshot.get("application_id") or "").startswith(RIGGERHIRE_APP_ID)
+        self.theme = "Dark Neon with Cyan/Magenta Gradients"
+        self.target_industry = "Mining, Construction & Industrial"
+
+    def _version(self, key):
+        return self.snapshot["versions"].get(key)
+
+    def _dependency(self, coordinate):
+        return self.snapshot["dependencies"].get(coordinate)
+
+    def _declares(self, prefix):
+        return prefix is None or any(coordinate.startswith(prefix) for coordinate in self.snapshot["dependencies"])
+
+    @staticmethod
+    def _with_version(label, version):
+        return f"{label} {version}" if version else label
+
+    def features(self):
+        if not self.is_riggerhire:
+            return self.derived_features()
+        return [
+            "🔍 Smart Job Matching - AI-powered algorithm for job recommendations",
+            "📍 GPS-Based Discovery - Location-aware job searching",
+            "💰 Transparent Pricing - Upfront salary and rate information",
+            "📋 Certification Management - Digital certificate verification",
+            "⚡ Instant Notifications - Real-time job alerts",
+            "💳 Fast Payment - Stripe integration for secure transactions",
+            "🔐 JWT Authentication - Enterprise-grade security",
+            "📊 Analytics Dashboard - Firebase integration for insights",
+            "🌙 Dark Neon UI - Optimized for outdoor mining environments"
+        ]
+
+    def derived_features(self):
+        """Features implied by the dependencies and permissions the app declares"""
+        features = []
+        for prefix, feature in DEPENDENCY_FEATURES:
+            if self._declares(prefix):
+                features.append(feature)
+        manifest = self.snapshot.get("manifest", {})
+        for permission in manifest.get("permissions", []):
+            feature = PERMISSION_FEATURES.get(permission)
+            if feature and feature not in features:
+                features.append(feature)
+        if "INTERNET" in manifest.get("permissions", []) and not any("🌐" in f for f in features):
+            features.append("🌐 Network access")
+        if manifest.get("activities"):
+            features.append(f"📱 {len(manifest['activities'])} activities declared in the manifest")
+        return features or ["No libraries or permissions with a known feature were found"]
+
+    def tech_stack(self):
+        """Tech stack with versions taken from build.gradle rather than hardcoded"""
+        sdk = self.snapshot["sdk"]
+        compose = self._with_version("Jetpack Compose", self._version("compose_version"))
+        bom = self._dependency("androidx.compose:compose-bom")
+        if bom:
+            compose += f" (BOM {bom})"
+        stack = {
+            "Language": self._with_version("Kotlin", self._version("kotlin_version")),
+            "UI Framework": compose,
+            "Android Gradle Plugin": self._dependency("com.android.tools.build:gradle") or "unknown",
+            "SDK Levels": (f"min {sdk.get('minSdk', '?')} / target {sdk.get('targetSdk', '?')}"
+                           f" / compile {sdk.get('compileSdk', '?')}"),
+            "Architecture": "MVVM with Android Architecture Components",
+            "Design System": "Material Design 3 + Custom Dark Neon Theme",
+            "Networking": self._with_version("Retrofit", self._dependency("com.squareup.retrofit2:retrofit")) + " with OkHttp",
+            "Authentication": "JWT tokens with encrypted storage",
+            "Database": self._with_version("Room", self._dependency("androidx.room:room-runtime")) + " (SQLite) + SharedPreferences",
+            "Payment": self._with_version("Stripe SDK", self._dependency("com.stripe:stripe-android")),
+            "Analytics": self._with_version("Firebase Analytics & Crashlytics", self._dependency("com.google.firebase:firebase-bom")),
+            "CI/CD": "GitHub Actions + Fastlane",
+            "Testing": "JUnit + Espresso + Compose UI Tests"
+        }
+        if self.snapshot.get("version_name"):
+            stack["App Version"] = self.snapshot["version_name"]
+        if not self.is_riggerhire:
+            stack = {key: value for key, value in stack.items()
+                     if key in DETECTED_STACK_ROWS and self._declares(DETECTED_STACK_ROWS[key])}
+        return stack
+
+    def architecture(self):
+        return """
+┌─────────────────────────────────────────┐
+│                UI Layer                 │
+│  (Jetpack Compose + Material Design 3) │
+└─────────────┬───────────────────────────┘
+              │
+┌─────────────▼───────────────────────────┐
+│             ViewModel                   │
+│        (MVVM Architecture)              │
+└─────────────┬───────────────────────────┘
+              │
+┌─────────────▼───────────────────────────┐
+│           Repository                    │
+│     (Data Abstraction Layer)           │
+└─────────────┬───────────────────────────┘
+              │
+┌─────────────▼───────────────────────────┐
+│          Data Sources                   │
+│  • Remote API (Retrofit)               │
+│  • Local Database (Room)               │
+│  • SharedPreferences                   │
+└─────────────────────────────────────────┘
+"""
+
+    def project_structure(self):
+        return "\n".join(self.snapshot["tree"])
+
+    def industry_focus(self):
+        return [
+            "🏗️ Rigging & Construction Jobs - Specialized for mining equipment",
+            "⛏️ Pilbara Region Coverage - Western Australia mining focus",
+            "🔧 Equipment Certification - Crane, dogman, rigger certifications",
+            "🚧 Safety Compliance - Mining safety standards integration",
+            "📍 Remote Location Support - GPS for isolated mining sites",
+            "💪 Physical Work Focus - Job matching for physical capabilities",
+            "🌙 Outdoor Optimized UI - Dark theme for bright mining environments",
+            "🚛 Heavy Industry Integration - Equipment and machinery focus"
+        ]
+
+    def mobile_optimizations(self):
+        return [
+            "🌙 Dark Neon Theme - Reduces eye strain in bright conditions",
+            "🔋 Battery Optimization - Efficient background processing",
+            "📡 Offline Support - Cached job data for remote areas",
+            "🔄 Real-time Sync - Background sync when connectivity returns",
+            "👆 Touch-Friendly UI - Large buttons for work gloves",
+            "📊 Performance Monitoring - Firebase performance tracking",
+            "🔐 Biometric Authentication - Fingerprint/Face unlock",
+            "📳 Smart Notifications - Location-based job alerts"
+        ]
+
+    def security_features(self):
+        return [
+            "🔑 JWT Authentication - Token-based secure authentication",
+            "🔒 Data Encryption - Android Keystore for sensitive data",
+            "🛡️ Certificate Pinning - Prevents man-in-the-middle attacks",
+            "👆 Biometric Auth - Fingerprint and face recognition",
+            "🔐 Secure Storage - Encrypted SharedPreferences",
+            "🌐 TLS 1.3 - Modern network security protocols",
+            "📱 App Attestation - Google Play Integrity API",
+            "🔍 Security Scanning - Automated vulnerability detection"
+        ]
+
+    def deployment_info(self):
+        return [
+            "🔄 GitHub Actions - Automated testing and builds",
+            "⚡ Fastlane - Streamlined app store deployment",
+            "🧪 Automated Testing - Unit, integration, and UI tests",
+            "📊 Code Quality - Lint checks and security scanning",
+            "📱 Google Play Store - Production deployment ready",
+            "🔍 Beta Testing - Internal testing track support",
+            "📈 Analytics - Firebase integration for insights",
+            "🚨 Crash Reporting - Crashlytics for stability monitoring"
+        ]
+
+    def sections(self):
+        """Overview content as (title, kind, payload) where kind is list, pairs or block"""
+        if not self.is_riggerhire:
+            return [
+                ("✨ KEY FEATURES", "list", self.features()),
+                ("🛠️  TECHNICAL STACK", "pairs", self.tech_stack()),
+                ("📁 PROJECT STRUCTURE", "block", self.project_structure()),
+            ]
+        return [
+            ("✨ KEY FEATURES", "list", self.features()),
+            ("🛠️  TECHNICAL STACK", "pairs", self.tech_stack()),
+            ("🏗️  ARCHITECTURE OVERVIEW", "block", self.architecture()),
+            ("📁 PROJECT STRUCTURE", "block", self.project_structure()),
+            ("🏭 MINING INDUSTRY FOCUS", "list", self.industry_focus()),
+            ("📱 MOBILE-FIRST OPTIMIZATIONS", "list", self.mobile_optimizations()),
+            ("🔐 ENTERPRISE SECURITY", "list", self.security_features()),
+            ("🚀 DEPLOYMENT & CI/CD", "list", self.deployment_info()),
+        ]
+
+    def render_text(self, generated=None):
+        generated = generated or datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        banner = ("🏗️  RIGGERHIRE ANDROID - ENTERPRISE MOBILE APPLICATION" if self.is_riggerhire
+                  else f"📱  {self.app_name.upper()}")
+        out = [
+            "=" * 70,
+            banner,
+            "=" * 70,
+            f"📱 App: {self.app_name}",
+            f"📂 Path: {self.app_root}",
+        ]
+        if self.is_riggerhire:
+            out += [f"🎨 Theme: {self.theme}", f"🏭 Industry: {self.target_industry}"]
+        out += [f"📅 Generated: {generated}", "=" * 70]
+        for title, kind, payload in self.sections():
+            out.append(f"\n{title}:")
+            if kind == "list":
+                out.extend(f"   • {item}" for item in payload)
+            elif kind == "pairs":
+                out.extend(f"   • {key}: {value}" for key, value in payload.items())
+            else:
+                out.append("\n" + payload.strip("\n"))
+        if not self.is_riggerhire:
+            return "\n".join(out + ["\n" + "=" * 70]) + "\n"
+        out += [
+            "\n" + "=" * 70,
+            "🎯 ENTERPRISE-GRADE • 📱 MOBILE-FIRST • 🏭 INDUSTRY-SPECIFIC",
+            "🔗 GitHub-based • 🌙 Dark Neon Theme • 🚀 Production-Ready",
+            "=" * 70,
+            "📧 Contact: tiatheone@protonmail.com",
+            "🏗️ Built for Australia's Mining Industry",
+            "=" * 70,
+        ]
+        return "\n".join(out) + "\n"
+
+    def render_markdown(self):
+        out = [f"## {self.app_name}", "", f"`{self.app_root}`", ""]
+        for title, kind, payload in self.sections():
+            out.append(f"### {title}")
+            out.append("")
+            if kind == "list":
+                out.extend(f"- {item}" for item in payload)
+            elif kind == "pairs":
+                out += ["| Category | Technology |", "|----------|------------|"]
+                out.extend(f"| {key} | {value} |" for key, value in payload.items())
+            else:
+                out += ["```", payload.strip("\n"), "```"]
+            out.append("")
+        return "\n".join(out) + "\n"
+
+    def render_html(self):
+        from html import escape as esc
+
+        out = [f"<section><h2>{esc(self.app_name)}</h2><p><code>{esc(str(self.app_root))}</code></p>"]
+        for title, kind, payload in self.sections():
+            out.append(f"<h3>{esc(title)}</h3>")
+            if kind == "list":
+                out.append("<ul>" + "".join(f"<li>{esc(item)}</li>" for item in payload) + "</ul>")
+            elif kind == "pairs":
+                rows = "".join(f"<tr><th>{esc(k)}</th><td>{esc(v)}</td></tr>" for k, v in payload.items())
+                out.append(f"<table>{rows}</table>")
+            else:
+                out.append(f"<pre>{esc(payload.strip(chr(10)))}</pre>")
+        out.append("</section>")
+        return "\n".join(out) + "\n"
+
+    def run_demo(self):
+        """Run the complete demo presentation"""
+        sys.stdout.write(self.render_text())
+        sys.stdout.flush()
+
+
+class OverviewGenerator:
+    """Generate overviews for every app in the monorepo in a single process"""
+
+    def __init__(self, monorepo_root, cache=None):
+        self.monorepo_root = Path(monorepo_root)
+        self.cache = cache if cache is not None else SnapshotCache()
+
+    def demos(self):
+        return [RiggerHireDemo(app_root, self.cache.get(app_root))
+                for app_root in discover_apps(self.monorepo_root)]
+
+    def render(self, fmt="text"):
+        demos = self.demos()
+        self.cache.save()
+        generated = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        if fmt == "markdown":
+            body = "".join(demo.render_markdown() for demo in demos)
+            return f"# RiggerHire App Overviews\n\n_Generated {generated} for {len(demos)} apps_\n\n{body}"
+        if fmt == "html":
+            body = "".join(demo.render_html() for demo in demos)
+            return ("<!DOCTYPE html>\n<html><head><meta charset=\"utf-8\">"
+                    "<title>RiggerHire App Overviews</title></head><body>\n"
+                    f"<h1>RiggerHire App Overviews</h1><p>Generated {generated} for {len(demos)} apps</p>\n"
+                    f"{body}</body></html>\n")
+        return "".join(demo.render_text(generated) for demo in demos)
+
+
+def find_monorepo_root(start):
+    """Walk up from start to the enclosing git checkout, falling back to start"""
+    start = Path(start).resolve()
+    for candidate in (start, *start.parents):
+        if (candidate / ".git").exists():
+            return candidate
+    return start
+
+
+def add_arguments(parser):
+    parser.add_argument("--all", action="store_true", help="generate overviews for every app in the monorepo")
+    parser.add_argument("--root", help="app root, or monorepo root with --all (default: current directory)")
+    parser.add_argument("--format", choices=("text", "markdown", "html"), default="text")
+    parser.add_argument("--output", "-o", help="write to this file instead of stdout")
+    parser.add_argument("--cache", help=f"snapshot cache path (default: {default_cache_path()})")
+    parser.add_argument("--no-cache", action="store_true", help="always re-introspect apps")
+
+
+def run(args):
+    if args.all:
+        root = Path(args.root) if args.root else find_monorepo_root(Path.cwd())
+        cache = SnapshotCache(args.cache)
+        if args.no_cache:
+            cache.entries = {}
+        text = OverviewGenerator(root, cache).render(args.format)
+    else:
+        demo = RiggerHireDemo(args.root)
+        text = {"markdown": demo.render_markdown, "html": demo.render_html}.get(args.format, demo.render_text)()
+
+    if args.output:
+        Path(args.output).write_text(text, encoding="utf-8")
+        print(f"✅ Overview written to {args.output}")
+    else:
+        sys.stdout.write(text)
+        sys.stdout.flush()
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="RiggerHire app overview generator")
+    add_arguments(parser)
+    sys.exit(run(parser.parse_args(argv)))
+
+
+if __name__ == "__main__":
+    main()
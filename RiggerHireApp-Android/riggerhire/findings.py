@@ -0,0 +1,149 @@
+"""
+Compact finding storage for the integration checker
+
+A full-monorepo run with every rule enabled can produce millions of
+findings that repeat the same file names and messages. FindingTable keeps
+them as parallel typed arrays of small integers: interned file, rule,
+message-template and argument ids plus line/column numbers. Message text
+is only formatted when a report is printed, and counting, grouping and
+sorting run over the integer columns.
+"""
+
+from array import array
+
+ISSUE, WARNING, TIMEOUT = 0, 1, 2
+
+
+class Interner:
+    """Map hashable values to dense integer ids and back"""
+
+    __slots__ = ("ids", "values")
+
+    def __init__(self, *initial):
+        self.ids = {}
+        self.values = []
+        for value in initial:
+            self.intern(value)
+
+    def intern(self, value):
+        value_id = self.ids.get(value)
+        if value_id is None:
+            value_id = self.ids[value] = len(self.values)
+            self.values.append(value)
+        return value_id
+
+
+class FindingTable:
+    """Column store of findings; row i is spread across the arrays at index i"""
+
+    def __init__(self):
+        self.files = Interner("")
+        self.rules = Interner("")
+        self.templates = Interner()
+        self.arguments = Interner(())
+        self.severity = array("B")
+        self.file = array("I")
+        self.rule = array("I")
+        self.template = array("I")
+        self.argument = array("I")
+        self.line = array("I")
+        self.column = array("I")
+        self.staged = None
+
+    def __len__(self):
+        return len(self.severity)
+
+    def add(self, severity, template, *args, file="", rule="", line=0, column=0):
+        """Record a finding; template is formatted with args only when reported"""
+        if self.staged is not None:
+            self.staged.append((severity, template, args, file, rule, line, column))
+            return
+        self.severity.append(severity)
+        self.file.append(self.files.intern(file))
+        self.rule.append(self.rules.intern(rule))
+        self.template.append(self.templates.intern(template))
+        self.argument.append(self.arguments.intern(args))
+        self.line.append(line)
+        self.column.append(column)
+
+    def stage(self):
+        """Hold new findings as whole-row tuples until commit()
+
+        The Watchdog's SIGALRM can interrupt add() between two column
+        appends and leave the arrays with different lengths. A staged row is
+        stored with a single list append, and is spread over the columns by
+        commit() once no rule is running under the alarm.
+        """
+        self.staged = []
+
+    def commit(self):
+        staged, self.staged = self.staged or [], None
+        for severity, template, args, file, rule, line, column in staged:
+            self.add(severity, template, *args, file=file, rule=rule, line=line, column=column)
+
+    def count(self, severity):
+        return self.severity.count(severity)
+
+    def message(self, row):
+        text = self.templates.values[self.template[row]]
+        args = self.arguments.values[self.argument[row]]
+        if args:
+            text = text.format(*args)
+        file_name = self.files.values[self.file[row]]
+        if not file_name:
+            return text
+        if self.line[row]:
+            return f"{file_name}:{self.line[row]}: {text}"
+        return f"{file_name}: {text}"
+
+    def rows(self, severity, ordered=False):
+        """Row numbers with the given severity, optionally sorted by file name, line, column"""
+        severities = self.severity
+        if severities.count(severity) == len(severities):
+            selected = list(range(len(severities)))
+        else:
+            selected = [row for row, value in enumerate(severities) if value == severity]
+        if ordered:
+            # Pack file-name rank, line, column and the row itself into one int
+            # per row so a plain integer sort orders them with no key function
+            ranks = [0] * len(self.files.values)
+            for rank, file_id in enumerate(sorted(range(len(ranks)), key=self.files.values.__getitem__)):
+                ranks[file_id] = rank << 74
+            file, line, column = self.file, self.line, self.column
+            packed = [ranks[file[row]] | min(line[row], 0x1FFFFF) << 53 | min(column[row], 0x1FFFFF) << 32 | row
+                      for row in selected]
+            packed.sort()
+            selected = [key & 0xFFFFFFFF for key in packed]
+        return selected
+
+    def counts_by_rule(self, severity=None):
+        """[(rule id, count)] most frequent first"""
+        counts = [0] * len(self.rules.values)
+        for row, rule_id in enumerate(self.rule):
+            if severity is None or self.severity[row] == severity:
+                counts[rule_id] += 1
+        ranked = [(self.rules.values[rule_id], n) for rule_id, n in enumerate(counts) if n]
+        ranked.sort(key=lambda item: -item[1])
+        return ranked
+
+
+class FindingView:
+    """List-like view of one severity, so ``checker.issues.append(msg)`` keeps working"""
+
+    __slots__ = ("table", "severity")
+
+    def __init__(self, table, severity):
+        self.table = table
+        self.severity = severity
+
+    def append(self, message):
+        self.table.add(self.severity, message)
+
+    def __len__(self):
+        return self.table.count(self.severity)
+
+    def __bool__(self):
+        return self.severity in self.table.severity
+
+    def __iter__(self):
+        return (self.table.message(row) for row in self.table.rows(self.severity))
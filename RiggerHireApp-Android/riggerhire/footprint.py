@@ -0,0 +1,327 @@
+"""
+Parcelable/model memory-footprint analyzer
+
+Parses Kotlin data classes and estimates, from field types alone, the
+retained ART heap size of one instance and the size of its Parcel when it
+is passed through an Intent. Flags models at risk of the Binder
+transaction limit, costly default initialisers and boxed primitives, and
+reports the per-page memory cost of each paged list endpoint in ApiService.
+
+All sizes are estimates under stated assumptions (average string length,
+average list length) and are meant for comparing models, not for exact
+accounting.
+"""
+
+import re
+from pathlib import Path
+
+from riggerhire.kotlin import LazyPattern, iter_kotlin_files, line_of, matching, split_top_level, strip_comments
+
+DATA_CLASS_RE = LazyPattern(r'(@Parcelize\s+)?(?:(?:public|internal|private)\s+)?data\s+class\s+(\w+)\s*\(')
+ENUM_RE = LazyPattern(r'enum\s+class\s+(\w+)')
+PARAM_RE = LazyPattern(r'(?:val|var)\s+(\w+)\s*:\s*(.+?)\s*(?:=\s*(.+))?$', re.S)
+ENDPOINT_RE = LazyPattern(r'@(GET|POST|PUT|DELETE|PATCH)\s*\(\s*"([^"]*)"\s*\)\s*(?:suspend\s+)?fun\s+(\w+)\s*\(')
+LIMIT_DEFAULT_RE = LazyPattern(r'@Query\("(?:limit|per_page|page_size)"\)\s*\w+\s*:\s*Int\s*=\s*(\d+)')
+
+# ART: 8-byte object header, 4-byte compressed references, 8-byte alignment
+OBJECT_HEADER = 8
+REFERENCE = 4
+PRIMITIVES = {"Boolean": 1, "Byte": 1, "Short": 2, "Char": 2, "Int": 4, "Float": 4, "Long": 8, "Double": 8}
+# Parcel writes every sub-int primitive as a 4-byte int
+PARCEL_PRIMITIVES = {"Boolean": 4, "Byte": 4, "Short": 4, "Char": 4, "Int": 4, "Float": 4, "Long": 8, "Double": 8}
+LIST_TYPES = ("List", "MutableList", "ArrayList", "Set", "MutableSet", "Collection")
+# java.util.Date: header + fastTime + cdate reference; parcelled via writeSerializable
+DATE_HEAP = 24
+DATE_PARCEL = 120
+
+COSTLY_DEFAULTS = [
+    (LazyPattern(r'UUID\.randomUUID\(\)'), "generates a random UUID (SecureRandom) on every construction"),
+    (LazyPattern(r'\bDate\(\)'), "allocates a Date and reads the clock on every construction"),
+    (LazyPattern(r'System\.currentTimeMillis\(\)|Instant\.now\(\)|LocalDateTime\.now\(\)'), "reads the clock on every construction"),
+    (LazyPattern(r'\b(?:mutableListOf|arrayListOf|mutableMapOf|hashMapOf|mutableSetOf)\('), "allocates a new collection on every construction"),
+    (LazyPattern(r'\b(?:Regex|SimpleDateFormat|Gson|DecimalFormat)\('), "builds an expensive helper on every construction"),
+]
+
+
+def _align(size):
+    return (size + 7) & ~7
+
+
+class Field:
+    def __init__(self, name, type_name, default):
+        self.name = name
+        self.type_name = type_name.strip()
+        self.default = (default or "").strip()
+
+    @property
+    def nullable(self):
+        return self.type_name.endswith("?")
+
+    @property
+    def base(self):
+        return self.type_name.rstrip("?").split("<")[0].split(".")[-1].strip()
+
+    @property
+    def element(self):
+        """Element type of a List<...> field"""
+        match = re.search(r'<\s*([\w.]+\??)\s*>', self.type_name)
+        return match.group(1) if match else "Any"
+
+
+class Model:
+    def __init__(self, name, parcelable, file_path, line, fields):
+        self.name = name
+        self.parcelable = parcelable
+        self.file_path = file_path
+        self.line = line
+        self.fields = fields
+
+    @property
+    def key(self):
+        return (str(self.file_path), self.name)
+
+    @property
+    def label(self):
+        return f"{self.file_path.name}:{self.line} {self.name}"
+
+
+def parse_models(text, file_path):
+    models = []
+    for match in DATA_CLASS_RE.finditer(text):
+        ctor_open = match.end() - 1
+        ctor_close = matching(text, ctor_open)
+        if ctor_close == -1:
+            continue
+        tail = text[ctor_close + 1:ctor_close + 120]
+        parcelable = bool(match.group(1)) or bool(re.match(r'\s*:\s*[^{]*\bParcelable\b', tail))
+        fields = []
+        for param in split_top_level(text[ctor_open + 1:ctor_close]):
+            param = re.sub(r'@\w+(?:\([^)]*\))?\s*', "", param)
+            param_match = PARAM_RE.search(param)
+            if param_match:
+                fields.append(Field(*param_match.groups()))
+        models.append(Model(match.group(2), parcelable, file_path, line_of(text, match.start()), fields))
+    return models
+
+
+class FootprintAnalyzer:
+    def __init__(self, root_path=None, string_chars=24, list_items=4, page_size=20,
+                 binder_budget_kb=500, parcel_warn_kb=8):
+        self.root_path = Path(root_path) if root_path else Path.cwd()
+        self.string_chars = string_chars
+        self.list_items = list_items
+        self.page_size = page_size
+        self.binder_budget = binder_budget_kb * 1024
+        self.parcel_warn = parcel_warn_kb * 1024
+        self.models = {}        # name -> [Model], duplicates resolved by locality
+        self.enums = set()
+        self.endpoints = []     # (method, path, function, response type, page size)
+        self.issues = []
+        self.warnings = []
+        self._heap_cache = {}
+        self._parcel_cache = {}
+
+    def collect(self):
+        print("🔍 Collecting data classes...")
+        for kt_file in iter_kotlin_files(self.root_path):
+            try:
+                text = strip_comments(kt_file.read_text(encoding="utf-8", errors="replace"))
+            except OSError as e:
+                self.issues.append(f"Error reading {kt_file}: {e}")
+                continue
+            self.enums.update(ENUM_RE.findall(text))
+            for model in parse_models(text, kt_file):
+                self.models.setdefault(model.name, []).append(model)
+            for endpoint in ENDPOINT_RE.finditer(text):
+                params_close = matching(text, endpoint.end() - 1)
+                params = text[endpoint.end():params_close]
+                returns = re.match(r'\s*:\s*Response<\s*([\w.]+)', text[params_close + 1:params_close + 80])
+                limit = LIMIT_DEFAULT_RE.search(params)
+                if returns:
+                    self.endpoints.append((endpoint.group(1), endpoint.group(2), endpoint.group(3), returns.group(1),
+                                           int(limit.group(1)) if limit else None))
+        count = sum(len(models) for models in self.models.values())
+        print(f"✅ {count} data classes, {len(self.enums)} enums, {len(self.endpoints)} API endpoints")
+
+    def resolve(self, type_name, near=None):
+        """Pick the model for type_name, preferring the same file, then data/models"""
+        candidates = self.models.get(type_name.rstrip("?").split(".")[-1], [])
+        if not candidates:
+            return None
+        for model in candidates:
+            if near is not None and model.file_path == near.file_path:
+                return model
+        for model in candidates:
+            if "models" in model.file_path.parts:
+                return model
+        return candidates[0]
+
+    def _string_heap(self):
+        # header + count + hash, Latin-1 compressed chars
+        return _align(OBJECT_HEADER + 8 + self.string_chars)
+
+    def _string_parcel(self):
+        # length prefix + UTF-16 chars + NUL, padded to 4
+        return 4 + (((self.string_chars + 1) * 2 + 3) & ~3)
+
+    def _value_heap(self, type_name, owner, seen):
+        """Retained bytes of the object a reference field points to (0 for primitives)"""
+        base = type_name.rstrip("?").split("<")[0].split(".")[-1].strip()
+        if base in PRIMITIVES:
+            return _align(OBJECT_HEADER + PRIMITIVES[base]) if type_name.endswith("?") else 0
+        if base == "String":
+            return self._string_heap()
+        if base == "Date":
+            return DATE_HEAP
+        if base in self.enums:
+            return 0  # shared singleton
+        if base in LIST_TYPES:
+            element = Field("_", type_name, "").element
+            backing = _align(OBJECT_HEADER + 4 + REFERENCE * max(self.list_items, 1))
+            return 24 + backing + self.list_items * self._value_heap(element, owner, seen)
+        model = self.resolve(base, owner)
+        if model is not None and model.name not in seen:
+            return self.heap_size(model, seen)
+        return 16
+
+    def heap_size(self, model, seen=frozenset()):
+        """Estimated retained heap of one populated instance
+
+        Only top-level results are cached: inside a walk, seen cuts cycles
+        short, so a nested size depends on the path that reached it.
+        """
+        if not seen and model.key in self._heap_cache:
+            return self._heap_cache[model.key]
+        seen = seen | {model.name}
+        shallow = OBJECT_HEADER
+        deep = 0
+        for field in model.fields:
+            if field.base in PRIMITIVES and not field.nullable:
+                shallow += PRIMITIVES[field.base]
+            else:
+                shallow += REFERENCE
+                deep += self._value_heap(field.type_name, model, seen)
+        size = _align(shallow) + deep
+        if len(seen) == 1:
+            self._heap_cache[model.key] = size
+        return size
+
+    def _value_parcel(self, type_name, owner, seen):
+        base = type_name.rstrip("?").split("<")[0].split(".")[-1].strip()
+        presence = 4 if type_name.endswith("?") else 0
+        if base in PARCEL_PRIMITIVES:
+            return presence + PARCEL_PRIMITIVES[base]
+        if base in ("String", "CharSequence"):
+            return self._string_parcel()
+        if base == "Date":
+            return presence + DATE_PARCEL
+        if base in self.enums:
+            return presence + self._string_parcel()  # written by name
+        if base in LIST_TYPES:
+            element = Field("_", type_name, "").element
+            return presence + 4 + self.list_items * self._value_parcel(element, owner, seen)
+        model = self.resolve(base, owner)
+        if model is not None and model.name not in seen:
+            return presence + self.parcel_size(model, seen)
+        return presence + 64
+
+    def parcel_size(self, model, seen=frozenset()):
+        """Estimated bytes written by the @Parcelize-generated writeToParcel (cached like heap_size)"""
+        if not seen and model.key in self._parcel_cache:
+            return self._parcel_cache[model.key]
+        seen = seen | {model.name}
+        size = sum(self._value_parcel(field.type_name, model, seen) for field in model.fields)
+        if len(seen) == 1:
+            self._parcel_cache[model.key] = size
+        return size
+
+    def check_model(self, model):
+        heap = self.heap_size(model)
+        line = f"📦 {model.name}: {len(model.fields)} fields, ~{heap:,} B heap"
+        if model.parcelable:
+            parcel = self.parcel_size(model)
+            page = parcel * self.page_size
+            line += f", ~{parcel:,} B parcel, ~{page / 1024:.1f} KB per {self.page_size}-item page"
+            if parcel > self.parcel_warn or page > self.binder_budget:
+                self.issues.append(f"{model.label}: ~{parcel:,} B per parcel ({page / 1024:.0f} KB per "
+                                   f"{self.page_size} items) risks TransactionTooLargeException; pass an id "
+                                   f"instead of the object")
+            dates = [f.name for f in model.fields if f.base == "Date"]
+            if dates:
+                self.warnings.append(f"{model.label}: Date fields {', '.join(dates)} are parcelled with "
+                                     f"writeSerializable (~{DATE_PARCEL} B each); store epoch millis as Long")
+        print(line)
+
+        for field in model.fields:
+            for pattern, reason in COSTLY_DEFAULTS:
+                if pattern.search(field.default):
+                    self.warnings.append(f"{model.label}.{field.name} = {field.default}: {reason}, "
+                                         f"including JSON deserialisation")
+                    break
+        boxed = [f"{f.name}: {f.type_name}" for f in model.fields if f.base in PRIMITIVES and f.nullable]
+        if boxed:
+            parcelled = " plus a presence flag when parcelled" if model.parcelable else ""
+            self.warnings.append(f"{model.label}: boxed nullable primitives ({', '.join(boxed)}) cost "
+                                 f"{_align(OBJECT_HEADER + 8)} B each{parcelled}")
+
+    def check_endpoints(self):
+        print("\n📄 Heap cost of list endpoints:")
+        found = False
+        for method, path, function, response_type, limit in self.endpoints:
+            response = self.resolve(response_type)
+            if response is None:
+                continue
+            for field in response.fields:
+                if field.base not in LIST_TYPES:
+                    continue
+                item = self.resolve(field.element, response)
+                if item is None:
+                    continue
+                found = True
+                page = limit or self.page_size
+                heap = self.heap_size(item) * page
+                per = "per page" if limit else f"for the whole list (unbounded; assumes {page} items)"
+                print(f"   • {method} {path} ({function}): {response_type}.{field.name} = {page} × "
+                      f"{item.name} ≈ {heap / 1024:.1f} KB heap {per}")
+        if not found:
+            print("   • No list endpoints found")
+
+    def run_all_checks(self):
+        print("🧮 RiggerHire Android App - Model Footprint Analysis")
+        print("=" * 55)
+        print(f"Assumptions: {self.string_chars}-char strings, {self.list_items}-item lists, "
+              f"{self.page_size} items per page\n")
+
+        self.collect()
+        print()
+        for name in sorted(self.models):
+            for model in self.models[name]:
+                self.check_model(model)
+        self.check_endpoints()
+
+        if self.issues:
+            print(f"\n❌ BINDER RISKS ({len(self.issues)}):")
+            for issue in self.issues:
+                print(f"   • {issue}")
+        if self.warnings:
+            print(f"\n⚠️  WARNINGS ({len(self.warnings)}):")
+            for warning in self.warnings:
+                print(f"   • {warning}")
+
+        return len(self.issues) == 0
+
+
+def add_arguments(parser):
+    parser.add_argument("--root", default=".", help="Android app root (default: current directory)")
+    parser.add_argument("--string-chars", type=int, default=24, help="assumed average string length")
+    parser.add_argument("--list-items", type=int, default=4, help="assumed average List<...> length")
+    parser.add_argument("--page-size", type=int, default=20, help="items assumed for list endpoints with no limit default")
+    parser.add_argument("--binder-budget-kb", type=int, default=500,
+                        help="flag parcelable models whose page parcel exceeds this (Binder buffer is 1 MB)")
+    parser.add_argument("--parcel-warn-kb", type=int, default=8, help="flag single parcels larger than this")
+
+
+def run(args):
+    analyzer = FootprintAnalyzer(args.root, args.string_chars, args.list_items, args.page_size,
+                                 args.binder_budget_kb, args.parcel_warn_kb)
+    return 0 if analyzer.run_all_checks() else 1
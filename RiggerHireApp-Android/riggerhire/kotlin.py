@@ -0,0 +1,208 @@
+"""
+Lightweight Kotlin source helpers shared by the riggerhire checkers
+
+These are not a Kotlin parser. They blank out comments, match brackets
+and split argument lists well enough for the declaration-level analysis
+the checkers do, while keeping character offsets (and so line numbers)
+identical to the original source.
+"""
+
+import re
+from functools import lru_cache
+from pathlib import Path
+
+SKIP_DIRS = {"build", ".gradle", ".idea", ".git", "node_modules"}
+
+OPENERS = {"(": ")", "[": "]", "{": "}", "<": ">"}
+
+RETURN_TYPE_RE = re.compile(r'(?<=\))\s*:\s*[\w.<>?, ]+$')
+
+
+class LazyPattern:
+    """A regex that is compiled on first use
+
+    Checker modules declare their patterns at import time; compiling them
+    there would charge every CLI start, including hook runs that never
+    reach the rule. ``pattern`` and ``flags`` mirror ``re.Pattern`` so the
+    registry can safety-check the source without compiling it.
+    """
+
+    __slots__ = ("pattern", "flags", "compiled")
+
+    def __init__(self, pattern, flags=0):
+        self.pattern = pattern
+        self.flags = flags
+        self.compiled = None
+
+    def __getattr__(self, name):
+        if self.compiled is None:
+            self.compiled = re.compile(self.pattern, self.flags)
+        return getattr(self.compiled, name)
+
+
+# `fun name` (with optional type parameters and receiver) ending a block header
+FUN_HEADER_RE = LazyPattern(r'\bfun\s+(?:<[^>]*>\s*)?(?:[\w.]+\.)?(\w+)\s*$')
+
+
+def iter_kotlin_files(root):
+    """Yield every .kt file below root, skipping build output"""
+    for path in sorted(Path(root).glob("**/*.kt")):
+        if not SKIP_DIRS.intersection(path.parts):
+            yield path
+
+
+# Every Kotlin rule strips the same file, so keep the last few results
+@lru_cache(maxsize=4)
+def strip_comments(source, blank_strings=False):
+    """Replace comments (and optionally string contents) with spaces
+
+    Newlines are kept so offsets and line numbers still line up with the
+    original text.
+    """
+    out = list(source)
+    i, n = 0, len(source)
+
+    def blank(start, end):
+        for k in range(start, end):
+            if out[k] != "\n":
+                out[k] = " "
+
+    while i < n:
+        ch = source[i]
+        if source.startswith("//", i):
+            end = source.find("\n", i)
+            end = n if end == -1 else end
+            blank(i, end)
+            i = end
+        elif source.startswith("/*", i):
+            end = source.find("*/", i + 2)
+            end = n if end == -1 else end + 2
+            blank(i, end)
+            i = end
+        elif source.startswith('"""', i):
+            end = source.find('"""', i + 3)
+            end = n if end == -1 else end
+            if blank_strings:
+                blank(i + 3, end)
+            i = end + 3
+        elif ch == '"' or ch == "'":
+            j = i + 1
+            while j < n and source[j] != ch and source[j] != "\n":
+                j += 2 if source[j] == "\\" else 1
+            if blank_strings:
+                blank(i + 1, min(j, n))
+            i = j + 1
+        else:
+            i += 1
+    return "".join(out)
+
+
+def matching(text, start):
+    """Return the index of the bracket closing text[start], or -1
+
+    text should already have comments stripped; string literals are
+    skipped so brackets inside them are not counted.
+    """
+    opener = text[start]
+    closer = OPENERS[opener]
+    depth = 0
+    i, n = start, len(text)
+    while i < n:
+        ch = text[i]
+        if ch == '"':
+            if text.startswith('"""', i):
+                end = text.find('"""', i + 3)
+                i = n if end == -1 else end + 3
+                continue
+            j = i + 1
+            while j < n and text[j] != '"' and text[j] != "\n":
+                j += 2 if text[j] == "\\" else 1
+            i = j + 1
+            continue
+        if ch == opener:
+            depth += 1
+        elif ch == closer:
+            depth -= 1
+            if depth == 0:
+                return i
+        i += 1
+    return -1
+
+
+def split_top_level(text, separator=","):
+    """Split text on separator, ignoring separators nested in brackets or strings"""
+    parts, depth, start, i, n = [], 0, 0, 0, len(text)
+    quote = None
+    while i < n:
+        ch = text[i]
+        if quote:
+            if ch == "\\":
+                i += 2
+                continue
+            if ch == quote:
+                quote = None
+        elif ch == '"' or ch == "'":
+            quote = ch
+        elif ch in "([{" or (ch == "<" and i and (text[i - 1].isalnum() or text[i - 1] == "_")):
+            # '<' only opens a generic when glued to a type name, not in `a < b`
+            depth += 1
+        elif depth and (ch in ")]}" or (ch == ">" and text[i - 1] != "-")):
+            depth -= 1
+        elif ch == separator and depth == 0:
+            parts.append(text[start:i])
+            start = i + 1
+        i += 1
+    parts.append(text[start:])
+    return [part.strip() for part in parts if part.strip()]
+
+
+def line_of(text, offset):
+    """1-based line number of offset in text"""
+    return text.count("\n", 0, offset) + 1
+
+
+def block_header(text, brace, window=300):
+    """Split the code before the block opened at text[brace] into (prefix, arguments)
+
+    arguments is the text of a balanced (...) directly before the brace,
+    after stepping back over a ``: ReturnType``, or None if there is none;
+    prefix is the text before that, ending at the callee or declared name.
+    """
+    head_end = brace
+    while head_end and text[head_end - 1] in " \t\n":
+        head_end -= 1
+    before = RETURN_TYPE_RE.sub("", text[max(0, head_end - window):head_end])
+    if before.endswith(")"):
+        depth = 0
+        for i in range(len(before) - 1, -1, -1):
+            if before[i] == ")":
+                depth += 1
+            elif before[i] == "(":
+                depth -= 1
+                if depth == 0:
+                    return before[:i], before[i + 1:-1]
+    return before, None
+
+
+def is_composable(text, brace):
+    """True if the fun declaration whose body opens at text[brace] is annotated @Composable"""
+    start = max(text.rfind("}", 0, brace), text.rfind(";", 0, brace), text.rfind("{", 0, brace))
+    header = text[start + 1:brace]
+    return "@Composable" in header.split("fun", 1)[0]
+
+
+def enclosing_blocks(structure, offsets):
+    """Yield, for each offset in ascending order, the '{' offsets enclosing it (outermost first)
+
+    structure should have comments and string contents blanked.
+    """
+    stack, position = [], 0
+    for offset in offsets:
+        for i in range(position, offset):
+            ch = structure[i]
+            if ch == "{":
+                stack.append(i)
+            elif ch == "}" and stack:
+                stack.pop()
+        position = offset
+        yield list(stack)
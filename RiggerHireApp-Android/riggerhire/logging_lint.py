@@ -0,0 +1,185 @@
+"""
+Hot-path logging lint and R8 log-stripping check
+
+Finds ``Log.*``, ``println`` and ``print`` calls in Kotlin sources and
+classifies where they run: a Composable body (every recomposition), a
+lazy-list item lambda (every item bound), a loop, or an ``onCreate``
+(cold start). Calls on those paths whose message is a string template or
+concatenation are flagged, since the string is built on every pass even
+when nothing reads the log.
+
+``check_log_stripping`` then checks that proguard-rules.pro carries
+``-assumenosideeffects`` rules for the debug log levels the code uses and
+that the release build actually runs R8, so the calls are removed from
+release builds.
+"""
+
+import re
+
+from riggerhire.findings import WARNING
+from riggerhire.kotlin import (FUN_HEADER_RE, LazyPattern, block_header, enclosing_blocks, is_composable, line_of,
+                               matching, split_top_level, strip_comments)
+from riggerhire.rules import kotlin_rule
+
+LOG_CALL_RE = LazyPattern(r'(?<![\w.])(?:Log\.(v|d|i|w|e|wtf)|(println|print))\s*\(')
+NAMED_ARG_RE = LazyPattern(r'\b(\w+)\s*=\s*$')
+CALLEE_RE = LazyPattern(r'([\w.]+)\s*(?:<[^<>]*>)?\s*$')
+TEMPLATE_RE = LazyPattern(r'"(?:[^"\\\n]|\\.)*\$[{\w](?:[^"\\\n]|\\.)*"|"""[^"]*?\$[{\w]')
+BUILT_STRING_RE = LazyPattern(r'\.format\(|\bString\.format\(|\bbuildString\b|\.joinToString\(|\.toString\(\)')
+ASSUME_RE = LazyPattern(r'-assumenosideeffects\s+class\s+([\w.$*]+)\s*\{([^}]*)\}')
+ASSUME_METHOD_RE = LazyPattern(r'([\w*<>]+)\s*\(')
+MINIFY_RE = LazyPattern(r'\brelease\s*\{[^}]*?\b(?:minifyEnabled|isMinifyEnabled)\s*=?\s*(true|false)')
+
+LOOP_CALLEES = {"for", "while", "do", "repeat", "forEach", "forEachIndexed", "onEach", "map", "mapIndexed",
+                "mapNotNull", "flatMap", "filter", "filterNot", "fold", "reduce", "sumOf", "associate",
+                "associateBy", "groupBy", "sortedBy", "sortedByDescending", "count", "any", "all", "none"}
+LAZY_ITEM_CALLEES = {"items", "itemsIndexed", "item", "stickyHeader"}
+# Lambdas that run once or on an event rather than on every recomposition
+ONE_SHOT_CALLEES = {"LaunchedEffect", "DisposableEffect", "remember", "rememberSaveable", "rememberCoroutineScope",
+                    "launch", "async", "withContext", "runCatching", "lazy", "thread", "post", "postDelayed",
+                    "setOnClickListener", "addCallback", "collect", "collectLatest", "observe"}
+RENDER_FUNCTIONS = {"onDraw", "onMeasure", "onLayout", "dispatchDraw", "onBindViewHolder", "getView", "draw"}
+HOT_CONTEXTS = {"composable", "lazy-item", "loop", "render", "onCreate"}
+CONTEXT_LABELS = {
+    "composable": "Composable body (runs on every recomposition)",
+    "lazy-item": "lazy-list item lambda (runs for every item)",
+    "loop": "loop body",
+    "render": "view rendering callback",
+    "onCreate": "onCreate (cold-start path)",
+}
+
+# R8 strips these levels in release; warnings and errors are usually kept
+STRIPPED_LEVELS = {"v", "d", "i"}
+PRINT_CLASS = "kotlin.io.ConsoleKt"
+
+
+def block_kind(text, brace):
+    """Classify the block opened at text[brace] as (kind, name)
+
+    kind is one of fun, loop, lazy-item, deferred, callback, class or
+    lambda (a plain nested lambda that inherits its parent's context).
+    """
+    prefix, _ = block_header(text, brace)
+    if prefix.endswith("->"):
+        return "lambda", ""  # `when` branch or function type body
+    if prefix.endswith("else") or prefix.endswith("try") or prefix.endswith("finally"):
+        return "lambda", ""
+    if prefix.endswith("do"):
+        return "loop", "do"
+    fun = FUN_HEADER_RE.search(prefix)
+    if fun:
+        return "fun", fun.group(1)
+    if re.search(r'\b(?:class|object|interface)\b[^{;]*$', prefix):
+        return "class", ""
+    named = NAMED_ARG_RE.search(prefix)
+    if named:
+        return "callback", named.group(1)
+    callee = CALLEE_RE.search(prefix)
+    name = callee.group(1).rsplit(".", 1)[-1] if callee else ""
+    if name in ("for", "while") or name in LOOP_CALLEES:
+        return "loop", name
+    if name in LAZY_ITEM_CALLEES:
+        return "lazy-item", name
+    if name in ONE_SHOT_CALLEES:
+        return "deferred", name
+    return "lambda", name
+
+
+def call_context(text, stack):
+    """Context of a call nested in the blocks opened at the offsets in stack (outermost first)"""
+    for brace in reversed(stack):
+        kind, name = block_kind(text, brace)
+        if kind == "loop":
+            return "loop", name
+        if kind == "lazy-item":
+            return "lazy-item", name
+        if kind in ("deferred", "callback"):
+            return None, name
+        if kind == "class":
+            return None, ""
+        if kind == "fun":
+            if is_composable(text, brace):
+                return "composable", name
+            if name == "onCreate":
+                return "onCreate", name
+            if name in RENDER_FUNCTIONS:
+                return "render", name
+            return None, name
+    return None, ""
+
+
+def builds_string(argument):
+    """True if a log message argument is built at run time rather than a constant"""
+    if TEMPLATE_RE.search(argument) or BUILT_STRING_RE.search(argument):
+        return True
+    return len(split_top_level(argument, "+")) > 1
+
+
+def iter_log_calls(content):
+    """Yield (offset, level or print function, message argument, enclosing brace stack)"""
+    source = strip_comments(content)
+    structure = strip_comments(content, blank_strings=True)
+    calls = list(LOG_CALL_RE.finditer(structure))
+    for match, stack in zip(calls, enclosing_blocks(structure, [m.start() for m in calls])):
+        close = matching(source, match.end() - 1)
+        args = split_top_level(source[match.end():close if close != -1 else len(source)])
+        level = match.group(1) or match.group(2)
+        message = args[1] if match.group(1) and len(args) > 1 else (args[0] if args else "")
+        yield match.start(), level, message, stack
+
+
+@kotlin_rule("hot-path-logging", LOG_CALL_RE, TEMPLATE_RE, FUN_HEADER_RE, NAMED_ARG_RE, CALLEE_RE)
+def check_hot_path_logging(checker, file_path, content):
+    """Log/println calls that build strings on hot paths"""
+    if "Log." not in content and "print" not in content:
+        return
+    structure = strip_comments(content, blank_strings=True)
+    for offset, level, message, stack in iter_log_calls(content):
+        context, where = call_context(structure, stack)
+        checker.log_calls[context] = checker.log_calls.get(context, 0) + 1
+        checker.log_levels.add(level)
+        if context in HOT_CONTEXTS and builds_string(message):
+            call = f"Log.{level}" if len(level) <= 3 else level
+            checker.findings.add(WARNING, "{} builds a string on a hot path, {} in {}; log a constant or guard it",
+                                 call, CONTEXT_LABELS[context], where,
+                                 file=file_path.name, rule="hot-path-logging", line=line_of(content, offset))
+
+
+def stripped_methods(rules_text):
+    """{class name: set of method names} covered by -assumenosideeffects rules"""
+    rules_text = re.sub(r'#[^\n]*', "", rules_text)
+    covered = {}
+    for match in ASSUME_RE.finditer(rules_text):
+        methods = covered.setdefault(match.group(1), set())
+        body = match.group(2)
+        methods.update(name for name in ASSUME_METHOD_RE.findall(body))
+        if re.search(r'(?:^|;)\s*\*\s*;', body) or "<methods>" in body:
+            methods.add("*")
+    return covered
+
+
+def check_log_stripping(checker, root):
+    """Check that R8 strips the debug log levels the Kotlin code uses from release builds"""
+    levels = checker.log_levels
+    if not levels:
+        return
+    rules_file = root / "app/proguard-rules.pro"
+    rules_text = rules_file.read_text() if rules_file.exists() else ""
+    covered = stripped_methods(rules_text)
+
+    log_methods = covered.get("android.util.Log", set())
+    if "*" not in log_methods and "***" not in log_methods:
+        for level in sorted(levels & STRIPPED_LEVELS - log_methods):
+            checker.findings.add(WARNING, "Log.{} calls are not stripped: add it to -assumenosideeffects "
+                                 "class android.util.Log", level, file="proguard-rules.pro", rule="log-stripping")
+    print_methods = covered.get(PRINT_CLASS, set())
+    for function in sorted(levels & {"println", "print"} - print_methods):
+        checker.findings.add(WARNING, "{} calls are not stripped: add -assumenosideeffects class {}",
+                             function, PRINT_CLASS, file="proguard-rules.pro", rule="log-stripping")
+
+    gradle_file = root / "app/build.gradle"
+    if gradle_file.exists():
+        minify = MINIFY_RE.search(strip_comments(gradle_file.read_text()))
+        if minify is None or minify.group(1) == "false":
+            checker.findings.add(WARNING, "release build has minifyEnabled false, so R8 never applies "
+                                 "the -assumenosideeffects rules", file="build.gradle", rule="log-stripping")
@@ -0,0 +1,220 @@
+"""
+Coroutine dispatcher tracking and main-thread blocking lint
+
+Finds blocking I/O, ``runBlocking``/``Thread.sleep``, synchronous network
+and JSON calls and heavy sorting or decoding, then works out which thread
+they run on by walking the enclosing blocks outwards. ``withContext``,
+``launch`` and ``async`` switch to the dispatcher they are given;
+otherwise a coroutine inherits its scope's dispatcher (``viewModelScope``,
+``lifecycleScope``, ``rememberCoroutineScope()`` and ``LaunchedEffect``
+are Main, ``GlobalScope`` is Default) and ``coroutineScope { }`` keeps
+its caller's. Composables, click callbacks and Activity, Fragment and
+ViewModel lifecycle code are Main. Calls whose thread cannot be
+determined, such as a plain ``suspend fun``, are not reported.
+"""
+
+import re
+from functools import lru_cache
+
+from riggerhire.findings import WARNING
+from riggerhire.kotlin import (FUN_HEADER_RE, LazyPattern, block_header, enclosing_blocks, is_composable, line_of,
+                               split_top_level, strip_comments)
+from riggerhire.rules import kotlin_rule
+
+# (rule id, pattern, what it is, where it should run)
+BLOCKING_CALLS = (
+    ("main-thread-blocking", LazyPattern(r'\brunBlocking\s*[({<]'), "runBlocking", "a suspend call"),
+    ("main-thread-blocking", LazyPattern(r'\bThread\.sleep\s*\('), "Thread.sleep", "delay()"),
+    ("main-thread-blocking", LazyPattern(r'\.execute\(\s*\)'), "synchronous network Call.execute()",
+     "a suspend Retrofit call or Dispatchers.IO"),
+    ("main-thread-io", LazyPattern(r'\.(?:readText|readBytes|readLines|writeText|writeBytes|appendText|'
+                                    r'forEachLine|useLines|listFiles)\s*\('), "file I/O", "Dispatchers.IO"),
+    ("main-thread-io", LazyPattern(r'\b(?:FileInputStream|FileOutputStream|RandomAccessFile)\s*\(|'
+                                    r'\bopenFile(?:Input|Output)\s*\('), "file stream", "Dispatchers.IO"),
+    ("main-thread-io", LazyPattern(r'\bget(?:Default)?SharedPreferences\s*\('),
+     "SharedPreferences load (reads XML from disk on first access)", "Dispatchers.IO or DataStore"),
+    ("main-thread-io", LazyPattern(r'\.edit\(\)[^;\n]{0,200}?\.commit\(\)'), "synchronous SharedPreferences commit()",
+     "apply()"),
+    ("main-thread-cpu", LazyPattern(r'\.(?:fromJson|toJson)\s*\(|\bJSON(?:Object|Array)\s*\(\s*\w|'
+                                     r'\bJson\.(?:decodeFromString|encodeToString)\s*[(<]'),
+     "synchronous JSON parsing", "Dispatchers.Default"),
+    ("main-thread-cpu", LazyPattern(r'\.(?:sorted|sortedDescending|sortedBy|sortedByDescending|sortedWith|'
+                                     r'sort|sortBy|sortByDescending|sortWith)\s*[({]|\bCollections\.sort\s*\('),
+     "list sorting", "Dispatchers.Default or remember(key) { }"),
+    ("main-thread-cpu", LazyPattern(r'\bBitmapFactory\.decode\w*\s*\('), "bitmap decoding", "Dispatchers.Default"),
+)
+RULE_ADVICE = {
+    "main-thread-blocking": "blocks the main thread",
+    "main-thread-io": "does disk I/O on the main thread",
+    "main-thread-cpu": "does CPU-heavy work on the main thread",
+}
+
+MAIN_DISPATCHER_RE = LazyPattern(r'\bDispatchers\.Main\b|\bmain\w*dispatcher\b', re.I)
+BACKGROUND_DISPATCHER_RE = LazyPattern(r'\bDispatchers\.(?:IO|Default|Unconfined)\b|'
+                                        r'\b(?:io|default|background)\w*dispatcher\b|'
+                                        r'\bnewSingleThreadContext\b|\.asCoroutineDispatcher\(', re.I)
+CALLEE_RE = LazyPattern(r'((?:[\w.]+|\w+\([^()]*\))\.)?(\w+)\s*(?:<[^<>]*>)?\s*$')
+CLASS_RE = LazyPattern(r'\b(?:class|object)\s+(\w+)[^{;]*$')
+SCOPE_VAL_RE = LazyPattern(r'\bval\s+(\w+)\s*=\s*'
+                           r'(rememberCoroutineScope\(\)|MainScope\(\)|CoroutineScope\(([^)\n]*)\))')
+
+# coroutineScope { } and supervisorScope { } are not here: they run in their
+# caller's context, so the walk carries on to the enclosing launch or withContext
+MAIN_SCOPES = {"viewModelScope", "lifecycleScope", "MainScope()"}
+BACKGROUND_BUILDERS = {"thread", "execute", "submit", "Thread", "doAsync", "runOnIoThread"}
+MAIN_BUILDERS = {"LaunchedEffect", "DisposableEffect", "SideEffect", "remember", "rememberSaveable",
+                 "derivedStateOf", "setContent", "runOnUiThread", "post", "postDelayed", "setOnClickListener",
+                 "addCallback", "observe"}
+# Blocks that cache their result across recompositions; sorting there is the fix, not the problem
+REMEMBERED = {"remember", "rememberSaveable"}
+MAIN_FUNCTIONS = {"onCreate", "onStart", "onResume", "onPause", "onStop", "onDestroy", "onCreateView",
+                  "onViewCreated", "onActivityCreated", "onAttach", "onReceive", "onBindViewHolder",
+                  "onCreateViewHolder", "onDraw", "onMeasure", "onLayout", "onClick", "onNewIntent",
+                  "onActivityResult", "onRequestPermissionsResult", "onConfigurationChanged"}
+MAIN_SUPERTYPES_RE = LazyPattern(r'\b(?:\w*Activity|Fragment|\w*ViewModel|Application|View|\w*Adapter)\s*[(<{,]|'
+                                  r'\b(?:\w*Activity|Fragment|\w*ViewModel)\s*$')
+
+
+def dispatcher_of(arguments):
+    """'main', 'background' or None for a dispatcher/context argument list"""
+    if arguments is None:
+        return None
+    if BACKGROUND_DISPATCHER_RE.search(arguments):
+        return "background"
+    if MAIN_DISPATCHER_RE.search(arguments):
+        return "main"
+    return None
+
+
+def scope_dispatcher(receiver, scopes):
+    """Dispatcher of a coroutine scope expression such as viewModelScope or a local val"""
+    receiver = receiver.rstrip(".")
+    name = receiver.rsplit(".", 1)[-1]
+    if name in MAIN_SCOPES or receiver.endswith("lifecycle.coroutineScope"):
+        return "main"
+    if name == "GlobalScope":
+        return "background"
+    if receiver in scopes:
+        return scopes[receiver]
+    if receiver.startswith("CoroutineScope("):
+        return dispatcher_of(receiver) or "background"
+    return None
+
+
+def local_scopes(structure):
+    """{val name: dispatcher} for coroutine scopes created in the file"""
+    scopes = {}
+    for match in SCOPE_VAL_RE.finditer(structure):
+        if match.group(3) is not None:
+            scopes[match.group(1)] = dispatcher_of(match.group(3)) or "background"
+        else:
+            scopes[match.group(1)] = "main"
+    return scopes
+
+
+def class_runs_on_main(structure, brace):
+    """True for Activity, Fragment, ViewModel, View, Adapter and Application subclasses"""
+    prefix, arguments = block_header(structure, brace)
+    header = prefix + ("(" + arguments + ")" if arguments is not None else "")
+    start = max(header.rfind("class "), header.rfind("object "))
+    supertypes = header[start:].partition(":")[2] if start != -1 else ""
+    return bool(MAIN_SUPERTYPES_RE.search(supertypes))
+
+
+def thread_of(structure, stack, scopes):
+    """Return ('main' | 'background' | None, description) for code nested in stack"""
+    for depth in range(len(stack) - 1, -1, -1):
+        brace = stack[depth]
+        prefix, arguments = block_header(structure, brace)
+        fun = FUN_HEADER_RE.search(prefix)
+        if fun:
+            name = fun.group(1)
+            if is_composable(structure, brace):
+                return "main", f"Composable {name}"
+            modifiers = prefix[prefix.rfind("\n", 0, fun.start()) + 1:fun.start()]
+            if name in MAIN_FUNCTIONS and "suspend" not in modifiers:
+                return "main", name
+            return None, name
+        if CLASS_RE.search(prefix):
+            return None, ""
+        named = re.search(r'\b(on[A-Z]\w*)\s*=\s*$', prefix)
+        if named:
+            return "main", f"{named.group(1)} callback"
+        if prefix.rstrip().endswith("init"):
+            outer = stack[depth - 1] if depth else None
+            if outer is not None and class_runs_on_main(structure, outer):
+                return "main", "init"
+            return None, "init"
+        callee = CALLEE_RE.search(prefix)
+        if not callee:
+            continue
+        receiver, name = callee.group(1) or "", callee.group(2)
+        if name == "withContext":
+            dispatcher = dispatcher_of(arguments)
+            if dispatcher:
+                return dispatcher, f"withContext({split_top_level(arguments)[0]})"
+            return None, "withContext"
+        if name in ("launch", "async", "launchIn", "launchWhenCreated", "launchWhenStarted", "launchWhenResumed"):
+            dispatcher = dispatcher_of(arguments)
+            if dispatcher:
+                return dispatcher, f"{receiver}{name}({split_top_level(arguments)[0]})"
+            if receiver:
+                dispatcher = scope_dispatcher(receiver, scopes)
+                if dispatcher:
+                    return dispatcher, f"{receiver}{name}"
+                return None, f"{receiver}{name}"
+            continue  # a nested launch inherits its parent coroutine's dispatcher
+        if name in ("flowOn", "flow", "channelFlow", "callbackFlow", "produce", "actor"):
+            return None, name
+        if name in BACKGROUND_BUILDERS:
+            return "background", name
+        if name in MAIN_BUILDERS:
+            return "main", name
+    return None, ""
+
+
+@lru_cache(maxsize=4)
+def main_thread_calls(content):
+    """[(rule id, offset, what, advice, context)] for blocking calls that run on Main"""
+    structure = strip_comments(content, blank_strings=True)
+    hits = sorted((match.start(), rule_id, what, advice)
+                  for rule_id, pattern, what, advice in BLOCKING_CALLS
+                  for match in pattern.finditer(structure))
+    if not hits:
+        return []
+    scopes = local_scopes(structure)
+    calls = []
+    for (offset, rule_id, what, advice), stack in zip(hits, enclosing_blocks(structure, [hit[0] for hit in hits])):
+        thread, context = thread_of(structure, stack, scopes)
+        if thread == "main" and not (rule_id == "main-thread-cpu" and context in REMEMBERED):
+            calls.append((rule_id, offset, what, advice, context))
+    return calls
+
+
+def report(checker, file_path, content, rule_id):
+    for call_rule, offset, what, advice, context in main_thread_calls(content):
+        if call_rule == rule_id:
+            checker.findings.add(WARNING, "{} in {} {}; use {} instead", what, context, RULE_ADVICE[rule_id], advice,
+                                 file=file_path.name, rule=rule_id, line=line_of(content, offset))
+
+
+PATTERNS = tuple(pattern for _, pattern, _, _ in BLOCKING_CALLS) + (
+    MAIN_DISPATCHER_RE, BACKGROUND_DISPATCHER_RE, CALLEE_RE, FUN_HEADER_RE, CLASS_RE, SCOPE_VAL_RE, MAIN_SUPERTYPES_RE)
+
+
+@kotlin_rule("main-thread-blocking", *PATTERNS)
+def check_main_thread_blocking(checker, file_path, content):
+    """runBlocking, Thread.sleep and synchronous network calls on Main"""
+    report(checker, file_path, content, "main-thread-blocking")
+
+
+@kotlin_rule("main-thread-io")
+def check_main_thread_io(checker, file_path, content):
+    """File and SharedPreferences I/O on Main"""
+    report(checker, file_path, content, "main-thread-io")
+
+
+@kotlin_rule("main-thread-cpu")
+def check_main_thread_cpu(checker, file_path, content):
+    """Synchronous JSON parsing, sorting and bitmap decoding on Main"""
+    report(checker, file_path, content, "main-thread-cpu")
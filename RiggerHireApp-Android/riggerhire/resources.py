@@ -0,0 +1,301 @@
+"""
+Unused and missing Android resource finder
+
+Builds an inverted index of resource references in one pass over the
+Kotlin/Java sources, AndroidManifest.xml and every file under res/:
+``R.color.x``-style field accesses, ``@string/x``-style XML references,
+style parents (explicit and implied by dotted names) and literal
+``getIdentifier`` lookups. Files are scanned in parallel worker processes
+when there are enough of them to pay for the pool.
+
+Resources not reachable from code or the manifest are reported with the
+bytes they cost: their source XML for values entries, the file sizes
+(across all qualifiers) for file resources. References to resources that
+are not defined anywhere are reported with file and line.
+"""
+
+import os
+import re
+from fnmatch import fnmatchcase
+from pathlib import Path
+
+from riggerhire.kotlin import SKIP_DIRS, line_of
+
+PARALLEL_MIN_FILES = 64
+
+VALUE_TYPES = {
+    "string": "string", "color": "color", "dimen": "dimen", "style": "style", "bool": "bool",
+    "integer": "integer", "plurals": "plurals", "string-array": "array", "integer-array": "array",
+    "array": "array", "fraction": "fraction",
+}
+# Defined by the app but consumed through themes and views by name; never reported as unused
+IGNORED_TYPES = {"id", "attr", "styleable"}
+# XML may reference library styles (Theme.Material3...), so those are not reported as missing
+LIBRARY_TYPES = {"style", "attr"}
+SOURCE_SUFFIXES = {".kt", ".java"}
+
+XML_COMMENT_RE = re.compile(r'<!--.*?-->', re.S)
+VALUE_ELEMENT_RE = re.compile(r'<([\w-]+)\b([^>]*?)\bname="([^"]+)"([^>]*?)(?:/>|>(.*?)</\1\s*>)', re.S)
+TYPE_ATTR_RE = re.compile(r'\btype="(\w+)"')
+PARENT_ATTR_RE = re.compile(r'\bparent="([\w.]+)"')
+XML_REF_RE = re.compile(r'@(?:\+)?(?:([\w.]+):)?(\w+)/([\w.]+)')
+CODE_REF_RE = re.compile(r'(?<![\w.])R\.(\w+)\.(\w+)')
+IDENTIFIER_RE = re.compile(r'\bgetIdentifier\(\s*"(\w+)"\s*,\s*"(\w+)"')
+TOOLS_ATTR_RE = re.compile(r'\btools:(keep|discard|shrinkMode)="([^"]*)"')
+KEEP_ITEM_RE = re.compile(r'@(\w+)/([\w.*?]+)$')
+
+
+def canonical(name):
+    """Style names use dots in XML and underscores in R"""
+    return name.replace(".", "_")
+
+
+def blank_comments(text):
+    return XML_COMMENT_RE.sub(lambda match: re.sub(r'[^\n]', " ", match.group(0)), text)
+
+
+def resource_file_key(path):
+    """(type, name) for a file under res/<type>[-qualifiers]/, or None"""
+    parts = path.parts
+    if len(parts) < 3 or parts[-3] != "res":
+        return None
+    res_type = parts[-2].split("-", 1)[0]
+    if res_type == "values":
+        return None
+    return res_type, canonical(path.name.split(".", 1)[0])
+
+
+def scan_file(path):
+    """Scan one file; returns (path, definitions, references, keeps)
+
+    definitions: [(type, name as written, bytes, line)]
+    references:  [(type, name, owner, line)] where owner is the (type, name)
+                 the reference appears in, or None for code and the manifest
+    keeps:       tools:keep patterns as (type, name glob)
+    """
+    path = Path(path)
+    definitions, references, keeps = [], [], []
+    file_key = resource_file_key(path)
+    try:
+        if file_key is not None:
+            definitions.append((*file_key, path.stat().st_size, 1))
+            if path.suffix != ".xml":
+                return str(path), definitions, references, keeps  # images, fonts, raw data
+        text = path.read_text(errors="replace")
+    except OSError:
+        return str(path), definitions, references, keeps
+
+    if path.suffix in SOURCE_SUFFIXES:
+        from riggerhire.kotlin import strip_comments
+
+        code = strip_comments(text)
+        for match in CODE_REF_RE.finditer(code):
+            references.append((match.group(1), match.group(2), None, line_of(code, match.start())))
+        for match in IDENTIFIER_RE.finditer(code):
+            references.append((match.group(2), canonical(match.group(1)), None, line_of(code, match.start())))
+        return str(path), definitions, references, keeps
+
+    text = blank_comments(text)
+    tool_attributes = list(TOOLS_ATTR_RE.finditer(text))
+    if tool_attributes:
+        for match in tool_attributes:
+            if match.group(1) == "keep":
+                for item in match.group(2).split(","):
+                    keep = KEEP_ITEM_RE.match(item.strip())
+                    if keep:
+                        keeps.append((keep.group(1), canonical(keep.group(2))))
+        if file_key is not None and file_key[0] == "raw":
+            return str(path), [], references, keeps  # res/raw/keep.xml is read by the shrinker, not shipped
+        text = TOOLS_ATTR_RE.sub(lambda match: " " * len(match.group(0)), text)
+
+    in_values = path.parent.name.split("-", 1)[0] == "values" and path.parent.parent.name == "res"
+    if not in_values:
+        owner = file_key  # None for the manifest: a root
+        for match in XML_REF_RE.finditer(text):
+            if match.group(1) != "android":
+                references.append((match.group(2), canonical(match.group(3)), owner, line_of(text, match.start())))
+        return str(path), definitions, references, keeps
+
+    for match in VALUE_ELEMENT_RE.finditer(text):
+        tag, attributes = match.group(1), match.group(2) + match.group(4)
+        res_type = VALUE_TYPES.get(tag)
+        if tag == "item":
+            declared = TYPE_ATTR_RE.search(attributes)
+            res_type = declared.group(1) if declared else None
+        elif tag == "declare-styleable":
+            res_type = "styleable"
+        elif tag == "attr":
+            res_type = "attr"
+        if res_type is None:
+            continue
+        name = match.group(3)
+        line = line_of(text, match.start())
+        definitions.append((res_type, name, len(match.group(0).encode()), line))
+        owner = (res_type, canonical(name))
+        parent = PARENT_ATTR_RE.search(attributes)
+        if parent:
+            references.append(("style", canonical(parent.group(1)), owner, line))
+        body = match.group(0)
+        for ref in XML_REF_RE.finditer(body):
+            if ref.group(1) != "android":
+                references.append((ref.group(2), canonical(ref.group(3)), owner,
+                                   line + body.count("\n", 0, ref.start())))
+    return str(path), definitions, references, keeps
+
+
+def iter_project_files(root):
+    """Kotlin/Java sources, manifests and res/ files below root"""
+    for directory, subdirs, files in os.walk(root):
+        subdirs[:] = [d for d in subdirs if d not in SKIP_DIRS and not d.startswith(".")]
+        in_res = "res" in Path(directory).parts
+        for name in files:
+            if in_res or name == "AndroidManifest.xml" or os.path.splitext(name)[1] in SOURCE_SUFFIXES:
+                yield os.path.join(directory, name)
+
+
+class Definition:
+    __slots__ = ("name", "locations", "size")
+
+    def __init__(self, name):
+        self.name = name  # as written in XML, e.g. Theme.App.Dark for R.style.Theme_App_Dark
+        self.locations = []
+        self.size = 0
+
+    @property
+    def primary(self):
+        """The default-configuration location (res/values/ over res/values-night/ ...)"""
+        return min(self.locations, key=lambda location: ("-" in Path(location[0]).parent.name, location))
+
+
+class ResourceIndex:
+    """Definitions plus an inverted index from each resource to where it is referenced"""
+
+    def __init__(self, root, jobs=None):
+        self.root = Path(root)
+        self.jobs = jobs or os.cpu_count() or 1
+        self.files = 0
+        self.definitions = {}
+        self.referenced_by = {}
+        self.keeps = []
+
+    def build(self):
+        paths = sorted(iter_project_files(self.root))
+        self.files = len(paths)
+        if self.jobs > 1 and len(paths) >= PARALLEL_MIN_FILES:
+            from concurrent.futures import ProcessPoolExecutor
+
+            with ProcessPoolExecutor(self.jobs) as pool:
+                results = list(pool.map(scan_file, paths, chunksize=max(1, len(paths) // (self.jobs * 4))))
+        else:
+            results = map(scan_file, paths)
+
+        for path, definitions, references, keeps in results:
+            relative = os.path.relpath(path, self.root)
+            for res_type, name, size, line in definitions:
+                key = (res_type, canonical(name))
+                definition = self.definitions.get(key)
+                if definition is None:
+                    definition = self.definitions[key] = Definition(name)
+                definition.locations.append((relative, line))
+                definition.size += size
+            for res_type, name, owner, line in references:
+                self.referenced_by.setdefault((res_type, name), []).append((owner, relative, line))
+            self.keeps.extend(keeps)
+
+        # A style named A.B.C inherits from A.B when no parent is given
+        for res_type, name in list(self.definitions):
+            if res_type == "style" and "_" in name:
+                parent = name.rsplit("_", 1)[0]
+                if ("style", parent) in self.definitions:
+                    self.referenced_by.setdefault(("style", parent), []).append(
+                        (("style", name), self.definitions[(res_type, name)].primary[0], 0))
+        return self
+
+    def reachable(self):
+        """Resources reachable from code, the manifest and tools:keep"""
+        uses = {}
+        for target, sources in self.referenced_by.items():
+            for owner, _, _ in sources:
+                uses.setdefault(owner, set()).add(target)
+        pending = list(uses.get(None, ()))
+        for keep_type, pattern in self.keeps:
+            pending.extend(key for key in self.definitions if key[0] == keep_type and fnmatchcase(key[1], pattern))
+        seen = set()
+        while pending:
+            key = pending.pop()
+            if key in seen:
+                continue
+            seen.add(key)
+            pending.extend(uses.get(key, ()))
+        return seen
+
+    def unused(self):
+        """[(bytes, type, name, Definition)] largest first"""
+        reached = self.reachable()
+        found = [(definition.size, key[0], definition.name, definition) for key, definition in self.definitions.items()
+                 if key not in reached and key[0] not in IGNORED_TYPES]
+        found.sort(key=lambda item: (-item[0], item[1], item[2]))
+        return found
+
+    def missing(self):
+        """[(type, name, file, line)] references to resources defined nowhere"""
+        found = []
+        for (res_type, name), sources in self.referenced_by.items():
+            if (res_type, name) in self.definitions or res_type in IGNORED_TYPES:
+                continue
+            for owner, path, line in sources:
+                # Code R.* fields are module-local (non-transitive R); XML may name library styles
+                if (owner is None and path.endswith((".kt", ".java"))) or res_type not in LIBRARY_TYPES:
+                    found.append((res_type, name, path, line))
+        found.sort(key=lambda item: (item[2], item[3]))
+        return found
+
+
+def format_bytes(size):
+    return f"{size / 1024:.1f} KB" if size >= 1024 else f"{size} B"
+
+
+def add_arguments(parser):
+    parser.add_argument("--root", default=".", help="Android app root (default: current directory)")
+    parser.add_argument("--jobs", type=int, default=None, help="worker processes for the scan (default: CPU count)")
+    parser.add_argument("--type", action="append", dest="types", metavar="TYPE",
+                        help="only report these resource types (string, color, drawable, ...)")
+    parser.add_argument("--top", type=int, default=0, help="list at most this many unused resources (0 lists all)")
+
+
+def run(args):
+    print("🧹 RiggerHire Android App - Resource Usage")
+    print("=" * 55)
+    index = ResourceIndex(args.root, args.jobs).build()
+    print(f"✅ Indexed {len(index.definitions)} resources and "
+          f"{sum(len(sources) for sources in index.referenced_by.values())} references in {index.files} files")
+
+    unused = [item for item in index.unused() if not args.types or item[1] in args.types]
+    missing = [item for item in index.missing() if not args.types or item[0] in args.types]
+
+    if unused:
+        by_type = {}
+        for size, res_type, _, _ in unused:
+            count, total = by_type.get(res_type, (0, 0))
+            by_type[res_type] = (count + 1, total + size)
+        print(f"\n⚠️  UNUSED RESOURCES ({len(unused)}, {format_bytes(sum(item[0] for item in unused))}):")
+        for res_type, (count, total) in sorted(by_type.items(), key=lambda item: -item[1][1]):
+            print(f"   • {res_type}: {count} ({format_bytes(total)})")
+        print()
+        shown = unused[:args.top] if args.top else unused
+        for size, res_type, name, definition in shown:
+            path, line = definition.primary
+            where = f"{path}:{line}" if line > 1 else path
+            print(f"   • {res_type}/{name}: {format_bytes(size)}  ({where})")
+        if len(shown) < len(unused):
+            print(f"   … and {len(unused) - len(shown)} more")
+    else:
+        print("\n✅ No unused resources")
+
+    if missing:
+        print(f"\n❌ MISSING RESOURCES ({len(missing)}):")
+        for res_type, name, path, line in missing:
+            print(f"   • {path}:{line}: @{res_type}/{name} is not defined")
+        return 1
+    print("\n✅ Every referenced resource is defined")
+    return 0
@@ -0,0 +1,325 @@
+"""
+Room entity/DAO query-index checker
+
+Parses @Entity, @Index, @Dao and @Query declarations across the Kotlin
+sources, extracts the columns each query filters, sorts and joins on, and
+flags queries that would full-scan unindexed columns as well as list
+queries with no LIMIT or paging. The derived schema is loaded into an
+in-memory SQLite database so each query's plan can be confirmed with
+EXPLAIN QUERY PLAN.
+"""
+
+import re
+import sqlite3
+from pathlib import Path
+
+from riggerhire.kotlin import LazyPattern, iter_kotlin_files, line_of, matching, split_top_level, strip_comments
+
+ENTITY_RE = LazyPattern(r'@Entity\b')
+CLASS_RE = LazyPattern(r'\s*(?:@\w+(?:\([^)]*\))?\s*)*(?:data\s+)?class\s+(\w+)\s*\(')
+DAO_RE = LazyPattern(r'@Dao\s+(?:(?:public|internal|abstract)\s+)*(?:interface|class)\s+(\w+)[^{]*\{')
+QUERY_RE = LazyPattern(r'@Query\s*\(')
+FUN_RE = LazyPattern(r'\s*(?:@\w+(?:\([^)]*\))?\s*)*(?:(?:suspend|abstract|open|public)\s+)*fun\s+(\w+)\s*\(')
+STRING_RE = LazyPattern(r'"""(.*?)"""|"((?:[^"\\]|\\.)*)"', re.S)
+PARAM_RE = LazyPattern(r'(?:val|var)\s+(\w+)\s*:\s*([\w.<>?, ]+?)\s*(?:=|$)', re.S)
+NAME_ARG_RE = LazyPattern(r'\bname\s*=\s*"([^"]+)"')
+TABLE_NAME_RE = LazyPattern(r'\btableName\s*=\s*"([^"]+)"')
+LIST_RETURN_RE = LazyPattern(r'^(?:List|MutableList|Array|Flow<List|LiveData<List|Flowable<List|Observable<List|Single<List)\b')
+PAGED_RETURN_RE = LazyPattern(r'PagingSource|DataSource\.Factory|PagedList')
+
+SQL_CLAUSE_END = r'(?=\bGROUP\s+BY\b|\bORDER\s+BY\b|\bLIMIT\b|\bHAVING\b|\bUNION\b|$)'
+SQL_TABLE_RE = LazyPattern(r'\b(?:FROM|JOIN|UPDATE|INTO)\s+[`"]?(\w+)[`"]?(?:\s+(?:AS\s+)?(?!ON\b|WHERE\b|JOIN\b|LEFT\b|INNER\b|CROSS\b|ORDER\b|GROUP\b|LIMIT\b|SET\b|VALUES\b|SELECT\b)(\w+))?', re.I)
+SQL_WHERE_RE = LazyPattern(r'\bWHERE\b(.*?)' + SQL_CLAUSE_END, re.I | re.S)
+SQL_ORDER_RE = LazyPattern(r'\bORDER\s+BY\b(.*?)(?=\bLIMIT\b|\bOFFSET\b|$)', re.I | re.S)
+SQL_ON_RE = LazyPattern(r'\bON\b(.*?)(?=\bWHERE\b|\bJOIN\b|\bLEFT\b|\bINNER\b|\bGROUP\b|\bORDER\b|\bLIMIT\b|$)', re.I | re.S)
+SQL_PREDICATE_RE = LazyPattern(r'(?:(\w+)\.)?[`"]?(\w+)[`"]?\s*(?:=|==|!=|<>|<=|>=|<|>|\bLIKE\b|\bGLOB\b|\bIN\b|\bBETWEEN\b|\bIS\b)', re.I)
+SQL_COLUMN_RE = LazyPattern(r'(?:(\w+)\.)?[`"]?(\w+)[`"]?')
+# Statements EXPLAIN QUERY PLAN can describe; DDL and PRAGMAs are left to the column heuristic
+SQL_DML_RE = LazyPattern(r'\s*(?:WITH|SELECT|INSERT|REPLACE|UPDATE|DELETE)\b', re.I)
+
+SQLITE_TYPES = {
+    "Int": "INTEGER", "Long": "INTEGER", "Short": "INTEGER", "Byte": "INTEGER", "Boolean": "INTEGER",
+    "Double": "REAL", "Float": "REAL",
+    "String": "TEXT", "Char": "TEXT",
+    "ByteArray": "BLOB",
+}
+
+
+class Entity:
+    def __init__(self, class_name, table, file_name, line):
+        self.class_name = class_name
+        self.table = table
+        self.file_name = file_name
+        self.line = line
+        self.columns = {}         # column name -> SQLite type
+        self.primary_key = []
+        self.indices = []         # (unique, [columns])
+
+    def leading_columns(self):
+        """Columns SQLite can seek on: the primary key head and every index head"""
+        heads = {index[0] for _, index in self.indices if index}
+        if self.primary_key:
+            heads.add(self.primary_key[0])
+        return heads
+
+    def schema(self):
+        columns = [f'"{name}" {sql_type}' for name, sql_type in self.columns.items()]
+        if self.primary_key:
+            columns.append("PRIMARY KEY(" + ", ".join(f'"{c}"' for c in self.primary_key) + ")")
+        statements = [f'CREATE TABLE "{self.table}" ({", ".join(columns)})']
+        for unique, index in self.indices:
+            name = f"index_{self.table}_" + "_".join(index)
+            statements.append(f'CREATE {"UNIQUE " if unique else ""}INDEX "{name}" ON "{self.table}" '
+                              f'({", ".join(chr(34) + c + chr(34) for c in index)})')
+        return statements
+
+
+class DaoQuery:
+    def __init__(self, dao, function, sql, return_type, file_name, line):
+        self.dao = dao
+        self.function = function
+        self.sql = sql
+        self.return_type = return_type
+        self.file_name = file_name
+        self.line = line
+
+    @property
+    def label(self):
+        return f"{self.file_name}:{self.line} {self.dao}.{self.function}"
+
+
+def _string_literal(expression):
+    """Concatenate the string literals of an annotation argument"""
+    parts = []
+    for triple, plain in STRING_RE.findall(expression):
+        parts.append(triple if triple else plain)
+    return " ".join(" ".join(parts).split())
+
+
+def _sqlite_type(kotlin_type):
+    base = kotlin_type.strip().rstrip("?").split("<")[0].split(".")[-1]
+    return SQLITE_TYPES.get(base, "TEXT")
+
+
+def _string_list(expression):
+    """["a", "b"] or "a" -> [a, b]"""
+    return [plain or triple for triple, plain in STRING_RE.findall(expression)]
+
+
+def parse_entities(text, file_name):
+    entities = []
+    for match in ENTITY_RE.finditer(text):
+        pos = match.end()
+        args = ""
+        rest = text[pos:]
+        if rest.lstrip().startswith("("):
+            open_at = pos + len(rest) - len(rest.lstrip())
+            close_at = matching(text, open_at)
+            if close_at == -1:
+                continue
+            args = text[open_at + 1:close_at]
+            pos = close_at + 1
+        class_match = CLASS_RE.match(text, pos)
+        if not class_match:
+            continue
+        class_name = class_match.group(1)
+        table_match = TABLE_NAME_RE.search(args)
+        entity = Entity(class_name, table_match.group(1) if table_match else class_name,
+                        file_name, line_of(text, match.start()))
+
+        ctor_open = class_match.end() - 1
+        ctor_close = matching(text, ctor_open)
+        for param in split_top_level(text[ctor_open + 1:ctor_close]):
+            if re.search(r'@Ignore\b', param):
+                continue
+            param_match = PARAM_RE.search(param)
+            if not param_match:
+                continue
+            field, kotlin_type = param_match.groups()
+            column_info = re.search(r'@ColumnInfo\s*\(([^)]*)\)', param)
+            name_match = NAME_ARG_RE.search(column_info.group(1)) if column_info else None
+            column = name_match.group(1) if name_match else field
+            entity.columns[column] = _sqlite_type(kotlin_type)
+            if "@PrimaryKey" in param:
+                entity.primary_key = [column]
+            if column_info and re.search(r'\bindex\s*=\s*true', column_info.group(1)):
+                entity.indices.append((False, [column]))
+
+        primary_keys = re.search(r'\bprimaryKeys\s*=\s*(\[[^\]]*\]|arrayOf\([^)]*\))', args)
+        if primary_keys:
+            entity.primary_key = _string_list(primary_keys.group(1))
+        for index_match in re.finditer(r'\bIndex\s*\(', args):
+            open_at = index_match.end() - 1
+            index_args = args[open_at + 1:matching(args, open_at)]
+            value = re.search(r'\bvalue\s*=\s*(\[[^\]]*\]|arrayOf\([^)]*\))', index_args)
+            columns = _string_list(value.group(1) if value else index_args.split("unique")[0])
+            unique = bool(re.search(r'\bunique\s*=\s*true', index_args))
+            if columns:
+                entity.indices.append((unique, columns))
+        entities.append(entity)
+    return entities
+
+
+def parse_dao_queries(text, file_name):
+    queries = []
+    for dao_match in DAO_RE.finditer(text):
+        body_open = dao_match.end() - 1
+        body_close = matching(text, body_open)
+        body_close = len(text) if body_close == -1 else body_close
+        for query_match in QUERY_RE.finditer(text, body_open, body_close):
+            open_at = query_match.end() - 1
+            close_at = matching(text, open_at)
+            if close_at == -1:
+                continue
+            sql = _string_literal(text[open_at + 1:close_at])
+            fun_match = FUN_RE.match(text, close_at + 1)
+            if not sql or not fun_match:
+                continue
+            params_close = matching(text, fun_match.end() - 1)
+            signature_tail = text[params_close + 1:params_close + 200]
+            return_match = re.match(r'\s*:\s*([\w.<>?, ]+?)\s*(?:\n|\{|=|$)', signature_tail)
+            queries.append(DaoQuery(dao_match.group(1), fun_match.group(1), sql,
+                                    return_match.group(1).strip() if return_match else "Unit",
+                                    file_name, line_of(text, query_match.start())))
+    return queries
+
+
+def query_tables(sql):
+    """{alias_or_table: table} for every table in FROM/JOIN"""
+    tables = {}
+    for table, alias in SQL_TABLE_RE.findall(sql):
+        tables[table] = table
+        if alias:
+            tables[alias] = table
+    return tables
+
+
+def used_columns(sql):
+    """[(clause, qualifier, column)] for WHERE, ORDER BY and JOIN ON columns"""
+    sql = re.sub(r"'(?:[^']|'')*'", "''", sql)
+    used = []
+    for where in SQL_WHERE_RE.findall(sql):
+        used += [("WHERE", q, c) for q, c in SQL_PREDICATE_RE.findall(where)]
+    for on in SQL_ON_RE.findall(sql):
+        used += [("JOIN", q, c) for q, c in SQL_COLUMN_RE.findall(on) if not c.isdigit()]
+    for order in SQL_ORDER_RE.findall(sql):
+        for term in order.split(","):
+            column = SQL_COLUMN_RE.match(term.strip())
+            if column:
+                used.append(("ORDER BY", column.group(1), column.group(2)))
+    return used
+
+
+class RoomQueryChecker:
+    def __init__(self, root_path=None):
+        self.root_path = Path(root_path) if root_path else Path.cwd()
+        self.issues = []
+        self.warnings = []
+        self.entities = {}
+        self.queries = []
+        self.db = None
+
+    def collect(self):
+        """Parse every Kotlin file for entities and DAO queries"""
+        print("🔍 Collecting Room entities and DAO queries...")
+        for kt_file in iter_kotlin_files(self.root_path):
+            try:
+                text = strip_comments(kt_file.read_text(encoding="utf-8", errors="replace"))
+            except OSError as e:
+                self.issues.append(f"Error reading {kt_file}: {e}")
+                continue
+            if "@Entity" in text:
+                for entity in parse_entities(text, kt_file.name):
+                    self.entities[entity.table] = entity
+            if "@Dao" in text:
+                self.queries += parse_dao_queries(text, kt_file.name)
+        print(f"✅ {len(self.entities)} entities, {len(self.queries)} @Query functions")
+
+    def load_schema(self):
+        """Load the derived schema into an in-memory SQLite database"""
+        self.db = sqlite3.connect(":memory:")
+        for entity in self.entities.values():
+            for statement in entity.schema():
+                try:
+                    self.db.execute(statement)
+                except sqlite3.Error as e:
+                    self.warnings.append(f"{entity.file_name}:{entity.line}: could not derive schema for "
+                                         f"{entity.table}: {e}")
+
+    def query_plan(self, query):
+        """EXPLAIN QUERY PLAN detail lines, or None when SQLite cannot prepare the query"""
+        params = dict.fromkeys(re.findall(r'(?<!:):(\w+)', query.sql))
+        try:
+            return [row[3] for row in self.db.execute("EXPLAIN QUERY PLAN " + query.sql, params)]
+        except sqlite3.Error:
+            return None
+
+    def check_query(self, query):
+        tables = query_tables(query.sql)
+        unindexed = []
+        for clause, qualifier, column in used_columns(query.sql):
+            candidates = [tables[qualifier]] if qualifier in tables else list(dict.fromkeys(tables.values()))
+            for table in candidates:
+                entity = self.entities.get(table)
+                if entity and column in entity.columns:
+                    if column not in entity.leading_columns():
+                        unindexed.append(f"{clause} {table}.{column}")
+                    break
+
+        plan = self.query_plan(query) if SQL_DML_RE.match(query.sql) else None
+        if plan is not None:
+            scans = [detail for detail in plan
+                     if detail.startswith("SCAN ") and "INDEX" not in detail and "SUBQUERY" not in detail]
+            # An unindexed ORDER BY column is what causes the temp B-tree, so report the sort once
+            temp_sort = any("TEMP B-TREE" in detail for detail in plan)
+            if not temp_sort:
+                # A later column of a composite index can still serve the sort
+                unindexed = [column for column in unindexed if not column.startswith("ORDER BY")]
+            sorts = ", sorted with a temp B-tree" if temp_sort else ""
+            if scans and unindexed:
+                self.issues.append(f"{query.label}: full table scan ({'; '.join(scans)}) "
+                                   f"on unindexed {', '.join(unindexed)}{sorts}")
+            elif unindexed:
+                self.warnings.append(f"{query.label}: unindexed {', '.join(unindexed)}{sorts} "
+                                     f"(plan: {'; '.join(plan)})")
+            elif temp_sort:
+                self.warnings.append(f"{query.label}: sorts with a temp B-tree; index the ORDER BY columns")
+        elif unindexed:
+            self.issues.append(f"{query.label}: would full-scan unindexed {', '.join(unindexed)}")
+
+        if (LIST_RETURN_RE.match(query.return_type) and not PAGED_RETURN_RE.search(query.return_type)
+                and not re.search(r'\bLIMIT\b', query.sql, re.I)):
+            self.warnings.append(f"{query.label}: returns unbounded {query.return_type} without LIMIT or paging")
+
+    def run_all_checks(self):
+        print("🗄️ RiggerHire Android App - Room Query Index Check")
+        print("=" * 55)
+
+        self.collect()
+        self.load_schema()
+        for entity in self.entities.values():
+            indexed = ", ".join("+".join(index) for _, index in entity.indices) or "none"
+            print(f"📋 {entity.table} ({len(entity.columns)} columns) indices: {indexed}")
+        for query in self.queries:
+            self.check_query(query)
+
+        if self.issues:
+            print(f"\n❌ FULL SCANS ({len(self.issues)}):")
+            for issue in self.issues:
+                print(f"   • {issue}")
+        if self.warnings:
+            print(f"\n⚠️  WARNINGS ({len(self.warnings)}):")
+            for warning in self.warnings:
+                print(f"   • {warning}")
+        if not self.issues and not self.warnings:
+            print("\n🎉 Every Room query is index-backed and bounded.")
+
+        return len(self.issues) == 0
+
+
+def add_arguments(parser):
+    parser.add_argument("--root", default=".", help="Android app root (default: current directory)")
+
+
+def run(args):
+    return 0 if RoomQueryChecker(args.root).run_all_checks() else 1
@@ -0,0 +1,155 @@
+"""
+Kotlin rule registry and time-budget watchdog for the integration checker
+
+Rules register with ``@kotlin_rule(rule_id, *patterns)``. Every pattern is
+checked at registration time and rejected if it nests one unbounded
+quantifier inside another (``(a+)+``, ``(\\s*\\w+)*``), the shape that
+backtracks exponentially. At run time the Watchdog aborts a rule that
+overruns its budget with a SIGALRM interval timer; ``re`` matching checks
+for signals, so even a runaway regex is interrupted.
+"""
+
+import signal
+import time
+
+try:
+    from re import _parser as sre_parse
+except ImportError:  # Python < 3.11
+    import sre_parse
+
+REPEATS = {sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT}
+
+
+class UnsafePatternError(ValueError):
+    pass
+
+
+class RuleTimeout(Exception):
+    pass
+
+
+def _nested_unbounded(items, inside_unbounded=False):
+    """Return True if an unbounded repeat appears inside another unbounded repeat"""
+    for op, av in items:
+        if op in REPEATS:
+            low, high, sub = av
+            unbounded = high == sre_parse.MAXREPEAT
+            if unbounded and inside_unbounded:
+                return True
+            if _nested_unbounded(sub, inside_unbounded or unbounded):
+                return True
+        elif op == sre_parse.SUBPATTERN:
+            if _nested_unbounded(av[-1], inside_unbounded):
+                return True
+        elif op == sre_parse.BRANCH:
+            if any(_nested_unbounded(branch, inside_unbounded) for branch in av[1]):
+                return True
+        elif op in (sre_parse.ASSERT, sre_parse.ASSERT_NOT):
+            if _nested_unbounded(av[1], inside_unbounded):
+                return True
+        elif op == sre_parse.GROUPREF_EXISTS:
+            if any(branch is not None and _nested_unbounded(branch, inside_unbounded) for branch in av[1:]):
+                return True
+        # POSSESSIVE_REPEAT and ATOMIC_GROUP cannot backtrack, so they are safe
+    return False
+
+
+def check_pattern_safety(rule_id, pattern):
+    """Raise UnsafePatternError for patterns with nested unbounded quantifiers"""
+    source, flags = (pattern, 0) if isinstance(pattern, (str, bytes)) else (pattern.pattern, pattern.flags)
+    if isinstance(source, bytes):
+        source = source.decode("latin-1")
+    if _nested_unbounded(sre_parse.parse(source, flags)):
+        raise UnsafePatternError(f"rule {rule_id}: pattern {source!r} nests unbounded quantifiers "
+                                 f"and can backtrack exponentially")
+
+
+class Rule:
+    def __init__(self, rule_id, check, patterns=()):
+        for pattern in patterns:
+            check_pattern_safety(rule_id, pattern)
+        self.rule_id = rule_id
+        self.check = check
+        self.patterns = patterns
+
+
+KOTLIN_RULES = []
+
+
+def kotlin_rule(rule_id, *patterns):
+    """Register check(checker, file_path, content) as a Kotlin rule"""
+    def register(check):
+        if any(rule.rule_id == rule_id for rule in KOTLIN_RULES):
+            raise ValueError(f"duplicate rule id: {rule_id}")
+        KOTLIN_RULES.append(Rule(rule_id, check, patterns))
+        return check
+    return register
+
+
+class Watchdog:
+    """Run rules under per-rule and per-file wall-clock budgets
+
+    On platforms without setitimer, or off the main thread, rules cannot be
+    interrupted; overruns are then only reported after the rule finishes.
+    Rules that record findings should run with the FindingTable staged, so
+    an abort cannot leave half a row behind.
+    """
+
+    def __init__(self, rule_budget=0.5, file_budget=2.0):
+        self.rule_budget = rule_budget
+        self.file_budget = file_budget
+        self.can_interrupt = hasattr(signal, "setitimer")
+
+    @staticmethod
+    def _expired(signum, frame):
+        raise RuleTimeout()
+
+    def run(self, rule, budget, *args):
+        """Run rule.check(*args); raise RuleTimeout if it overruns budget seconds"""
+        armed = False
+        if self.can_interrupt and budget > 0:
+            try:
+                previous = signal.signal(signal.SIGALRM, self._expired)
+                armed = True
+            except ValueError:  # not the main thread
+                pass
+        start = time.perf_counter()
+        try:
+            try:
+                if armed:
+                    signal.setitimer(signal.ITIMER_REAL, budget)
+                rule.check(*args)
+            finally:
+                # The alarm may fire after check() returns but before this
+                # disarms it; the handler is restored in the outer finally
+                if armed:
+                    signal.setitimer(signal.ITIMER_REAL, 0)
+        finally:
+            if armed:
+                signal.signal(signal.SIGALRM, previous)
+        if budget > 0 and time.perf_counter() - start > budget:
+            raise RuleTimeout()
+
+    def run_file(self, rules, on_timeout, *args):
+        """Run every rule on one file, aborting rules that overrun their budget
+
+        on_timeout(rule, elapsed, file_budget_exhausted) is called for each
+        abort; once the file budget is spent the remaining rules are skipped.
+        """
+        file_start = time.perf_counter()
+        for rule in rules:
+            remaining = self.file_budget - (time.perf_counter() - file_start) if self.file_budget > 0 else 0
+            if self.file_budget > 0 and remaining <= 0:
+                on_timeout(rule, 0.0, True)
+                return
+            budgets = [b for b in (self.rule_budget, remaining) if b > 0]
+            budget = min(budgets) if budgets else 0
+            rule_start = time.perf_counter()
+            try:
+                self.run(rule, budget, *args)
+            except RuleTimeout:
+                elapsed = time.perf_counter() - rule_start
+                exhausted = self.file_budget > 0 and time.perf_counter() - file_start >= self.file_budget
+                on_timeout(rule, elapsed, exhausted)
+                if exhausted:
+                    return
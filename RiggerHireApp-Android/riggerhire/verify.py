@@ -0,0 +1,396 @@
+#!/usr/bin/env python3
+"""
+RiggerHire Android App Integration Verification Script
+Checks that all components work together properly
+"""
+
+import re
+import sys
+from pathlib import Path
+
+from riggerhire.findings import ISSUE, TIMEOUT, WARNING, FindingTable, FindingView
+from riggerhire.rules import KOTLIN_RULES, Watchdog, kotlin_rule
+
+INCOMPLETE_COLOR_RE = re.compile(r'Color\(0x[0-9A-F]{1,5}\)')
+TEXT_FUNCTION_RE = re.compile(r'fun\s+(\w+)\([^)]*\)\s*\{[^}]*Text\(')
+
+# Modules whose rules register on import; loaded on the first Kotlin file so
+# `verify --help` and non-Kotlin hook runs never import them
+RULE_MODULES = ("riggerhire.logging_lint", "riggerhire.mainthread")
+
+def kotlin_rules():
+    """KOTLIN_RULES with every rule module registered"""
+    from importlib import import_module
+
+    for name in RULE_MODULES:
+        import_module(name)
+    return KOTLIN_RULES
+
+@kotlin_rule("theme-import")
+def check_theme_import(checker, file_path, content):
+    """Uses RiggerHireTheme without importing it"""
+    if "RiggerHireTheme" in content and "import com.tiation.riggerhire.ui.theme.RiggerHireTheme" not in content:
+        # Check if it's MainActivity (which might have inline theme) or the theme file itself
+        if "MainActivity.kt" not in str(file_path) and "RiggerHireTheme.kt" not in str(file_path):
+            checker.findings.add(WARNING, "Uses RiggerHireTheme but missing import",
+                                 file=file_path.name, rule="theme-import")
+
+@kotlin_rule("incomplete-color", INCOMPLETE_COLOR_RE)
+def check_incomplete_colors(checker, file_path, content):
+    """Color(0x...) literals with too few hex digits"""
+    if INCOMPLETE_COLOR_RE.search(content):
+        checker.findings.add(WARNING, "Found incomplete color definitions",
+                             file=file_path.name, rule="incomplete-color")
+
+@kotlin_rule("missing-composable", TEXT_FUNCTION_RE)
+def check_missing_composable(checker, file_path, content):
+    """Functions emitting Text( without @Composable"""
+    for match in TEXT_FUNCTION_RE.finditer(content):
+        func = match.group(1)
+        if f"@Composable\n    fun {func}" not in content and re.search(rf"@Composable\s+fun {func}", content) is None:
+            checker.findings.add(WARNING, "Function {} might need @Composable annotation", func,
+                                 file=file_path.name, rule="missing-composable",
+                                 line=content.count("\n", 0, match.start()) + 1)
+
+class IntegrationChecker:
+    def __init__(self, root_path=None, rule_budget=0.5, file_budget=2.0, max_findings=200):
+        self.root_path = Path(root_path) if root_path else Path.cwd()
+        self.watchdog = Watchdog(rule_budget, file_budget)
+        self.findings = FindingTable()
+        self.issues = FindingView(self.findings, ISSUE)
+        self.warnings = FindingView(self.findings, WARNING)
+        self.timeouts = FindingView(self.findings, TIMEOUT)
+        self.max_findings = max_findings
+        self.all_activities = set()
+        self.all_imports = set()
+        self.log_calls = {}
+        self.log_levels = set()
+        
+    def check_file_structure(self):
+        """Check that all necessary files exist"""
+        print("🔍 Checking file structure...")
+        
+        required_files = [
+            "app/build.gradle",
+            "app/src/main/AndroidManifest.xml",
+            "app/src/main/java/com/tiation/riggerhire/ui/MainActivity.kt",
+            "app/src/main/java/com/tiation/riggerhire/ui/theme/RiggerHireTheme.kt",
+            "app/src/main/java/com/tiation/riggerhire/ui/payments/PaymentsActivity.kt",
+            "app/src/main/java/com/tiation/riggerhire/ui/jobs/JobDetailActivity.kt",
+            "app/src/main/res/values/strings.xml",
+            "app/src/main/res/values/colors.xml",
+            "app/src/main/res/values/styles.xml"
+        ]
+        
+        for file_path in required_files:
+            full_path = self.root_path / file_path
+            if not full_path.exists():
+                self.findings.add(ISSUE, "Missing required file: {}", file_path, rule="file-structure")
+            else:
+                print(f"✅ {file_path}")
+                
+    def check_android_manifest(self):
+        """Check AndroidManifest.xml for activity declarations"""
+        print("\\n📋 Checking AndroidManifest.xml...")
+        
+        manifest_path = self.root_path / "app/src/main/AndroidManifest.xml"
+        if not manifest_path.exists():
+            self.findings.add(ISSUE, "AndroidManifest.xml not found", rule="manifest")
+            return
+            
+        content = manifest_path.read_text()
+        
+        # Check for required activities
+        required_activities = [
+            "MainActivity",
+            "LoginActivity", 
+            "RegisterActivity",
+            "JobDetailActivity",
+            "JobsListActivity",
+            "PaymentsActivity",
+            "ProfileActivity"
+        ]
+        
+        for activity in required_activities:
+            # Pattern to match activity declaration
+            pattern = rf'android:name=".*{activity}"'
+            if re.search(pattern, content):
+                print(f"✅ {activity} declared")
+                self.all_activities.add(activity)
+            else:
+                self.findings.add(WARNING, "Activity {} not found in manifest", activity, rule="manifest")
+                
+    def check_kotlin_files(self):
+        """Check Kotlin files for common issues"""
+        print("\\n🔧 Checking Kotlin files...")
+        
+        kotlin_files = list(self.root_path.glob("**/*.kt"))
+        
+        for kt_file in kotlin_files:
+            self.check_kotlin_file(kt_file)
+            
+    def check_kotlin_file(self, file_path: Path):
+        """Check individual Kotlin file against every registered rule"""
+        try:
+            content = file_path.read_text()
+        except Exception as e:
+            self.findings.add(ISSUE, "Error reading {}: {}", file_path, e, rule="read-error")
+            return
+
+        def on_timeout(rule, elapsed, file_budget_exhausted):
+            budget = "file" if file_budget_exhausted else "rule"
+            self.findings.add(TIMEOUT, "rule {} aborted after {:.0f} ms ({} budget exceeded)",
+                              rule.rule_id, elapsed * 1000, budget, file=file_path.name, rule=rule.rule_id)
+
+        try:
+            self.findings.stage()
+            try:
+                self.watchdog.run_file(kotlin_rules(), on_timeout, self, file_path, content)
+            finally:
+                self.findings.commit()
+            print(f"✅ {file_path.name} - Basic syntax check passed")
+        except Exception as e:
+            self.findings.add(ISSUE, "Error checking {}: {}", file_path, e, rule="check-error")
+            
+    def check_theme_consistency(self):
+        """Check theme color consistency across files"""
+        print("\\n🎨 Checking theme consistency...")
+        
+        # Read colors.xml
+        colors_file = self.root_path / "app/src/main/res/values/colors.xml"
+        if colors_file.exists():
+            colors_content = colors_file.read_text()
+            
+            # Extract color definitions
+            color_definitions = re.findall(r'<color name="([^"]+)">#([0-9A-F]{6,8})</color>', colors_content)
+            defined_colors = {name: value for name, value in color_definitions}
+            
+            print(f"✅ Found {len(defined_colors)} color definitions")
+            
+            # Check for consistent neon theme colors
+            required_colors = ['neon_cyan', 'neon_magenta', 'dark_background', 'dark_surface', 'text_primary']
+            for color in required_colors:
+                if color in defined_colors:
+                    print(f"✅ {color}: #{defined_colors[color]}")
+                else:
+                    self.findings.add(ISSUE, "Missing required color: {}", color, rule="theme-colors")
+        else:
+            self.findings.add(ISSUE, "colors.xml not found", rule="theme-colors")
+            
+    def check_string_resources(self):
+        """Check string resources are defined"""
+        print("\\n📝 Checking string resources...")
+        
+        strings_file = self.root_path / "app/src/main/res/values/strings.xml"
+        if strings_file.exists():
+            strings_content = strings_file.read_text()
+            
+            # Check for app-specific strings
+            required_strings = ['app_name', 'app_description', 'app_tagline']
+            for string_name in required_strings:
+                if f'<string name="{string_name}">' in strings_content:
+                    print(f"✅ {string_name}")
+                else:
+                    self.findings.add(ISSUE, "Missing required string: {}", string_name, rule="strings")
+        else:
+            self.findings.add(ISSUE, "strings.xml not found", rule="strings")
+            
+    def check_resource_usage(self):
+        """Check every resource is used and every referenced resource exists"""
+        from riggerhire.resources import ResourceIndex, format_bytes
+
+        print("\\n🧹 Checking resource usage...")
+
+        index = ResourceIndex(self.root_path).build()
+        print(f"✅ Indexed {len(index.definitions)} resources in {index.files} files")
+
+        unused = index.unused()
+        if unused:
+            largest = ", ".join(f"{res_type}/{name}" for _, res_type, name, _ in unused[:3])
+            self.findings.add(WARNING, "{} unused resources ({}), largest: {}; run 'riggerhire resources' for the list",
+                              len(unused), format_bytes(sum(item[0] for item in unused)), largest,
+                              rule="unused-resource")
+        for res_type, name, path, line in index.missing():
+            self.findings.add(ISSUE, "@{}/{} is not defined", res_type, name,
+                              file=Path(path).name, rule="missing-resource", line=line)
+
+    def check_dependencies(self):
+        """Check build.gradle dependencies"""
+        print("\\n📦 Checking dependencies...")
+        
+        gradle_file = self.root_path / "app/build.gradle"
+        if gradle_file.exists():
+            gradle_content = gradle_file.read_text()
+            
+            required_deps = [
+                'androidx.compose.material3:material3',
+                'androidx.compose.ui:ui-tooling',
+                'androidx.activity:activity-compose',
+                'androidx.core:core-ktx'
+            ]
+            
+            for dep in required_deps:
+                if dep in gradle_content:
+                    print(f"✅ {dep}")
+                else:
+                    self.findings.add(WARNING, "Dependency might be missing: {}", dep, rule="dependencies")
+                    
+            # Check Compose version compatibility
+            if 'compose_version' in gradle_content:
+                print("✅ Compose version variable found")
+            else:
+                self.findings.add(WARNING, "compose_version variable not found", rule="dependencies")
+                
+        else:
+            self.findings.add(ISSUE, "build.gradle not found", rule="dependencies")
+            
+    def check_release_logging(self):
+        """Check where log calls run and that release builds strip them"""
+        from riggerhire.logging_lint import CONTEXT_LABELS, check_log_stripping
+
+        print("\\n🪵 Checking release logging...")
+
+        for context, count in sorted(self.log_calls.items(), key=lambda item: -item[1]):
+            label = CONTEXT_LABELS.get(context, "cold path")
+            print(f"✅ {count} log call(s) in {label}")
+        check_log_stripping(self, self.root_path)
+
+    def check_baseline_profile(self):
+        """Check baseline-prof.txt matches the static startup call graph"""
+        from riggerhire.baselineprofile import PROFILE_PATH, generate, read_rules
+
+        print("\\n🚀 Checking baseline profile...")
+
+        _, _, startup, _, rules = generate(self.root_path)
+        profile = self.root_path / PROFILE_PATH
+        if not profile.exists():
+            self.findings.add(WARNING, "No baseline-prof.txt, so ART interprets the {} cold-start classes and methods "
+                              "on first launch; run 'riggerhire baseline-profile --write'", len(startup),
+                              rule="baseline-profile")
+            return
+        existing = set(read_rules(profile))
+        missing = sum(1 for rule in rules if rule not in existing)
+        stale = len(existing - set(rules))
+        if missing or stale:
+            self.findings.add(WARNING, "baseline-prof.txt is out of sync with the startup call graph ({} missing, "
+                              "{} stale rules); run 'riggerhire baseline-profile --write'", missing, stale,
+                              file="baseline-prof.txt", rule="baseline-profile")
+        else:
+            print(f"✅ baseline-prof.txt has all {len(rules)} rules for the startup call graph")
+
+    def print_findings(self, severity, heading):
+        """Print one severity sorted by file and line, capped at max_findings"""
+        rows = self.findings.rows(severity, ordered=True)
+        if not rows:
+            return
+        print(f"\\n{heading} ({len(rows)}):")
+        shown = rows[:self.max_findings] if self.max_findings else rows
+        for row in shown:
+            print(f"   • {self.findings.message(row)}")
+        if len(shown) < len(rows):
+            print(f"   … and {len(rows) - len(shown)} more")
+
+    def generate_summary(self):
+        """Generate integration check summary"""
+        print("\\n" + "="*60)
+        print("🏗️ RiggerHire Android App - Integration Check Summary")
+        print("="*60)
+
+        issue_count = self.findings.count(ISSUE)
+        warning_count = self.findings.count(WARNING)
+        timeout_count = self.findings.count(TIMEOUT)
+        
+        if not len(self.findings):
+            print("🎉 ALL CHECKS PASSED! Your app structure looks good.")
+            print("\\n✅ Ready for build and testing!")
+            
+            print("\\n📱 Available Activities:")
+            for activity in sorted(self.all_activities):
+                print(f"   • {activity}")
+                
+        else:
+            self.print_findings(ISSUE, "❌ CRITICAL ISSUES")
+            self.print_findings(WARNING, "⚠️  WARNINGS")
+            self.print_findings(TIMEOUT, "⏱️  RULE TIMEOUTS")
+                    
+        print(f"\\n📊 Statistics:")
+        print(f"   • Activities found: {len(self.all_activities)}")
+        print(f"   • Critical issues: {issue_count}")
+        print(f"   • Warnings: {warning_count}")
+        print(f"   • Rule timeouts: {timeout_count}")
+        by_rule = self.findings.counts_by_rule()
+        if by_rule:
+            print("   • By rule: " + ", ".join(f"{rule or 'other'} {count}" for rule, count in by_rule))
+        
+        # Integration recommendations
+        print("\\n💡 Next Steps:")
+        if issue_count == 0:
+            print("   1. ✅ Structure verification complete")
+            print("   2. 🔨 Ready to build with Android Studio")  
+            print("   3. 📱 Test on device/emulator")
+            print("   4. 🚀 Deploy to internal testing")
+        else:
+            print("   1. 🔧 Fix critical issues first")
+            print("   2. ⚠️  Review warnings")
+            print("   3. 🔄 Re-run verification")
+            
+    def run_all_checks(self):
+        """Run all integration checks"""
+        print("🏗️ RiggerHire Android App - Integration Verification")
+        print("=" * 55)
+        
+        self.check_file_structure()
+        self.check_android_manifest()
+        self.check_kotlin_files()
+        self.check_theme_consistency()
+        self.check_string_resources()
+        self.check_resource_usage()
+        self.check_dependencies()
+        self.check_release_logging()
+        self.check_baseline_profile()
+        self.generate_summary()
+        
+        return self.findings.count(ISSUE) == 0
+
+    def run_incremental(self, paths):
+        """Check only the given Kotlin files, for pre-commit hooks"""
+        for path in paths:
+            file_path = Path(path)
+            if not file_path.is_absolute() and not file_path.exists():
+                file_path = self.root_path / file_path
+            if file_path.suffix == ".kt":
+                self.check_kotlin_file(file_path)
+        self.generate_summary()
+
+        return self.findings.count(ISSUE) == 0
+
+def add_arguments(parser):
+    parser.add_argument("files", nargs="*",
+                        help="only check these Kotlin files (incremental mode for hooks)")
+    parser.add_argument("--root", default=".", help="Android app root (default: current directory)")
+    parser.add_argument("--rule-budget-ms", type=float, default=500,
+                        help="abort a rule that runs longer than this on one file (0 disables)")
+    parser.add_argument("--file-budget-ms", type=float, default=2000,
+                        help="skip remaining rules once a file has used this much time (0 disables)")
+    parser.add_argument("--max-findings", type=int, default=200,
+                        help="list at most this many findings per severity (0 lists all)")
+
+def run(args):
+    checker = IntegrationChecker(args.root, args.rule_budget_ms / 1000, args.file_budget_ms / 1000,
+                                 args.max_findings)
+    if args.files:
+        success = checker.run_incremental(args.files)
+    else:
+        success = checker.run_all_checks()
+
+    return 0 if success else 1
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="RiggerHire Android App integration verification")
+    add_arguments(parser)
+    sys.exit(run(parser.parse_args(argv)))
+
+if __name__ == "__main__":
+    main()
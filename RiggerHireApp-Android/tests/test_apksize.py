@@ -0,0 +1,263 @@
+"""apk-size against small synthetic archives built in memory with zipfile"""
+
+import contextlib
+import io
+import random
+import struct
+import tempfile
+import unittest
+import zipfile
+from pathlib import Path
+from unittest import mock
+
+from riggerhire import apksize
+from riggerhire.cli import main
+
+INSNS = 5  # code units in the one method of MainActivity
+
+
+def _uleb128(value):
+    out = bytearray()
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            out.append(byte | 0x80)
+        else:
+            out.append(byte)
+            return bytes(out)
+
+
+def build_dex():
+    """A dex with one app class holding one method and one library class without class data
+
+    Returns (dex bytes, expected {package: bytes} at depth 3).
+    """
+    descriptors = [b"Lcom/tiation/riggerhire/ui/MainActivity;", b"Lokhttp3/Call;"]
+    string_ids_off = 0x70
+    type_ids_off = string_ids_off + 4 * len(descriptors)
+    class_defs_off = type_ids_off + 4 * len(descriptors)
+    offset = class_defs_off + 32 * len(descriptors)
+
+    string_data = bytearray()
+    string_offsets = []
+    for descriptor in descriptors:
+        string_offsets.append(offset + len(string_data))
+        string_data += _uleb128(len(descriptor)) + descriptor + b"\x00"
+    offset += len(string_data)
+
+    code_off = offset
+    code = struct.pack("<4H2I", 1, 1, 0, 0, 0, INSNS) + b"\x00\x00" * INSNS
+    offset += len(code)
+
+    class_data_off = offset
+    # no fields, one direct method: method_idx_diff, access_flags, code_off
+    class_data = _uleb128(0) * 2 + _uleb128(1) + _uleb128(0) + _uleb128(0) + _uleb128(1) + _uleb128(code_off)
+    file_size = offset + len(class_data)
+
+    header = bytearray(0x70)
+    header[:8] = b"dex\n035\x00"
+    struct.pack_into("<I", header, 0x20, file_size)
+    struct.pack_into("<4I", header, 0x38, len(descriptors), string_ids_off, len(descriptors), type_ids_off)
+    struct.pack_into("<2I", header, 0x60, len(descriptors), class_defs_off)
+
+    tables = b"".join(struct.pack("<I", off) for off in string_offsets)
+    tables += b"".join(struct.pack("<I", index) for index in range(len(descriptors)))
+    tables += struct.pack("<8I", 0, 0, 0, 0, 0, 0, class_data_off, 0)
+    tables += struct.pack("<8I", 1, 0, 0, 0, 0, 0, 0, 0)
+    data = bytes(header) + tables + bytes(string_data) + code + class_data
+    assert len(data) == file_size
+
+    app = 32 + len(class_data) + 16 + 2 * INSNS
+    library = 32
+    return data, {
+        "com.tiation.riggerhire": app,
+        "okhttp3": library,
+        "(shared tables)": file_size - app - library,
+    }
+
+
+DEX, DEX_PACKAGES = build_dex()
+NOISE = random.Random(0).getrandbits(8 * 4096).to_bytes(4096, "little")  # incompressible
+
+APK_ENTRIES = {
+    "AndroidManifest.xml": b"<manifest/>" * 10,
+    "classes.dex": DEX,
+    "classes2.dex": b"dex\n035\x00" + b"\x01" * 300,
+    "resources.arsc": b"\x02" * 400,
+    "res/drawable-xhdpi/logo.png": b"\x03" * 500,
+    "res/layout/main.xml": b"<LinearLayout/>" * 20,
+    "assets/fonts/inter.ttf": b"\x04" * 600,
+    "lib/arm64-v8a/libsqlite.so": NOISE[:700],
+    "META-INF/CERT.RSA": b"\x06" * 50,
+    "kotlin/kotlin.kotlin_builtins": b"\x07" * 60,
+}
+
+AAB_ENTRIES = {
+    "BundleConfig.pb": b"\x00" * 40,
+    "BUNDLE-METADATA/com.android.tools.build.obfuscation/proguard.map": b"a -> b\n" * 30,
+    "base/manifest/AndroidManifest.xml": b"\x08" * 70,
+    "base/dex/classes.dex": DEX,
+    "base/res/values/strings.xml": b"\x09" * 80,
+    "base/resources.pb": b"\x0a" * 90,
+    "base/assets/licenses.html": b"\x0b" * 100,
+    "base/lib/x86_64/libsqlite.so": b"\x0c" * 110,
+    "base/root/okhttp3/internal/publicsuffix/publicsuffixes.gz": b"\x0d" * 120,
+}
+
+
+def write_archive(path, entries, compression=zipfile.ZIP_DEFLATED):
+    with zipfile.ZipFile(path, "w", compression) as archive:
+        for name, data in entries.items():
+            archive.writestr(name, data)
+
+
+def expected_totals(path):
+    """Per-category [compressed, uncompressed] according to zipfile itself"""
+    totals = {category: [0, 0] for category in apksize.CATEGORIES}
+    bundle = Path(path).suffix == ".aab"
+    with zipfile.ZipFile(path) as archive:
+        for info in archive.infolist():
+            category, _ = apksize.categorize(info.filename, bundle)
+            totals[category][0] += info.compress_size
+            totals[category][1] += info.file_size
+    return totals
+
+
+class ApkSizeTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.dir = Path(self.tmp.name)
+
+    def archive(self, name, entries, **kwargs):
+        path = self.dir / name
+        write_archive(path, entries, **kwargs)
+        return path
+
+    def run_cli(self, *argv):
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            code = main(["apk-size", *map(str, argv)])
+        return code, out.getvalue()
+
+    def test_apk_categories(self):
+        path = self.archive("app.apk", APK_ENTRIES)
+        report = apksize.SizeReport(path).scan()
+
+        self.assertFalse(report.bundle)
+        self.assertEqual(report.entries, len(APK_ENTRIES))
+        self.assertEqual(report.totals, expected_totals(path))
+        self.assertEqual(report.totals["dex"][1], len(DEX) + 308)
+        self.assertEqual(report.totals["native"][1], 700)
+        self.assertEqual(report.totals["assets"][1], 600)
+        self.assertEqual(report.totals["resources"][1], 400 + 500 + 15 * 20)
+        self.assertEqual(report.totals["other"][1], 60)
+        self.assertEqual(report.dex_names, ["classes.dex", "classes2.dex"])
+        self.assertIn(("resources", "drawable"), report.details)
+        self.assertIn(("native", "arm64-v8a"), report.details)
+        self.assertIn(("assets", "fonts"), report.details)
+
+    def test_aab_categories(self):
+        path = self.archive("app.aab", AAB_ENTRIES)
+        report = apksize.SizeReport(path).scan()
+
+        self.assertTrue(report.bundle)
+        self.assertEqual(report.totals, expected_totals(path))
+        self.assertEqual(report.totals["dex"][1], len(DEX))
+        self.assertEqual(report.totals["manifest"][1], 70)
+        self.assertEqual(report.totals["resources"][1], 80 + 90)
+        self.assertEqual(report.totals["metadata"][1], 40 + 7 * 30)
+        self.assertEqual(report.totals["other"][1], 120)
+        self.assertEqual(report.dex_names, ["base/dex/classes.dex"])
+
+    def test_bundle_detected_without_aab_suffix(self):
+        path = self.archive("app.zip", AAB_ENTRIES)
+        report = apksize.SizeReport(path).scan()
+
+        self.assertTrue(report.bundle)
+        self.assertEqual(report.totals["manifest"][1], 70)
+
+    def test_zip64(self):
+        # Lowering the limit makes zipfile write a ZIP64 EOCD and 0xFFFFFFFF sizes with a
+        # ZIP64 extra field for every entry, without needing a multi-GB fixture
+        with mock.patch.object(zipfile, "ZIP64_LIMIT", 64):
+            path = self.archive("app.apk", APK_ENTRIES, compression=zipfile.ZIP_STORED)
+        tail = path.read_bytes()[-200:]
+        self.assertIn(apksize.ZIP64_EOCD_SIGNATURE, tail)
+        self.assertIn(apksize.ZIP64_LOCATOR_SIGNATURE, tail)
+
+        report = apksize.SizeReport(path).scan()
+
+        self.assertEqual(report.entries, len(APK_ENTRIES))
+        self.assertEqual(report.totals, expected_totals(path))
+        self.assertEqual(report.totals["dex"], [len(DEX) + 308, len(DEX) + 308])
+        self.assertEqual(report.uncompressed, sum(map(len, APK_ENTRIES.values())))
+
+    def test_dex_package_sizes(self):
+        self.assertEqual(apksize.dex_package_sizes(DEX, depth=3), DEX_PACKAGES)
+        self.assertEqual(set(apksize.dex_package_sizes(DEX, depth=1)), {"com", "okhttp3", "(shared tables)"})
+
+    def test_dex_packages_summed_across_dex_files(self):
+        entries = dict(AAB_ENTRIES, **{"feature/dex/classes2.dex": DEX})
+        report = apksize.SizeReport(self.archive("app.aab", entries)).scan().attribute_dex(3)
+
+        self.assertEqual(report.packages, {package: 2 * size for package, size in DEX_PACKAGES.items()})
+
+    def test_corrupt_dex_reported_as_unattributed(self):
+        truncated = DEX[:0x90]
+        entries = dict(APK_ENTRIES, **{"classes2.dex": truncated, "classes3.dex": b"dex\n035\x00" + b"\xff" * 200})
+        report = apksize.SizeReport(self.archive("app.apk", entries)).scan().attribute_dex(3)
+
+        self.assertEqual(report.packages, dict(DEX_PACKAGES, **{"(unattributed)": len(truncated) + 208}))
+        self.assertEqual([name for name, _ in report.unreadable_dex], ["classes2.dex", "classes3.dex"])
+
+        code, out = self.run_cli(self.dir / "app.apk", "--dex-packages")
+
+        self.assertEqual(code, 0)
+        self.assertIn("classes2.dex could not be parsed", out)
+        self.assertIn("(unattributed)", out)
+
+    def test_within_budget(self):
+        path = self.archive("app.apk", APK_ENTRIES)
+
+        code, out = self.run_cli(path, "--budget", "total=1MB", "--budget", "dex=64KB")
+
+        self.assertEqual(code, 0)
+        self.assertIn("Within size budgets", out)
+
+    def test_budget_exceeded(self):
+        path = self.archive("app.apk", APK_ENTRIES)
+
+        code, out = self.run_cli(path, "--budget", "native=100B")
+
+        self.assertEqual(code, 1)
+        self.assertIn("SIZE BUDGET EXCEEDED (1)", out)
+        self.assertIn("native is", out)
+
+    def test_growth_limit(self):
+        old = self.archive("old.apk", APK_ENTRIES)
+        new = self.archive("new.apk", dict(APK_ENTRIES, **{"assets/video.mp4": NOISE}))
+
+        code, out = self.run_cli(old, new, "--max-growth", "assets=1KB")
+
+        self.assertEqual(code, 1)
+        self.assertIn("assets grew by", out)
+
+    def test_malformed_budget(self):
+        path = self.archive("app.apk", APK_ENTRIES)
+
+        for budget in ("dex=abc", "foo", "dex=", "dex=12XB"):
+            with self.subTest(budget=budget), self.assertRaises(SystemExit) as raised:
+                self.run_cli(path, "--budget", budget)
+            self.assertIsInstance(raised.exception.code, str)
+            self.assertIn("--budget", raised.exception.code)
+
+    def test_parse_size(self):
+        self.assertEqual(apksize.parse_size("8MB"), 8 * 1024 ** 2)
+        self.assertEqual(apksize.parse_size("1.5k"), 1536)
+        self.assertEqual(apksize.parse_size("200"), 200)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,181 @@
+"""Static baseline profile generation against a small synthetic app"""
+
+import contextlib
+import io
+import tempfile
+import unittest
+from pathlib import Path
+
+from riggerhire.baselineprofile import PROFILE_PATH, generate, read_rules
+from riggerhire.cli import main
+
+SOURCES = {
+    "AndroidManifest.xml": '''<manifest xmlns:android="http://schemas.android.com/apk/res/android">
+    <application android:name=".App">
+        <activity android:name=".ui.MainActivity">
+            <intent-filter>
+                <action android:name="android.intent.action.MAIN" />
+                <category android:name="android.intent.category.LAUNCHER" />
+            </intent-filter>
+        </activity>
+        <activity android:name=".ui.SettingsActivity" />
+    </application>
+</manifest>
+''',
+    "java/com/example/App.kt": '''package com.example
+
+import android.app.Application
+
+class App : Application() {
+    override fun onCreate() {
+        super.onCreate()
+        Injector.init(3)
+    }
+}
+
+object Injector {
+    fun init(count: Int) {
+        warmUp(count)
+    }
+}
+
+fun warmUp(count: Int): Boolean = count > 0
+''',
+    "java/com/example/ui/MainActivity.kt": '''package com.example.ui
+
+import android.os.Bundle
+import com.example.data.JobRepository
+
+class MainActivity : ComponentActivity() {
+    override fun onCreate(savedInstanceState: Bundle?) {
+        super.onCreate(savedInstanceState)
+        val repository = JobRepository(formatTitle(" jobs "))
+        repository.load()
+        button.setOnClickListener { openSettings() }
+    }
+
+    private fun openSettings() {
+        SettingsHelper.show()
+    }
+}
+
+object SettingsHelper {
+    fun show() {
+    }
+}
+''',
+    "java/com/example/ui/JobsList.kt": '''package com.example.ui
+
+@Composable
+fun JobsListScreen(jobs: List<String>) {
+    JobRow(jobs.first())
+}
+
+@Composable
+fun JobRow(title: String) {
+    Text(formatTitle(title))
+}
+
+fun formatTitle(title: String): String = title.trim()
+''',
+    "java/com/example/data/JobRepository.kt": '''package com.example.data
+
+class JobRepository(val name: String) {
+    fun load(): List<String> = emptyList()
+}
+''',
+}
+
+RULES = [
+    "Lcom/example/App;",
+    "HSPLcom/example/App;-><init>()V",
+    "HSPLcom/example/App;->onCreate()V",
+    "Lcom/example/AppKt;",
+    "HSPLcom/example/AppKt;->warmUp(I)Z",
+    "Lcom/example/Injector;",
+    "HSPLcom/example/Injector;-><clinit>()V",
+    "HSPLcom/example/Injector;-><init>()V",
+    "HSPLcom/example/Injector;->init(I)V",
+    "Lcom/example/data/JobRepository;",
+    "HSPLcom/example/data/JobRepository;-><init>(Ljava/lang/String;)V",
+    "HSPLcom/example/data/JobRepository;->getName()Ljava/lang/String;",
+    "HSPLcom/example/data/JobRepository;->load()Ljava/util/List;",
+    "Lcom/example/ui/JobsListKt;",
+    "HPLcom/example/ui/JobsListKt;->JobRow(Ljava/lang/String;Landroidx/compose/runtime/Composer;I)V",
+    "HPLcom/example/ui/JobsListKt;->JobsListScreen(Ljava/util/List;Landroidx/compose/runtime/Composer;I)V",
+    "HSPLcom/example/ui/JobsListKt;->formatTitle(Ljava/lang/String;)Ljava/lang/String;",
+    "Lcom/example/ui/MainActivity;",
+    "HSPLcom/example/ui/MainActivity;-><init>()V",
+    "HSPLcom/example/ui/MainActivity;->onCreate(Landroid/os/Bundle;)V",
+]
+
+
+class BaselineProfileTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = Path(tmp.name)
+        for name, text in SOURCES.items():
+            path = self.root / "app/src/main" / name
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(text)
+        self.profile = self.root / PROFILE_PATH
+
+    def run_cli(self, *argv):
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            code = main(["baseline-profile", "--root", str(self.root), *argv])
+        return code, out.getvalue()
+
+    def test_reachability_from_entry_points(self):
+        _, entries, startup, feed, _ = generate(self.root)
+        reached = {label: sorted(map(repr, nodes)) for label, _, roots, nodes in entries if roots}
+
+        self.assertEqual(set(reached), {"Application.onCreate", "launcher Activity", "JobsListScreen"})
+        self.assertEqual(reached["Application.onCreate"],
+                         ["App.kt.warmUp", "App.onCreate", "Injector.init", "com.example.App", "com.example.Injector"])
+        self.assertEqual(reached["launcher Activity"],
+                         ["JobRepository.load", "JobsList.kt.formatTitle", "MainActivity.onCreate",
+                          "com.example.data.JobRepository", "com.example.ui.MainActivity"])
+        # A click listener runs when the user acts, so openSettings is not on the cold-start path
+        self.assertNotIn("MainActivity.openSettings", map(repr, startup | feed))
+
+    def test_rules(self):
+        *_, rules = generate(self.root)
+
+        # formatTitle is reached from both paths and keeps the startup flag
+        self.assertEqual(rules, RULES)
+
+    def test_check_missing_profile(self):
+        code, out = self.run_cli("--check")
+
+        self.assertEqual(code, 1)
+        self.assertIn(f"{PROFILE_PATH} does not exist", out)
+
+    def test_write_then_check_in_sync(self):
+        self.assertEqual(self.run_cli("--write")[0], 0)
+        self.assertEqual(read_rules(self.profile), RULES)
+
+        code, out = self.run_cli("--check")
+
+        self.assertEqual(code, 0)
+        self.assertIn("covers 14 of 14 member rules (100%)", out)
+        self.assertIn("Profile is in sync", out)
+
+    def test_check_reports_missing_and_stale_rules(self):
+        self.run_cli("--write")
+        stale = "HSPLcom/example/ui/SettingsHelper;->show()V"
+        self.profile.write_text("\n".join([rule for rule in RULES if "warmUp" not in rule] + [stale]) + "\n")
+
+        code, out = self.run_cli("--check")
+
+        self.assertEqual(code, 1)
+        self.assertIn("covers 13 of 14 member rules", out)
+        self.assertIn("OUT OF SYNC (1 missing, 1 stale)", out)
+        self.assertIn("   + HSPLcom/example/AppKt;->warmUp(I)Z", out)
+        self.assertIn(f"   - {stale}", out)
+        self.assertEqual(self.run_cli()[0], 0)  # without --check the report is advisory
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+"""build-times: Gradle --profile reports ingested into an in-memory store"""
+
+import contextlib
+import io
+import tempfile
+import unittest
+from pathlib import Path
+
+from riggerhire.buildtimes import BuildReport, BuildStore, ingest, parse_duration
+
+PROFILE = """<html><body>
+<div id="header"><p>Profiled build: assembleDebug</p><p>Started on: 2026/01/0{day} - 09:15:00</p></div>
+<div id="tabs">
+<h2>Summary</h2>
+<table>
+<tr><th>Description</th><th class="numeric">Duration</th></tr>
+<tr><td>Total Build Time</td><td class="numeric">{total}</td></tr>
+<tr><td>Startup</td><td class="numeric">0.412s</td></tr>
+<tr><td>Configuring Projects</td><td class="numeric">1.500s</td></tr>
+<tr><td>Task Execution</td><td class="numeric">{execution}</td></tr>
+</table>
+<h2>Configuration</h2>
+<table>
+<tr><th>Project</th><th class="numeric">Duration</th></tr>
+<tr><td>All projects</td><td class="numeric">1.500s</td></tr>
+<tr><td>:app</td><td class="numeric">1.100s</td></tr>
+</table>
+<h2>Task Execution</h2>
+<table>
+<tr><th>Task</th><th class="numeric">Duration</th><th>Result</th></tr>
+<tr><td>:app</td><td class="numeric">{execution}</td><td>(total)</td></tr>
+<tr><td>:app:compileDebugKotlin</td><td class="numeric">{compile}</td><td></td></tr>
+<tr><td>:app:mergeDebugResources</td><td class="numeric">0.800s</td><td>FROM-CACHE</td></tr>
+<tr><td>:app:preBuild</td><td class="numeric">0.001s</td><td>UP-TO-DATE</td></tr>
+</table>
+</div></body></html>
+"""
+
+
+class BuildTimesTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.dir = Path(tmp.name)
+        self.store = BuildStore(":memory:")
+        self.addCleanup(self.store.close)
+
+    def profile(self, day, compile_time):
+        path = self.dir / f"profile-2026-01-0{day}-09-15-00.html"
+        path.write_text(PROFILE.format(day=day, total=f"{compile_time + 3:.3f}s", execution=f"{compile_time + 1:.3f}s",
+                                       compile=f"{compile_time:.3f}s"))
+        return path
+
+    def ingest(self, *paths):
+        with contextlib.redirect_stdout(io.StringIO()):
+            return ingest(self.store, paths)
+
+    def test_parse_duration(self):
+        self.assertEqual(parse_duration("1m2.5s"), 62.5)
+        self.assertEqual(parse_duration("850ms"), 0.85)
+        self.assertIsNone(parse_duration("-"))
+
+    def test_profile_rows(self):
+        self.assertEqual(self.ingest(self.profile(1, 10.0)), (1, 0))
+
+        build = self.store.db.execute(
+            "SELECT id, kind, started, requested, total, startup, configuring, execution FROM builds").fetchall()
+        self.assertEqual(build, [(1, "profile", "2026-01-01T09:15:00", "assembleDebug", 13.0, 0.412, 1.5, 11.0)])
+        tasks = self.store.db.execute("SELECT path, duration, outcome FROM tasks ORDER BY rowid").fetchall()
+        self.assertEqual(tasks, [(":app:compileDebugKotlin", 10.0, "executed"),
+                                 (":app:mergeDebugResources", 0.8, "from-cache"),
+                                 (":app:preBuild", 0.001, "up-to-date")])
+        self.assertEqual(self.store.db.execute("SELECT kind, name, duration FROM configuration").fetchall(),
+                         [("project", ":app", 1.1)])
+
+    def test_reingest_is_skipped(self):
+        path = self.profile(1, 10.0)
+        self.ingest(path)
+
+        self.assertEqual(self.ingest(path), (0, 1))
+        self.assertEqual(self.store.db.execute("SELECT count(*) FROM builds").fetchone(), (1,))
+
+    def test_slowest_task_delta(self):
+        self.ingest(self.profile(1, 10.0), self.profile(2, 15.0))
+        out = io.StringIO()
+
+        with contextlib.redirect_stdout(out):
+            BuildReport(self.store).print_slowest_tasks()
+
+        first, = [line for line in out.getvalue().splitlines() if ":app:" in line]
+        self.assertIn(":app:compileDebugKotlin: median 12.5s, max 15.0s, 2 run(s), 25.0s total ▲ +50%", first)
+
+
+if __name__ == "__main__":
+    unittest.main()
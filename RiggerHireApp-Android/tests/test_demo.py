@@ -0,0 +1,112 @@
+"""Overview generation for RiggerHire and for other apps found in a monorepo"""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from riggerhire.demo import OverviewGenerator, RiggerHireDemo, SnapshotCache, discover_apps, introspect_app
+
+DICE_GRADLE = """
+android {
+    namespace 'com.tiation.dice'
+    defaultConfig {
+        applicationId "com.tiation.dice"
+        minSdk 24
+        targetSdk 34
+        versionName "2.1"
+    }
+}
+dependencies {
+    implementation platform('androidx.compose:compose-bom:2024.06.00')
+    implementation 'androidx.compose.material3:material3'
+    implementation 'androidx.room:room-runtime:2.6.1'
+}
+"""
+
+DICE_MANIFEST = """<manifest xmlns:android="http://schemas.android.com/apk/res/android">
+    <uses-permission android:name="android.permission.CAMERA" />
+    <application>
+        <activity android:name=".RollActivity" />
+        <activity android:name=".HistoryActivity" />
+    </application>
+</manifest>
+"""
+
+RIGGERHIRE_GRADLE = """
+android {
+    defaultConfig {
+        applicationId "com.tiation.riggerhire"
+    }
+}
+dependencies {
+    implementation 'com.stripe:stripe-android:20.37.0'
+}
+"""
+
+
+def write_app(root, gradle, manifest=None):
+    (root / "app/src/main").mkdir(parents=True)
+    (root / "settings.gradle").write_text(f"rootProject.name = '{root.name}'\n")
+    (root / "app/build.gradle").write_text(gradle)
+    if manifest:
+        (root / "app/src/main/AndroidManifest.xml").write_text(manifest)
+    return root
+
+
+class OverviewTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = Path(tmp.name)
+        self.dice = write_app(self.root / "games/dice", DICE_GRADLE, DICE_MANIFEST)
+        self.rigger = write_app(self.root / "RiggerHireApp-Android", RIGGERHIRE_GRADLE)
+
+    def test_discovers_both_apps(self):
+        self.assertEqual(discover_apps(self.root), [self.rigger, self.dice])
+
+    def test_other_app_features_come_from_its_build_files(self):
+        demo = RiggerHireDemo(self.dice)
+
+        self.assertFalse(demo.is_riggerhire)
+        self.assertEqual(demo.features(), [
+            "🎨 Jetpack Compose UI",
+            "💾 Offline storage with Room",
+            "📷 Camera capture",
+            "📱 2 activities declared in the manifest",
+        ])
+        stack = demo.tech_stack()
+        self.assertEqual(stack["App Version"], "2.1")
+        self.assertIn("Room", stack["Database"])
+        self.assertNotIn("Payment", stack)
+        self.assertNotIn("Architecture", stack)
+
+        text = demo.render_text("2026-01-01 00:00:00")
+        self.assertNotIn("Mining", text)
+        self.assertNotIn("Stripe", text)
+
+    def test_riggerhire_keeps_the_curated_overview(self):
+        demo = RiggerHireDemo(self.rigger)
+
+        self.assertTrue(demo.is_riggerhire)
+        self.assertIn("🔍 Smart Job Matching - AI-powered algorithm for job recommendations", demo.features())
+        self.assertIn("🏭 MINING INDUSTRY FOCUS", [title for title, _, _ in demo.sections()])
+
+    def test_all_apps_render_their_own_features(self):
+        cache = SnapshotCache(self.root / "cache.json")
+        text = OverviewGenerator(self.root, cache).render("markdown")
+
+        rigger, dice = text.split("## dice")
+        self.assertIn("Smart Job Matching", rigger)
+        self.assertNotIn("Smart Job Matching", dice)
+        self.assertIn("Camera capture", dice)
+
+    def test_snapshot_records_manifest(self):
+        snapshot = introspect_app(self.dice)
+
+        self.assertEqual(snapshot["manifest"]["permissions"], ["CAMERA"])
+        self.assertEqual(snapshot["dependencies"]["androidx.compose.material3:material3"], None)
+        self.assertIn(str(self.dice / "app/src/main/AndroidManifest.xml"), snapshot["stamps"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+"""Heap and parcel estimates for small synthetic data classes"""
+
+import contextlib
+import io
+import unittest
+from pathlib import Path
+
+from riggerhire.footprint import FootprintAnalyzer, parse_models
+
+MODELS = '''
+enum class Status { OPEN, FILLED }
+
+@Parcelize
+data class Crew(
+    val id: Long,
+    val name: String,
+    val size: Int?,
+    val tags: List<String>,
+    val status: Status
+) : Parcelable
+
+data class Draft(
+    val id: String = UUID.randomUUID().toString(),
+    val hours: Double?
+)
+'''
+
+
+class FootprintTest(unittest.TestCase):
+    def setUp(self):
+        self.analyzer = FootprintAnalyzer(string_chars=24, list_items=4)
+        self.analyzer.enums = {"Status"}
+        for model in parse_models(MODELS, Path("Models.kt")):
+            self.analyzer.models.setdefault(model.name, []).append(model)
+        self.crew, = self.analyzer.models["Crew"]
+        self.draft, = self.analyzer.models["Draft"]
+
+    def check(self, model):
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.analyzer.check_model(model)
+        return self.analyzer.warnings
+
+    def test_parse(self):
+        self.assertTrue(self.crew.parcelable)
+        self.assertFalse(self.draft.parcelable)
+        self.assertEqual([f.name for f in self.crew.fields], ["id", "name", "size", "tags", "status"])
+        self.assertEqual(self.crew.fields[3].element, "String")
+        self.assertEqual(self.draft.fields[0].default, "UUID.randomUUID().toString()")
+
+    def test_heap_size(self):
+        string = 8 + 8 + 24                                # header + count/hash + Latin-1 chars
+        shallow = 8 + 8 + 4 * 4                            # header + Long + four references = 32, aligned
+        boxed = 16                                         # Integer: header + int, aligned
+        tags = 24 + 32 + 4 * string                        # ArrayList + Object[4] + four strings
+        self.assertEqual(self.analyzer.heap_size(self.crew), shallow + string + boxed + tags)
+
+    def test_parcel_size(self):
+        string = 4 + 52                                    # length + 25 UTF-16 units padded to 4
+        expected = 8 + string + (4 + 4) + (4 + 4 * string) + string
+        self.assertEqual(self.analyzer.parcel_size(self.crew), expected)
+
+    def test_estimates_scale_with_assumptions(self):
+        longer = FootprintAnalyzer(string_chars=48, list_items=4)
+        longer.enums, longer.models = self.analyzer.enums, self.analyzer.models
+        self.assertGreater(longer.heap_size(self.crew), self.analyzer.heap_size(self.crew))
+        self.assertGreater(longer.parcel_size(self.crew), self.analyzer.parcel_size(self.crew))
+
+    def test_boxed_primitive_presence_flag_only_when_parcelable(self):
+        crew_warning, = self.check(self.crew)
+        self.assertIn("boxed nullable primitives (size: Int?)", crew_warning)
+        self.assertIn("presence flag when parcelled", crew_warning)
+
+        self.analyzer.warnings = []
+        boxed = [w for w in self.check(self.draft) if "boxed" in w]
+        self.assertEqual(len(boxed), 1)
+        self.assertNotIn("parcelled", boxed[0])
+
+    def test_costly_default(self):
+        default, = [w for w in self.check(self.draft) if "Draft.id" in w]
+        self.assertIn("generates a random UUID", default)
+        self.assertNotIn("copy()", default)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,140 @@
+"""Hot-path logging rule and the R8 log-stripping check"""
+
+import tempfile
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+
+from riggerhire.findings import WARNING, FindingTable
+from riggerhire.logging_lint import check_hot_path_logging, check_log_stripping, stripped_methods
+
+SOURCE = '''
+class Gauge : View {
+    override fun onDraw(canvas: Canvas) {
+        Log.d(TAG, "draw $width x $height")
+    }
+}
+
+class CrewRepository {
+    fun sync(crew: List<Rigger>) {
+        Log.i(TAG, "sync started")
+        crew.forEach { rigger ->
+            Log.d(TAG, "syncing " + rigger.name)
+            Log.v(TAG, "syncing")
+        }
+        for (job in jobs) {
+            println("job ${job.id}")
+        }
+        Log.w(TAG, "synced ${crew.size} riggers")
+        scope.launch {
+            Log.e(TAG, "failed: $error")
+        }
+    }
+}
+'''
+
+PROGUARD = '''
+-assumenosideeffects class android.util.Log {
+    public static int v(...);
+    public static int d(...);
+}
+'''
+
+GRADLE = '''
+android {
+    buildTypes {
+        release {
+            minifyEnabled true
+        }
+    }
+}
+'''
+
+
+def new_checker():
+    return SimpleNamespace(findings=FindingTable(), log_calls={}, log_levels=set())
+
+
+def messages(checker):
+    return [checker.findings.message(row) for row in checker.findings.rows(WARNING)]
+
+
+class HotPathLoggingTest(unittest.TestCase):
+    def setUp(self):
+        self.checker = new_checker()
+        check_hot_path_logging(self.checker, Path("Gauge.kt"), SOURCE)
+        self.messages = messages(self.checker)
+
+    def flagged(self, line):
+        return [m for m in self.messages if m.startswith(f"Gauge.kt:{line}:")]
+
+    def test_built_strings_on_hot_paths_flagged(self):
+        render, = self.flagged(4)
+        self.assertIn("Log.d builds a string on a hot path, view rendering callback in onDraw", render)
+        loop, = self.flagged(12)
+        self.assertIn("loop body in forEach", loop)
+        println, = self.flagged(16)
+        self.assertIn("println builds a string", println)
+        self.assertEqual(len(self.messages), 3)
+
+    def test_constant_message_in_a_loop_not_flagged(self):
+        self.assertEqual(self.flagged(13), [])
+
+    def test_cold_and_deferred_calls_not_flagged(self):
+        for line in (10, 18, 20):
+            with self.subTest(line=line):
+                self.assertEqual(self.flagged(line), [])
+
+    def test_contexts_and_levels_recorded(self):
+        self.assertEqual(self.checker.log_calls, {"render": 1, "loop": 3, None: 3})
+        self.assertEqual(self.checker.log_levels, {"d", "i", "v", "w", "e", "println"})
+
+
+class LogStrippingTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = Path(tmp.name)
+        (self.root / "app").mkdir()
+        (self.root / "app/build.gradle").write_text(GRADLE)
+        self.checker = new_checker()
+        self.checker.log_levels.update({"v", "d", "i", "w", "println"})
+
+    def test_stripped_methods(self):
+        self.assertEqual(stripped_methods(PROGUARD), {"android.util.Log": {"v", "d"}})
+        self.assertEqual(stripped_methods("-assumenosideeffects class kotlin.io.ConsoleKt { *; }"),
+                         {"kotlin.io.ConsoleKt": {"*"}})
+
+    def test_missing_rules_reported(self):
+        check_log_stripping(self.checker, self.root)
+
+        self.assertEqual(messages(self.checker), [
+            "proguard-rules.pro: Log.d calls are not stripped: add it to -assumenosideeffects class android.util.Log",
+            "proguard-rules.pro: Log.i calls are not stripped: add it to -assumenosideeffects class android.util.Log",
+            "proguard-rules.pro: Log.v calls are not stripped: add it to -assumenosideeffects class android.util.Log",
+            "proguard-rules.pro: println calls are not stripped: add -assumenosideeffects class kotlin.io.ConsoleKt",
+        ])
+
+    def test_present_rules_accepted(self):
+        rules = PROGUARD.replace("d(...);", "d(...);\n    public static int i(...);")
+        rules += "-assumenosideeffects class kotlin.io.ConsoleKt { public static void println(...); }\n"
+        (self.root / "app/proguard-rules.pro").write_text(rules)
+
+        check_log_stripping(self.checker, self.root)
+
+        self.assertEqual(messages(self.checker), [])
+
+    def test_release_without_r8(self):
+        (self.root / "app/proguard-rules.pro").write_text("-assumenosideeffects class android.util.Log { *; }")
+        (self.root / "app/build.gradle").write_text(GRADLE.replace("true", "false"))
+        self.checker.log_levels.discard("println")
+
+        check_log_stripping(self.checker, self.root)
+
+        self.assertEqual(messages(self.checker), [
+            "build.gradle: release build has minifyEnabled false, so R8 never applies the -assumenosideeffects rules",
+        ])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+"""Dispatcher tracking: which thread code nested in coroutine builders runs on"""
+
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+
+from riggerhire.findings import WARNING, FindingTable
+from riggerhire.kotlin import enclosing_blocks, strip_comments
+from riggerhire.mainthread import local_scopes, main_thread_calls, report, thread_of
+
+SOURCE = '''
+class JobsActivity : ComponentActivity() {
+    private val ioScope = CoroutineScope(Dispatchers.IO)
+
+    override fun onCreate(savedInstanceState: Bundle?) {
+        super.onCreate(savedInstanceState)
+        /*onCreate*/
+        lifecycleScope.launch {
+            /*lifecycleScope*/
+            withContext(Dispatchers.IO) {
+                /*withContext IO*/
+            }
+            coroutineScope {
+                /*coroutineScope in lifecycleScope*/
+            }
+        }
+        lifecycleScope.launch(Dispatchers.IO) {
+            /*launch IO*/
+            coroutineScope {
+                /*coroutineScope in IO*/
+                launch {
+                    /*nested launch*/
+                }
+            }
+        }
+        ioScope.launch {
+            /*local IO scope*/
+        }
+        GlobalScope.launch {
+            /*GlobalScope*/
+        }
+    }
+
+    suspend fun load() {
+        /*suspend fun*/
+        coroutineScope {
+            /*coroutineScope in suspend fun*/
+        }
+        coroutineScope.launch {
+            /*injected scope named coroutineScope*/
+        }
+    }
+}
+'''
+
+
+def thread_at(marker):
+    structure = strip_comments(SOURCE, blank_strings=True)
+    offset = SOURCE.index(f"/*{marker}*/")
+    stack, = enclosing_blocks(structure, [offset])
+    return thread_of(structure, stack, local_scopes(structure))[0]
+
+
+class ThreadOfTest(unittest.TestCase):
+    def test_main(self):
+        for marker in ("onCreate", "lifecycleScope", "coroutineScope in lifecycleScope"):
+            with self.subTest(marker=marker):
+                self.assertEqual(thread_at(marker), "main")
+
+    def test_background(self):
+        for marker in ("withContext IO", "launch IO", "coroutineScope in IO", "nested launch", "local IO scope",
+                       "GlobalScope"):
+            with self.subTest(marker=marker):
+                self.assertEqual(thread_at(marker), "background")
+
+    def test_unknown(self):
+        for marker in ("suspend fun", "coroutineScope in suspend fun", "injected scope named coroutineScope"):
+            with self.subTest(marker=marker):
+                self.assertIsNone(thread_at(marker))
+
+    def test_local_scopes(self):
+        scopes = local_scopes("val a = CoroutineScope(Dispatchers.Main)\nval b = rememberCoroutineScope()\n"
+                              "val c = CoroutineScope(SupervisorJob())")
+        self.assertEqual(scopes, {"a": "main", "b": "main", "c": "background"})
+
+
+class MainThreadRuleTest(unittest.TestCase):
+    def test_only_main_thread_calls_reported(self):
+        source = (SOURCE.replace("/*onCreate*/", "Thread.sleep(10)")
+                  .replace("/*withContext IO*/", "File(path).readText()")
+                  .replace("/*coroutineScope in lifecycleScope*/", "File(path).readText()"))
+        calls = main_thread_calls(source)
+        self.assertEqual([(rule_id, context) for rule_id, _, _, _, context in calls],
+                         [("main-thread-blocking", "onCreate"), ("main-thread-io", "lifecycleScope.launch")])
+
+        checker = SimpleNamespace(findings=FindingTable())
+        report(checker, Path("JobsActivity.kt"), source, "main-thread-io")
+        message, = (checker.findings.message(row) for row in checker.findings.rows(WARNING))
+        self.assertEqual(message, "JobsActivity.kt:14: file I/O in lifecycleScope.launch does disk I/O on the main "
+                                  "thread; use Dispatchers.IO instead")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,157 @@
+"""ResourceIndex against a small synthetic app tree"""
+
+import tempfile
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from unittest import mock
+
+from riggerhire import resources
+from riggerhire.resources import ResourceIndex, scan_file
+
+FILES = {
+    "app/src/main/AndroidManifest.xml": '''<manifest xmlns:android="http://schemas.android.com/apk/res/android">
+    <application android:icon="@mipmap/ic_launcher" android:label="@string/app_name" android:theme="@style/Theme.App">
+        <activity android:name=".MainActivity" />
+    </application>
+</manifest>
+''',
+    "app/src/main/java/com/example/MainActivity.kt": '''package com.example
+
+class MainActivity : ComponentActivity() {
+    override fun onCreate(savedInstanceState: Bundle?) {
+        setContentView(R.layout.activity_main)
+        // title = getString(R.string.orphan)
+        title = getString(R.string.welcome)
+        val banner = resources.getIdentifier("promo_banner", "drawable", packageName)
+        window.statusBarColor = getColor(R.color.missing_color)
+    }
+}
+''',
+    "app/src/main/res/layout/activity_main.xml": '''<LinearLayout android:orientation="vertical">
+    <ImageView android:src="@drawable/logo" android:background="@android:color/white" />
+    <TextView android:id="@+id/title" android:text="@string/title" />
+    <TextView android:text="@string/nowhere" />
+</LinearLayout>
+''',
+    "app/src/main/res/drawable/logo.xml": '<shape><solid android:color="@color/brand" /></shape>\n',
+    "app/src/main/res/drawable/promo_banner.png": b"\x89PNG" + b"\x00" * 96,
+    "app/src/main/res/drawable/unused_icon.png": b"\x89PNG" + b"\x00" * 296,
+    "app/src/main/res/drawable-hdpi/unused_icon.png": b"\x89PNG" + b"\x00" * 196,
+    "app/src/main/res/drawable/kept_icon.png": b"\x89PNG",
+    "app/src/main/res/mipmap-hdpi/ic_launcher.png": b"\x89PNG",
+    "app/src/main/res/raw/keep.xml": '<resources xmlns:tools="http://schemas.android.com/tools" '
+                                     'tools:keep="@drawable/kept_*" />\n',
+    "app/src/main/res/values/strings.xml": '''<resources>
+    <string name="app_name">Example</string>
+    <string name="welcome">Welcome</string>
+    <string name="title">Title</string>
+    <string name="orphan">Never shown</string>
+    <!-- <string name="commented">Gone</string> -->
+</resources>
+''',
+    "app/src/main/res/values/colors.xml": '''<resources>
+    <color name="brand">#FF0066</color>
+    <color name="unused_color">#000000</color>
+</resources>
+''',
+    "app/src/main/res/values/styles.xml": '''<resources>
+    <style name="Theme.App" parent="Theme.Material3.DayNight">
+        <item name="colorPrimary">@color/brand</item>
+    </style>
+    <style name="Theme.App.Dark" />
+</resources>
+''',
+    "app/build/intermediates/res/values/strings.xml": '<resources><string name="generated">x</string></resources>',
+}
+
+
+def write_tree(root):
+    for name, content in FILES.items():
+        path = root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if isinstance(content, bytes):
+            path.write_bytes(content)
+        else:
+            path.write_text(content)
+
+
+class ResourceIndexTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp = tempfile.TemporaryDirectory()
+        cls.root = Path(cls.tmp.name)
+        write_tree(cls.root)
+        cls.index = ResourceIndex(cls.root, jobs=1).build()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmp.cleanup()
+
+    def test_kotlin_references(self):
+        _, definitions, references, keeps = scan_file(self.root / "app/src/main/java/com/example/MainActivity.kt")
+
+        self.assertEqual((definitions, keeps), ([], []))
+        self.assertEqual(references, [("layout", "activity_main", None, 5), ("string", "welcome", None, 7),
+                                      ("color", "missing_color", None, 9), ("drawable", "promo_banner", None, 8)])
+
+    def test_xml_references(self):
+        _, definitions, references, _ = scan_file(self.root / "app/src/main/res/layout/activity_main.xml")
+
+        owner = ("layout", "activity_main")
+        self.assertEqual([d[:2] for d in definitions], [owner])
+        self.assertEqual(references, [("drawable", "logo", owner, 2), ("id", "title", owner, 3),
+                                      ("string", "title", owner, 3), ("string", "nowhere", owner, 4)])
+
+    def test_values_definitions(self):
+        _, definitions, references, _ = scan_file(self.root / "app/src/main/res/values/styles.xml")
+
+        self.assertEqual([(t, n, line) for t, n, _, line in definitions],
+                         [("style", "Theme.App", 2), ("style", "Theme.App.Dark", 5)])
+        self.assertEqual(references, [("style", "Theme_Material3_DayNight", ("style", "Theme_App"), 2),
+                                      ("color", "brand", ("style", "Theme_App"), 3)])
+
+    def test_transitive_reachability(self):
+        reached = self.index.reachable()
+
+        # code -> layout -> drawable -> color, manifest -> style, and tools:keep
+        for key in (("layout", "activity_main"), ("drawable", "logo"), ("color", "brand"), ("style", "Theme_App"),
+                    ("drawable", "promo_banner"), ("drawable", "kept_icon"), ("mipmap", "ic_launcher")):
+            with self.subTest(key=key):
+                self.assertIn(key, reached)
+        self.assertNotIn(("string", "orphan"), reached)
+
+    def test_unused(self):
+        unused = {(res_type, name): size for size, res_type, name, _ in self.index.unused()}
+
+        self.assertEqual(set(unused), {("drawable", "unused_icon"), ("string", "orphan"),
+                                       ("color", "unused_color"), ("style", "Theme.App.Dark")})
+        self.assertEqual(unused[("drawable", "unused_icon")], 300 + 200)
+        self.assertEqual(self.index.definitions[("drawable", "unused_icon")].primary,
+                         ("app/src/main/res/drawable/unused_icon.png", 1))
+        self.assertNotIn(("string", "commented"), self.index.definitions)
+        self.assertNotIn(("string", "generated"), self.index.definitions)  # build/ is skipped
+
+    def test_missing(self):
+        self.assertEqual(self.index.missing(), [
+            ("color", "missing_color", "app/src/main/java/com/example/MainActivity.kt", 9),
+            ("string", "nowhere", "app/src/main/res/layout/activity_main.xml", 4),
+        ])
+
+    def test_process_pool_matches_serial_scan(self):
+        with mock.patch.object(resources, "PARALLEL_MIN_FILES", 1), \
+                mock.patch("concurrent.futures.ProcessPoolExecutor", wraps=ProcessPoolExecutor) as pool:
+            parallel = ResourceIndex(self.root, jobs=2).build()
+        pool.assert_called_once_with(2)
+
+        def snapshot(index):
+            return ({key: (d.name, d.locations, d.size) for key, d in index.definitions.items()},
+                    index.referenced_by, index.keeps, index.files)
+
+        self.assertEqual(snapshot(parallel), snapshot(self.index))
+        self.assertEqual([item[:3] for item in parallel.unused()], [item[:3] for item in self.index.unused()])
+        self.assertEqual(parallel.missing(), self.index.missing())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,148 @@
+"""Room checker against a synthetic @Entity/@Dao fixture"""
+
+import contextlib
+import io
+import tempfile
+import unittest
+from pathlib import Path
+
+from riggerhire.kotlin import strip_comments
+from riggerhire.room import RoomQueryChecker, parse_dao_queries, parse_entities, used_columns
+
+ENTITIES = '''
+package com.example.data
+
+@Entity(
+    tableName = "jobs",
+    indices = [Index(value = ["site_id", "posted_at"]), Index(value = ["reference"], unique = true)]
+)
+data class Job(
+    @PrimaryKey val id: Long,
+    @ColumnInfo(name = "site_id") val siteId: Long,
+    @ColumnInfo(name = "posted_at") val postedAt: Long,
+    val reference: String,
+    val title: String,
+    @ColumnInfo(index = true) val status: String,
+    val rate: Double?,
+    @Ignore val cached: Boolean = false
+)
+
+@Entity(primaryKeys = ["job_id", "rigger_id"])
+data class Application(
+    @ColumnInfo(name = "job_id") val jobId: Long,
+    @ColumnInfo(name = "rigger_id") val riggerId: Long,
+    val note: String
+)
+'''
+
+DAO = '''
+package com.example.data
+
+@Dao
+interface JobDao {
+    @Query("SELECT * FROM jobs WHERE site_id = :siteId ORDER BY posted_at LIMIT 50")
+    suspend fun bySite(siteId: Long): List<Job>
+
+    @Query("SELECT * FROM jobs WHERE title LIKE :text LIMIT 20")
+    suspend fun search(text: String): List<Job>
+
+    @Query("SELECT * FROM jobs WHERE status = :status ORDER BY rate DESC LIMIT 20")
+    suspend fun byStatus(status: String): List<Job>
+
+    @Query("""
+        SELECT j.* FROM jobs j
+        JOIN Application a ON a.job_id = j.id
+        WHERE a.rigger_id = :riggerId
+    """)
+    fun forRigger(riggerId: Long): Flow<List<Job>>
+
+    @Query("DELETE FROM jobs WHERE title = :title")
+    suspend fun deleteByTitle(title: String)
+
+    @Query("UPDATE jobs SET status = :status WHERE reference = :reference")
+    suspend fun setStatus(reference: String, status: String)
+
+    @Query("SELECT * FROM jobs WHERE site_id = :siteId")
+    fun pagedBySite(siteId: Long): PagingSource<Int, Job>
+}
+'''
+
+
+class ParseTest(unittest.TestCase):
+    def test_entities(self):
+        job, application = parse_entities(strip_comments(ENTITIES), "Entities.kt")
+
+        self.assertEqual(job.table, "jobs")
+        self.assertEqual(list(job.columns), ["id", "site_id", "posted_at", "reference", "title", "status", "rate"])
+        self.assertEqual(job.columns["rate"], "REAL")
+        self.assertEqual(job.primary_key, ["id"])
+        self.assertEqual(job.indices, [(False, ["status"]), (False, ["site_id", "posted_at"]),
+                                       (True, ["reference"])])
+        self.assertEqual(job.leading_columns(), {"id", "site_id", "status", "reference"})
+
+        self.assertEqual(application.table, "Application")
+        self.assertEqual(application.primary_key, ["job_id", "rigger_id"])
+
+    def test_dao_queries(self):
+        queries = parse_dao_queries(strip_comments(DAO), "JobDao.kt")
+
+        self.assertEqual([q.function for q in queries],
+                         ["bySite", "search", "byStatus", "forRigger", "deleteByTitle", "setStatus", "pagedBySite"])
+        self.assertEqual(queries[0].return_type, "List<Job>")
+        self.assertEqual(queries[3].sql, "SELECT j.* FROM jobs j JOIN Application a ON a.job_id = j.id "
+                                         "WHERE a.rigger_id = :riggerId")
+        self.assertEqual(queries[4].return_type, "Unit")
+
+    def test_used_columns(self):
+        self.assertEqual(used_columns("SELECT * FROM jobs WHERE site_id = :s AND title = 'a = b' ORDER BY rate DESC"),
+                         [("WHERE", "", "site_id"), ("WHERE", "", "title"), ("ORDER BY", None, "rate")])
+
+
+class CheckerTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            (root / "Entities.kt").write_text(ENTITIES)
+            (root / "JobDao.kt").write_text(DAO)
+            cls.checker = RoomQueryChecker(root)
+            with contextlib.redirect_stdout(io.StringIO()):
+                cls.passed = cls.checker.run_all_checks()
+
+    def findings(self, function):
+        return [f for f in self.checker.issues + self.checker.warnings if f".{function}" in f]
+
+    def test_paged_query_is_clean(self):
+        self.assertEqual(self.findings("pagedBySite"), [])
+
+    def test_unindexed_where_is_a_confirmed_scan(self):
+        issue, = self.findings("search")
+        self.assertIn("full table scan (SCAN ", issue)
+        self.assertIn("WHERE jobs.title", issue)
+        self.assertFalse(self.passed)
+
+    def test_unindexed_order_by_reports_temp_btree_once(self):
+        warning, = self.findings("byStatus")
+        self.assertIn("unindexed ORDER BY jobs.rate, sorted with a temp B-tree", warning)
+        self.assertEqual(warning.count("TEMP B-TREE"), 1)  # only in the quoted plan
+
+    def test_composite_index_serves_the_sort(self):
+        self.assertEqual(self.findings("bySite"), [])
+
+    def test_filter_on_second_primary_key_column(self):
+        index_scan, unbounded = self.findings("forRigger")
+        self.assertIn("unindexed WHERE Application.rigger_id", index_scan)
+        self.assertIn("SCAN a USING COVERING INDEX", index_scan)
+        self.assertIn("returns unbounded Flow<List<Job>> without LIMIT or paging", unbounded)
+
+    def test_delete_is_confirmed_with_the_query_plan(self):
+        issue, = self.findings("deleteByTitle")
+        self.assertIn("full table scan (SCAN ", issue)
+        self.assertNotIn("would full-scan", issue)
+
+    def test_update_on_unique_index_is_clean(self):
+        self.assertEqual(self.findings("setStatus"), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
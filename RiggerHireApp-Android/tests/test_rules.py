@@ -0,0 +1,102 @@
+"""Rule registration safety checks and the Watchdog time budgets"""
+
+import re
+import signal
+import unittest
+
+from riggerhire.findings import WARNING, FindingTable
+from riggerhire.kotlin import LazyPattern
+from riggerhire.rules import KOTLIN_RULES, Rule, UnsafePatternError, Watchdog, check_pattern_safety, kotlin_rule
+
+
+def spin(*args):
+    while True:
+        pass
+
+
+def backtrack(*args):
+    re.match(r'(a+)+$', "a" * 64 + "b")
+
+
+class PatternSafetyTest(unittest.TestCase):
+    def test_nested_unbounded_quantifiers_rejected(self):
+        for pattern in (r'(a+)+', r'(\s*\w+)*', r'(?:x|(y+))*z', re.compile(rb'(a*)+'), LazyPattern(r'((ab)*c)+')):
+            with self.subTest(pattern=getattr(pattern, "pattern", pattern)):
+                with self.assertRaises(UnsafePatternError):
+                    check_pattern_safety("test", pattern)
+
+    def test_bounded_or_flat_patterns_accepted(self):
+        for pattern in (r'\w+\s*=\s*\w+', r'(a{1,3})+', r'(a+)?b', LazyPattern(r'fun\s+(\w+)', re.M)):
+            with self.subTest(pattern=getattr(pattern, "pattern", pattern)):
+                check_pattern_safety("test", pattern)
+
+    def test_registration_rejects_unsafe_pattern(self):
+        before = list(KOTLIN_RULES)
+
+        with self.assertRaises(UnsafePatternError) as raised:
+            kotlin_rule("test-unsafe", r'\w+', r'(\w+\s*)+;')(lambda checker, file_path, content: None)
+
+        self.assertIn("test-unsafe", str(raised.exception))
+        self.assertEqual(KOTLIN_RULES, before)
+
+
+@unittest.skipUnless(hasattr(signal, "setitimer"), "needs SIGALRM interval timers")
+class WatchdogTest(unittest.TestCase):
+    def setUp(self):
+        self.timeouts = []
+        self.ran = []
+
+    def on_timeout(self, rule, elapsed, file_budget_exhausted):
+        self.timeouts.append((rule.rule_id, file_budget_exhausted))
+
+    def rule(self, rule_id, check=None):
+        def record(*args):
+            self.ran.append(rule_id)
+            if check:
+                check(*args)
+        return Rule(rule_id, record)
+
+    def test_slow_rule_aborted_and_reported(self):
+        for check in (spin, backtrack):
+            with self.subTest(check=check.__name__):
+                self.timeouts, self.ran = [], []
+                rules = [self.rule("slow", check), self.rule("fast")]
+
+                Watchdog(rule_budget=0.05, file_budget=5.0).run_file(rules, self.on_timeout)
+
+                self.assertEqual(self.timeouts, [("slow", False)])
+                self.assertEqual(self.ran, ["slow", "fast"])
+
+    def test_file_budget_skips_remaining_rules(self):
+        rules = [self.rule("slow", spin), self.rule("fast"), self.rule("faster")]
+
+        Watchdog(rule_budget=5.0, file_budget=0.05).run_file(rules, self.on_timeout)
+
+        self.assertEqual(self.timeouts, [("slow", True)])
+        self.assertEqual(self.ran, ["slow"])
+
+    def test_previous_handler_restored(self):
+        previous = signal.getsignal(signal.SIGALRM)
+
+        Watchdog(rule_budget=0.05).run_file([self.rule("slow", spin), self.rule("fast")], self.on_timeout)
+
+        self.assertIs(signal.getsignal(signal.SIGALRM), previous)
+
+    def test_staged_findings_stay_aligned_when_aborted(self):
+        table = FindingTable()
+
+        def flood(*args):
+            while True:
+                table.add(WARNING, "finding", file="Flood.kt", rule="flood", line=1)
+
+        table.stage()
+        Watchdog(rule_budget=0.05).run_file([Rule("flood", flood)], self.on_timeout)
+        table.commit()
+
+        columns = (table.severity, table.file, table.rule, table.template, table.argument, table.line, table.column)
+        self.assertGreater(len(table), 0)
+        self.assertEqual({len(column) for column in columns}, {len(table)})
+
+
+if __name__ == "__main__":
+    unittest.main()
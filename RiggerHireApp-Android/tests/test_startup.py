@@ -0,0 +1,73 @@
+"""CLI start-up: what each command imports, and its overhead over a bare interpreter
+
+The import checks are exact and catch an eager import the moment it is
+added. The wall-clock check uses the bench budget with headroom, since
+shared CI runners are too noisy for a hard 30 ms gate.
+"""
+
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+
+from riggerhire import bench
+from riggerhire.cli import COMMANDS
+
+APP_ROOT = Path(__file__).resolve().parent.parent
+HOOK_FILE = "app/src/main/java/com/tiation/riggerhire/ui/MainActivity.kt"
+HEADROOM = 2.0
+
+# Loaded by verify only when the check that needs them runs
+VERIFY_DEFERRED = {"riggerhire.baselineprofile", "riggerhire.resources", "riggerhire.logging_lint",
+                   "riggerhire.mainthread", "sqlite3", "json"}
+
+PROBE = """
+import sys
+from riggerhire.cli import main
+try:
+    main(sys.argv[1:])
+except SystemExit:
+    pass
+print("MODULES", " ".join(sys.modules))
+"""
+
+
+def imported_modules(*argv):
+    result = subprocess.run([sys.executable, "-c", PROBE, *argv], cwd=APP_ROOT, env=bench._env(),
+                            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+    line = result.stdout.rsplit("MODULES ", 1)[-1]
+    return set(line.split())
+
+
+class StartupImportsTest(unittest.TestCase):
+    def test_help_imports_only_its_own_command(self):
+        for name, (module, _) in COMMANDS.items():
+            with self.subTest(command=name):
+                others = {other for other, _ in COMMANDS.values()} - {module}
+                self.assertEqual(imported_modules(name, "--help") & others, set())
+
+    def test_verify_help_defers_checkers(self):
+        self.assertEqual(imported_modules("verify", "--help") & VERIFY_DEFERRED, set())
+
+    def test_hook_path_loads_only_the_kotlin_rules(self):
+        modules = imported_modules("verify", HOOK_FILE)
+
+        self.assertIn("riggerhire.logging_lint", modules)
+        self.assertIn("riggerhire.mainthread", modules)
+        self.assertEqual(modules & (VERIFY_DEFERRED - {"riggerhire.logging_lint", "riggerhire.mainthread"}),
+                         set())
+
+
+class StartupTimeTest(unittest.TestCase):
+    def test_overhead_within_budget(self):
+        env = bench._env()
+        budget = bench.DEFAULT_BUDGET_MS * HEADROOM
+        for argv in (["verify", "--help"], ["verify", HOOK_FILE]):
+            with self.subTest(invocation=" ".join(argv)):
+                baseline, total = bench.best_wall_ms(
+                    [[sys.executable, "-c", "pass"], [sys.executable, "-m", "riggerhire", *argv]], 10, env)
+                self.assertLessEqual(total - baseline, budget)
+
+
+if __name__ == "__main__":
+    unittest.main()